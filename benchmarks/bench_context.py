@@ -0,0 +1,102 @@
+"""Benchmark PlotContext enter/exit cost.
+
+Compares the diff-based snapshots used by PlotContext with capturing and
+restoring every rcParam, for a growing number of overrides. Cost should
+track the number of keys that change, not the size of rcParams.
+
+Usage:
+    python benchmarks/bench_context.py [-o results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib as mpl  # noqa: E402
+
+from pureplot.context import PlotContext  # noqa: E402
+from pureplot.policy import (  # noqa: E402
+    PolicySnapshot,
+    apply_policy,
+    apply_policy_diff,
+    get_default_style,
+    restore_policy,
+)
+
+NUMBER = 2_000
+
+
+def full_snapshot_cycle(overrides: dict) -> None:
+    """Enter/exit the way PlotContext worked before diff snapshots."""
+    snapshot = PolicySnapshot.capture()
+    defaults = get_default_style()
+    defaults.update(overrides)
+    mpl.rcParams.update(defaults)
+    mpl.rcParams.update(snapshot.rcparams)
+
+
+def context_cycle(overrides: dict) -> None:
+    with PlotContext(overrides, rcparams=True):
+        pass
+
+
+def overrides_of_size(n: int) -> dict:
+    sizes = [8 + i * 0.5 for i in range(n)]
+    keys = [k for k in mpl.rcParams if k.endswith(".labelsize")] + [
+        "font.size",
+        "lines.linewidth",
+        "axes.linewidth",
+        "grid.linewidth",
+    ]
+    return dict(zip(keys[:n], sizes))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    # Policy already applied, as after pureplot.configure()
+    apply_policy()
+
+    results = []
+    for n in (1, 2, 4, 8):
+        overrides = overrides_of_size(n)
+        snapshot = apply_policy_diff(overrides)
+        restore_policy(snapshot)
+        n_captured = len(snapshot.rcparams)
+        diff = timeit.timeit(lambda: context_cycle(overrides), number=NUMBER)
+        full = timeit.timeit(lambda: full_snapshot_cycle(overrides), number=NUMBER)
+        results.append(
+            {
+                "n_overrides": n,
+                "n_rcparams": len(mpl.rcParams),
+                "keys_captured": n_captured,
+                "diff_us": diff / NUMBER * 1e6,
+                "full_us": full / NUMBER * 1e6,
+            }
+        )
+        print(
+            f"overrides={n:2d} captured={n_captured:3d}/{len(mpl.rcParams)} "
+            f"diff={diff / NUMBER * 1e6:8.1f} us  full={full / NUMBER * 1e6:8.1f} us",
+            file=sys.stderr,
+        )
+
+    text = json.dumps({"results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""End-to-end and per-stage benchmarks for pureplot primitives.
+
+Runs offline with the Agg backend and writes machine-readable JSON that
+``compare.py`` can diff between commits.
+
+Usage:
+    python benchmarks/bench_primitives.py -o results.json
+    python benchmarks/bench_primitives.py --quick
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+import pureplot  # noqa: E402
+from pureplot import line, scatter  # noqa: E402
+from pureplot.instrument import instrument  # noqa: E402
+
+PRIMITIVES: dict[str, Callable[..., pureplot.PlotResult]] = {
+    "line": line,
+    "scatter": scatter,
+}
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+QUICK_SIZES = [100, 1_000, 10_000]
+FIGSIZES = [(4.0, 3.0), (8.0, 6.0)]
+FORMATS = ["png", "svg", "pdf"]
+
+# Vector output writes every point; larger inputs take minutes per file
+VECTOR_MAX_POINTS = 100_000
+
+
+def make_data(n: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0.0, 100.0, n)
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+
+def run_once(
+    primitive: Callable[..., pureplot.PlotResult],
+    x: np.ndarray,
+    y: np.ndarray,
+    figsize: tuple[float, float],
+    fmt: str,
+) -> tuple[float, dict[str, float], int]:
+    with instrument() as recorder:
+        start = time.perf_counter()
+        with primitive(
+            x,
+            y,
+            title="Benchmark",
+            xlabel="x",
+            ylabel="y",
+            figsize=figsize,
+            headless=True,
+        ) as result:
+            data = result.to_bytes(fmt)
+        total = time.perf_counter() - start
+    phases = {name: agg["total"] for name, agg in recorder.summary().items()}
+    return total, phases, len(data)
+
+
+def peak_memory(
+    primitive: Callable[..., pureplot.PlotResult],
+    x: np.ndarray,
+    y: np.ndarray,
+    figsize: tuple[float, float],
+    fmt: str,
+) -> int:
+    tracemalloc.start()
+    try:
+        with primitive(x, y, figsize=figsize, headless=True) as result:
+            result.to_bytes(fmt)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(
+    name: str, n: int, figsize: tuple[float, float], fmt: str, repeat: int
+) -> dict[str, Any]:
+    primitive = PRIMITIVES[name]
+    x, y = make_data(n)
+
+    # Warm-up: font cache, layout cache, first-call imports
+    run_once(primitive, x[:100], y[:100], figsize, fmt)
+
+    totals = []
+    phase_runs: list[dict[str, float]] = []
+    size = 0
+    for _ in range(repeat):
+        total, phases, size = run_once(primitive, x, y, figsize, fmt)
+        totals.append(total)
+        phase_runs.append(phases)
+
+    phases = {
+        stage: statistics.median(run.get(stage, 0.0) for run in phase_runs)
+        for stage in phase_runs[0]
+    }
+    return {
+        "primitive": name,
+        "n_points": n,
+        "figsize": list(figsize),
+        "format": fmt,
+        "repeat": repeat,
+        "total_s": {"min": min(totals), "median": statistics.median(totals)},
+        "phases_s": phases,
+        "peak_bytes": peak_memory(primitive, x, y, figsize, fmt),
+        "output_bytes": size,
+    }
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "pureplot": pureplot.__version__,
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "backend": matplotlib.get_backend(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write JSON results to this file")
+    parser.add_argument("--quick", action="store_true", help="small sizes only")
+    parser.add_argument("--sizes", type=int, nargs="+", help="input sizes")
+    parser.add_argument("--primitives", nargs="+", default=list(PRIMITIVES))
+    parser.add_argument("--formats", nargs="+", default=FORMATS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--vector-max",
+        type=int,
+        default=VECTOR_MAX_POINTS,
+        help="skip svg/pdf above this many points",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    results = []
+    for name in args.primitives:
+        for n in sizes:
+            for figsize in FIGSIZES:
+                for fmt in args.formats:
+                    if fmt != "png" and n > args.vector_max:
+                        continue
+                    case = bench_case(name, n, figsize, fmt, args.repeat)
+                    results.append(case)
+                    print(
+                        f"{name:8s} n={n:<9d} fig={figsize} {fmt:4s} "
+                        f"median={case['total_s']['median'] * 1e3:9.1f} ms "
+                        f"peak={case['peak_bytes'] / 2**20:8.1f} MiB",
+                        file=sys.stderr,
+                    )
+
+    report = {"environment": environment(), "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json --threshold 1.15
+
+Exits with status 1 if any case got slower (median total time) or used
+more peak memory than ``threshold`` times the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any
+
+Key = tuple[str, int, tuple[float, ...], str]
+
+
+def load(path: str) -> dict[Key, dict[str, Any]]:
+    with open(path) as fh:
+        report = json.load(fh)
+    return {
+        (r["primitive"], r["n_points"], tuple(r["figsize"]), r["format"]): r
+        for r in report["results"]
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.10)
+    args = parser.parse_args(argv)
+
+    base = load(args.baseline)
+    cand = load(args.candidate)
+
+    regressions = 0
+    for key in sorted(base.keys() & cand.keys()):
+        b, c = base[key], cand[key]
+        time_ratio = c["total_s"]["median"] / b["total_s"]["median"]
+        mem_ratio = c["peak_bytes"] / max(1, b["peak_bytes"])
+        flag = ""
+        if time_ratio > args.threshold or mem_ratio > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        name, n, figsize, fmt = key
+        print(
+            f"{name:8s} n={n:<9d} fig={figsize} {fmt:4s} "
+            f"time x{time_ratio:5.2f}  mem x{mem_ratio:5.2f}{flag}"
+        )
+
+    missing = base.keys() - cand.keys()
+    if missing:
+        print(f"{len(missing)} baseline case(s) missing from candidate")
+
+    print(f"{regressions} regression(s) above x{args.threshold:.2f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,76 @@
 """pureplot - Pure, opinionated matplotlib wrapper with Catppuccin aesthetics."""
 
-from .policy import get_catppuccin_colors, get_color_cycle, get_default_style
-from .primitives import PlotResult, line, scatter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .policy import (
+        get_catppuccin_colors,
+        get_color_cycle,
+        get_default_style,
+        get_style,
+    )
+    from .primitives import (
+        LiveLine,
+        Panel,
+        PlotResult,
+        animate,
+        heatmap,
+        histogram,
+        line,
+        render,
+        scatter,
+        subplot_grid,
+    )
 
 __version__ = "0.1.0"
 __all__ = [
     "scatter",
     "line",
+    "histogram",
+    "heatmap",
+    "subplot_grid",
+    "Panel",
+    "animate",
+    "render",
     "PlotResult",
+    "LiveLine",
     "get_catppuccin_colors",
     "get_color_cycle",
     "get_default_style",
+    "get_style",
 ]
+
+# matplotlib, numpy and catppuccin are only imported on first access to
+# a primitive or palette function, keeping `import pureplot` cheap.
+_LAZY_ATTRS = {
+    "scatter": ".primitives",
+    "line": ".primitives",
+    "histogram": ".primitives",
+    "heatmap": ".primitives",
+    "subplot_grid": ".primitives",
+    "Panel": ".primitives",
+    "animate": ".primitives",
+    "render": ".primitives",
+    "PlotResult": ".primitives",
+    "LiveLine": ".primitives",
+    "get_catppuccin_colors": ".policy",
+    "get_color_cycle": ".policy",
+    "get_default_style": ".policy",
+    "get_style": ".policy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
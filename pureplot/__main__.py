@@ -0,0 +1,99 @@
+"""Command line entry point: ``python -m pureplot serve|render``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import sys
+from pathlib import Path
+
+
+def _parse_option(text: str) -> tuple[str, object]:
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from .server import RenderServer
+
+    with RenderServer(
+        args.socket, workers=args.workers, options=dict(args.option)
+    ) as server:
+        print(f"pureplot: listening on {server.path}", file=sys.stderr, flush=True)
+        # Stop on SIGTERM as on Ctrl-C, removing the socket on the way out
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _render(args: argparse.Namespace) -> int:
+    from .client import RenderClient, load_specs
+
+    specs = list(load_specs(args.spec))
+    if args.output is not None and len(specs) != 1:
+        print("pureplot: --output needs a spec file with one spec", file=sys.stderr)
+        return 2
+
+    with RenderClient(args.socket) as client:
+        for index, spec in enumerate(specs):
+            reply = client.render_spec(spec)
+            if args.output == "-":
+                sys.stdout.buffer.write(reply.data)
+                sys.stdout.buffer.flush()
+                target = "<stdout>"
+            else:
+                name = spec.get("output") or args.output
+                if name is None:
+                    suffix = "" if len(specs) == 1 else f"-{index}"
+                    name = f"{Path(args.spec).stem}{suffix}.{reply.format}"
+                Path(name).write_bytes(reply.data)
+                target = name
+            print(
+                f"{target}: {len(reply.data)} bytes, "
+                f"render {reply.render_time * 1e3:.1f} ms, "
+                f"round trip {reply.latency * 1e3:.1f} ms",
+                file=sys.stderr,
+            )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pureplot")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run the render daemon")
+    serve.add_argument("--socket", help="socket path")
+    serve.add_argument("--workers", type=int, help="render threads")
+    serve.add_argument(
+        "--option",
+        type=_parse_option,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="policy option, e.g. flavor=latte or font.size=12 (repeatable)",
+    )
+    serve.set_defaults(run=_serve)
+
+    render = commands.add_parser("render", help="render specs through the daemon")
+    render.add_argument("spec", help="JSON or NDJSON spec file")
+    render.add_argument("--socket", help="socket path")
+    render.add_argument(
+        "-o", "--output", help="output file for a single spec, - for stdout"
+    )
+    render.set_defaults(run=_render)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Asyncio entry points that render off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from numpy.typing import ArrayLike
+
+from .fonts import warm_worker
+from .primitives import PlotResult
+from .primitives import line as _line
+from .primitives import render as _render
+from .primitives import scatter as _scatter
+
+
+class AsyncRenderer:
+    """Renders primitives on a bounded thread pool for asyncio callers.
+
+    Figure building and encoding run through :func:`pureplot.render` in
+    worker threads, with the caller's context-local policy (see
+    :class:`pureplot.context.PlotContext`). At most ``max_in_flight``
+    renders hold memory at once per event loop; further callers wait
+    (backpressure).
+    Cancelling a caller returns immediately; a render that already
+    started finishes in its thread and keeps its slot until then. Each
+    thread warms the policy fonts when it starts (see
+    :func:`pureplot.fonts.warm_worker`).
+
+    Args:
+        max_workers: Number of render threads.
+        max_in_flight: Maximum renders queued or running at once
+            (default: ``2 * max_workers``).
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, max_in_flight: int | None = None
+    ) -> None:
+        self._max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._max_in_flight = max_in_flight or 2 * self._max_workers
+        self._executor = ThreadPoolExecutor(
+            self._max_workers,
+            thread_name_prefix="pureplot-render",
+            initializer=warm_worker,
+        )
+        # asyncio primitives are bound to one event loop; a renderer can be
+        # shared by several (e.g. successive asyncio.run calls)
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def _loop_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """The in-flight limit of ``loop``, created on first use."""
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self._max_in_flight)
+        return slots
+
+    async def render(
+        self,
+        primitive: Callable[..., PlotResult],
+        *args: Any,
+        format: str = "png",
+        **kwargs: Any,
+    ) -> bytes:
+        """Render a primitive in a worker thread and return encoded bytes."""
+        loop = asyncio.get_running_loop()
+        slots = self._loop_slots(loop)
+        await slots.acquire()
+
+        def release(_: Future[bytes]) -> None:
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:  # event loop already closed
+                pass
+
+        try:
+            context = contextvars.copy_context()
+            future = self._executor.submit(
+                context.run, _render, primitive, *args, format=format, **kwargs
+            )
+        except BaseException:
+            slots.release()
+            raise
+
+        # The slot is freed when the thread is done, not when the caller
+        # stops waiting, so cancellation cannot exceed the memory cap
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def line(self, x: ArrayLike, y: ArrayLike, **kwargs: Any) -> bytes:
+        """Async :func:`pureplot.line`, returning encoded bytes."""
+        return await self.render(_line, x, y, **kwargs)
+
+    async def scatter(self, x: ArrayLike, y: ArrayLike, **kwargs: Any) -> bytes:
+        """Async :func:`pureplot.scatter`, returning encoded bytes."""
+        return await self.render(_scatter, x, y, **kwargs)
+
+    def close(self) -> None:
+        """Shut down the render threads."""
+        self._executor.shutdown(wait=True)
+
+
+_DEFAULT: AsyncRenderer | None = None
+
+
+def get_renderer() -> AsyncRenderer:
+    """Get the shared renderer used by the module-level functions."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = AsyncRenderer()
+    return _DEFAULT
+
+
+async def render(
+    primitive: Callable[..., PlotResult],
+    *args: Any,
+    format: str = "png",
+    **kwargs: Any,
+) -> bytes:
+    """Async :func:`pureplot.render` on the shared renderer."""
+    return await get_renderer().render(primitive, *args, format=format, **kwargs)
+
+
+async def line(x: ArrayLike, y: ArrayLike, **kwargs: Any) -> bytes:
+    """Async :func:`pureplot.line`, returning encoded bytes."""
+    return await get_renderer().line(x, y, **kwargs)
+
+
+async def scatter(x: ArrayLike, y: ArrayLike, **kwargs: Any) -> bytes:
+    """Async :func:`pureplot.scatter`, returning encoded bytes."""
+    return await get_renderer().scatter(x, y, **kwargs)
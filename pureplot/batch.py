@@ -0,0 +1,244 @@
+"""Parallel batch rendering on a pool of warm worker processes."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .policy import get_policy_options, get_style_registry
+
+# Arrays at least this large are handed to workers through shared memory
+SHARED_MEMORY_THRESHOLD = 1 << 16
+
+_ATTACH_KWARGS: dict[str, Any] = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+@dataclass(frozen=True)
+class PlotSpec:
+    """Description of one chart to render.
+
+    Attributes:
+        primitive: Primitive name, e.g. ``"line"`` or ``"scatter"``.
+        x: X data.
+        y: Y data.
+        kwargs: Keyword arguments for the primitive.
+        format: Output format passed to ``Figure.savefig``.
+    """
+
+    primitive: str
+    x: ArrayLike
+    y: ArrayLike
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    format: str = "png"
+
+
+@dataclass(frozen=True)
+class _SharedArray:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _share(arr: np.ndarray) -> tuple[_SharedArray | np.ndarray, SharedMemory | None]:
+    if arr.nbytes < SHARED_MEMORY_THRESHOLD or arr.dtype.hasobject:
+        return arr, None
+    shm = SharedMemory(create=True, size=arr.nbytes)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return _SharedArray(shm.name, arr.shape, arr.dtype.str), shm
+
+
+def _pack(spec: PlotSpec) -> tuple[tuple[Any, ...], list[SharedMemory]]:
+    refs = []
+    blocks = []
+    for data in (spec.x, spec.y):
+        ref, shm = _share(np.asarray(data))
+        refs.append(ref)
+        if shm is not None:
+            blocks.append(shm)
+    payload = (spec.primitive, spec.format, refs[0], refs[1], dict(spec.kwargs))
+    return payload, blocks
+
+
+def _release(blocks: list[SharedMemory]) -> None:
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+
+# ---- worker side ----
+
+
+def _init_worker(options: dict[str, Any]) -> None:
+    """Import matplotlib, apply the parent's policy and warm the renderer."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from .fonts import register_fonts
+    from .policy import apply_policy
+    from .primitives import line, render
+
+    register_fonts()
+    get_style_registry().set_options(options)
+    apply_policy(options)
+    render(line, [0, 1], [0, 1], title="warm-up", xlabel="x", ylabel="y")
+
+
+def _render_payload(payload: tuple[Any, ...]) -> bytes:
+    from .primitives import render
+    from .primitives.registry import get_primitive
+
+    name, fmt, x_ref, y_ref, kwargs = payload
+    attached = []
+    arrays = []
+    for ref in (x_ref, y_ref):
+        if isinstance(ref, _SharedArray):
+            shm = SharedMemory(name=ref.name, **_ATTACH_KWARGS)
+            attached.append(shm)
+            ref = np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=shm.buf)
+        arrays.append(ref)
+
+    try:
+        return render(get_primitive(name), *arrays, format=fmt, **kwargs)
+    finally:
+        # Artists keep their own copies, so the views can go before closing
+        del arrays, ref
+        for shm in attached:
+            shm.close()
+
+
+# ---- parent side ----
+
+
+class BatchRenderer:
+    """Pool of warm worker processes that render plot specs.
+
+    Workers import matplotlib, register the configured fonts (see
+    :func:`pureplot.fonts.register_fonts`), apply the configured policy and
+    render a warm-up chart once at startup. Large arrays reach them through shared
+    memory instead of pickled copies. Use as a context manager, or call
+    :meth:`close` when done.
+
+    Args:
+        workers: Number of worker processes (default: CPU count).
+        options: Policy options for the workers; defaults to the options
+            configured in this process plus any active PlotContext.
+        mp_context: Optional multiprocessing context.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        options: Mapping[str, Any] | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        self._workers = workers or os.cpu_count() or 1
+        if options is None:
+            options = get_policy_options()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(dict(options),),
+        )
+
+    def iter_render(
+        self, specs: Iterable[PlotSpec], *, ordered: bool = True
+    ) -> Iterator[tuple[int, bytes]]:
+        """Render specs, yielding ``(index, data)`` pairs as they finish.
+
+        At most two specs per worker are in flight at once, which bounds
+        the shared memory held for pending inputs.
+
+        Args:
+            specs: Plot specs to render.
+            ordered: Yield in input order (default) or in completion order.
+
+        Yields:
+            Tuples of (spec index, encoded image bytes).
+        """
+        window = 2 * self._workers
+        todo = enumerate(specs)
+        pending: dict[Future[bytes], tuple[int, list[SharedMemory]]] = {}
+        finished: dict[int, bytes] = {}
+        next_index = 0
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    item = next(todo, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, spec = item
+                    payload, blocks = _pack(spec)
+                    future = self._executor.submit(_render_payload, payload)
+                    pending[future] = (index, blocks)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, blocks = pending.pop(future)
+                    _release(blocks)
+                    data = future.result()
+                    if not ordered:
+                        yield index, data
+                    else:
+                        finished[index] = data
+
+                while next_index in finished:
+                    yield next_index, finished.pop(next_index)
+                    next_index += 1
+        finally:
+            for future, (_, blocks) in pending.items():
+                future.cancel()
+                wait([future])
+                _release(blocks)
+
+    def render(self, specs: Iterable[PlotSpec]) -> list[bytes]:
+        """Render specs and return the encoded images in input order."""
+        return [data for _, data in self.iter_render(specs)]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> BatchRenderer:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+
+def render_batch(
+    specs: Iterable[PlotSpec],
+    *,
+    workers: int | None = None,
+    options: Mapping[str, Any] | None = None,
+) -> list[bytes]:
+    """Render specs on a temporary pool of warm workers.
+
+    Args:
+        specs: Plot specs to render.
+        workers: Number of worker processes (default: CPU count).
+        options: Policy options for the workers.
+
+    Returns:
+        Encoded images in input order.
+    """
+    with BatchRenderer(workers, options=options) as renderer:
+        return renderer.render(specs)
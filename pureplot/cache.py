@@ -0,0 +1,315 @@
+"""Content-addressed cache of encoded renders."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .policy import Style, get_style
+from .primitives import PlotResult, render
+from .primitives.grouping import column
+from .primitives.utils import ingest_xy
+
+# Bytes fed to the hash per update; keeps temporaries small for
+# non-contiguous inputs
+HASH_CHUNK_BYTES = 1 << 22
+
+
+@dataclass
+class CacheStats:
+    """Render cache statistics."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    memory_bytes: int = 0
+    disk_bytes: int = 0
+
+
+# Array kinds whose buffers hold pointers rather than values (object
+# arrays, numpy 2 variable-width strings)
+_POINTER_KINDS = frozenset("OT")
+
+
+def _hash_array(h: Any, arr: np.ndarray) -> None:
+    h.update(f"{arr.dtype.str}{arr.shape}".encode())
+    flat = arr.reshape(-1) if arr.flags.c_contiguous else arr.ravel(order="K")
+    if arr.dtype.kind in _POINTER_KINDS:
+        for item in flat.tolist():
+            _hash_value(h, item)
+        return
+    step = max(1, HASH_CHUNK_BYTES // max(1, flat.itemsize))
+    for start in range(0, flat.size, step):
+        chunk = np.ascontiguousarray(flat[start : start + step])
+        h.update(memoryview(chunk).cast("B"))
+
+
+def _hash_bytes(h: Any, tag: bytes, data: bytes) -> None:
+    # Length-prefixed so adjacent values cannot run into each other
+    h.update(tag + len(data).to_bytes(8, "little") + data)
+
+
+def _hash_value(h: Any, value: Any) -> None:
+    """Hash a keyword argument by value.
+
+    Raises:
+        TypeError: For values without a stable by-value encoding.
+    """
+    if value is None:
+        h.update(b"none")
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(b"true" if value else b"false")
+    elif isinstance(value, (int, np.integer)):
+        _hash_bytes(h, b"int", str(int(value)).encode())
+    elif isinstance(value, (float, np.floating)):
+        _hash_bytes(h, b"float", float(value).hex().encode())
+    elif isinstance(value, str):
+        _hash_bytes(h, b"str", value.encode())
+    elif isinstance(value, bytes):
+        _hash_bytes(h, b"bytes", value)
+    elif isinstance(value, np.ndarray):
+        h.update(b"ndarray")
+        _hash_array(h, value)
+    elif isinstance(value, dict):
+        h.update(b"dict" + len(value).to_bytes(8, "little"))
+        for key in sorted(value, key=str):
+            _hash_value(h, key)
+            _hash_value(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(type(value).__name__.encode() + len(value).to_bytes(8, "little"))
+        for item in value:
+            _hash_value(h, item)
+    else:
+        raise TypeError(
+            f"cannot build a render cache key from {type(value).__name__} values"
+        )
+
+
+def _entry_path(directory: Path, key: str) -> Path:
+    return directory / key[:2] / key[2:]
+
+
+@lru_cache(maxsize=1)
+def _versions() -> bytes:
+    """Library versions; a render from an older install is not reused."""
+    import matplotlib
+    import PIL
+
+    from . import __version__
+
+    return f"{__version__}:{matplotlib.__version__}:{PIL.__version__}".encode()
+
+
+@lru_cache(maxsize=64)
+def _policy_token(style: Style) -> bytes:
+    """Stable (cross-process) fingerprint of a compiled style."""
+    return hashlib.blake2b(repr((style.flavor, style.settings)).encode()).digest()
+
+
+def render_key(
+    primitive: Callable[..., PlotResult],
+    x: ArrayLike,
+    y: ArrayLike,
+    format: str,
+    kwargs: dict[str, Any],
+) -> str:
+    """Content hash of a render request under the active policy.
+
+    Covers the primitive, output format, the x/y buffers as validated by
+    the primitives (columns of ``data`` when given by name), the keyword
+    arguments, the active style and the pureplot, matplotlib and Pillow
+    versions, so a change made through ``configure()`` or a
+    ``PlotContext``, or an upgrade, yields a different key. Object and
+    string arrays are hashed by value.
+
+    Returns:
+        Hex digest.
+
+    Raises:
+        TypeError: If a keyword argument has no stable by-value encoding
+            (e.g. a colormap object; pass its name instead).
+    """
+    if kwargs.get("data") is not None:
+        # Key on the referenced columns, not on the table object
+        data = kwargs["data"]
+        x, y = column(data, x)[0], column(data, y)[0]
+        kwargs = {key: value for key, value in kwargs.items() if key != "data"}
+        if "hue" in kwargs:
+            kwargs["hue"] = np.asarray(column(data, kwargs["hue"])[0])
+    x_arr, y_arr, _ = ingest_xy(x, y, allow_2d=True)
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{primitive.__module__}.{primitive.__qualname__}:{format}".encode())
+    h.update(_versions())
+    h.update(_policy_token(get_style()))
+    _hash_array(h, x_arr)
+    _hash_array(h, y_arr)
+    _hash_value(h, kwargs)
+    return h.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of encoded renders, in memory and on disk.
+
+    Args:
+        max_bytes: Memory budget for cached images.
+        directory: Optional directory for a persistent second tier.
+        max_disk_bytes: Disk budget; least recently used files go first.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 << 20,
+        *,
+        directory: str | os.PathLike[str] | None = None,
+        max_disk_bytes: int = 1 << 30,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._stats.disk_bytes = sum(
+                p.stat().st_size for p in self._directory.glob("*/*")
+            )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Copy of the current statistics."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def render(
+        self,
+        primitive: Callable[..., PlotResult],
+        x: ArrayLike,
+        y: ArrayLike,
+        *,
+        format: str = "png",
+        **kwargs: Any,
+    ) -> bytes:
+        """Return cached bytes for this request, rendering on a miss.
+
+        Args:
+            primitive: Plotting primitive, e.g. ``line`` or ``scatter``.
+            x: X data.
+            y: Y data.
+            format: Output format passed to ``Figure.savefig``.
+            **kwargs: Keyword arguments for the primitive.
+
+        Returns:
+            Encoded image bytes.
+        """
+        key = render_key(primitive, x, y, format, kwargs)
+        data = self.get(key)
+        if data is None:
+            data = render(primitive, x, y, format=format, **kwargs)
+            self.put(key, data)
+        return data
+
+    def get(self, key: str) -> bytes | None:
+        """Look up a key in memory, then on disk."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._stats.hits += 1
+                return data
+
+        data = self._disk_get(key)
+        with self._lock:
+            if data is None:
+                self._stats.misses += 1
+                return None
+            self._stats.disk_hits += 1
+            self._memory_put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store encoded bytes under a key."""
+        with self._lock:
+            self._memory_put(key, data)
+        self._disk_put(key, data)
+
+    def clear(self) -> None:
+        """Drop all entries (memory and disk) and reset statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._stats = CacheStats()
+            if self._directory is not None:
+                for path in self._directory.glob("*/*"):
+                    path.unlink(missing_ok=True)
+
+    # ---- memory tier (caller holds the lock) ----
+
+    def _memory_put(self, key: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._stats.memory_bytes -= len(old)
+        self._memory[key] = data
+        self._stats.memory_bytes += len(data)
+        while self._stats.memory_bytes > self._max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._stats.memory_bytes -= len(evicted)
+            self._stats.evictions += 1
+
+    # ---- disk tier ----
+
+    def _disk_get(self, key: str) -> bytes | None:
+        if self._directory is None:
+            return None
+        path = _entry_path(self._directory, key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # mark as recently used
+        return data
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if self._directory is None or len(data) > self._max_disk_bytes:
+            return
+        path = _entry_path(self._directory, key)
+        if path.exists():
+            return
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._stats.disk_bytes += len(data)
+            if self._stats.disk_bytes > self._max_disk_bytes:
+                self._evict_disk(self._directory)
+
+    def _evict_disk(self, directory: Path) -> None:
+        entries = []
+        for path in directory.glob("*/*"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self._max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._stats.evictions += 1
+        self._stats.disk_bytes = total
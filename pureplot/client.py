@@ -0,0 +1,375 @@
+"""Client for the local render daemon, and its wire protocol.
+
+Every message is one JSON header line followed by the raw binary
+payloads it describes. A request::
+
+    {"primitive": "line", "format": "png", "kwargs": {"title": "Load"},
+     "arrays": [{"name": "x", "dtype": "<f8", "shape": [1000], "nbytes": 8000},
+                {"name": "y", "dtype": "<f4", "shape": [1000], "nbytes": 4000}]}
+    <8000 bytes of x><4000 bytes of y>
+
+Arrays named ``x`` and ``y`` are the data of ``line`` and ``scatter``;
+``histogram`` takes one array named ``data`` and ``heatmap`` one 2-D
+``data`` array (precomputed histograms and pyramids cannot be sent). Any
+other name is passed to the primitive as a keyword argument. ``x``, ``y``
+and keyword values may also be given inline in the header. The reply::
+
+    {"ok": true, "format": "png", "size": 51234, "render_time": 0.0123}
+    <51234 bytes>
+
+or ``{"ok": false, "error": "..."}`` without payload. A connection carries
+any number of requests, answered in order. ``{"op": "stats"}`` returns the
+daemon's latency statistics instead of an image.
+
+This module only needs numpy, so short-lived clients never import
+matplotlib.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import socket
+import tempfile
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+SOCKET_ENV = "PUREPLOT_SOCKET"
+
+# Largest accepted header line; inline data belongs in binary payloads
+MAX_HEADER_BYTES = 1 << 26
+
+# Default limit on the payload bytes of one request
+MAX_PAYLOAD_BYTES = 1 << 31
+
+Payload = bytes | bytearray | memoryview
+
+
+@dataclass(frozen=True)
+class RenderReply:
+    """Encoded image returned by the daemon.
+
+    Attributes:
+        data: Encoded image bytes.
+        format: Output format.
+        render_time: Seconds the daemon spent rendering and encoding.
+        latency: Seconds from sending the request to receiving the image.
+    """
+
+    data: bytes
+    format: str
+    render_time: float
+    latency: float
+
+
+def default_socket_path() -> Path:
+    """Socket path from ``PUREPLOT_SOCKET``, else a per-user runtime path."""
+    if path := os.environ.get(SOCKET_ENV):
+        return Path(path)
+    if runtime := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime, "pureplot.sock")
+    return Path(tempfile.gettempdir(), f"pureplot-{os.getuid()}.sock")
+
+
+# ---- framing ----
+
+
+def write_message(
+    sock: socket.socket, header: Mapping[str, Any], payloads: Iterable[Payload] = ()
+) -> None:
+    """Send a header line followed by raw payloads."""
+    sock.sendall(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+    for payload in payloads:
+        sock.sendall(payload)
+
+
+def read_header(fh: BinaryIO) -> dict[str, Any] | None:
+    """Read one header line; None at end of stream."""
+    line = fh.readline(MAX_HEADER_BYTES + 1)
+    if not line:
+        return None
+    if len(line) > MAX_HEADER_BYTES or not line.endswith(b"\n"):
+        raise ValueError("message header is too long or truncated")
+    header = json.loads(line)
+    if not isinstance(header, dict):
+        raise ValueError("message header must be a JSON object")
+    return header
+
+
+def payload_sizes(
+    header: Mapping[str, Any], max_bytes: int = MAX_PAYLOAD_BYTES
+) -> list[int]:
+    """Validate a header's array descriptions before reading any payload.
+
+    A missing or inconsistent size would desynchronize the stream, and
+    an oversized one would be allocated before it is read, so every
+    description must match its own shape and dtype and the total must
+    stay within ``max_bytes``.
+
+    Returns:
+        Payload size of each array, in order.
+    """
+    arrays = header.get("arrays", [])
+    if not isinstance(arrays, list):
+        raise ValueError("arrays must be a list of array descriptions")
+    sizes = []
+    total = 0
+    for meta in arrays:
+        if not isinstance(meta, dict) or not isinstance(meta.get("name"), str):
+            raise ValueError(f"invalid array description {meta!r}")
+        name, dtype, shape, nbytes = (
+            meta["name"],
+            meta.get("dtype"),
+            meta.get("shape"),
+            meta.get("nbytes"),
+        )
+        if not (
+            isinstance(dtype, str)
+            and isinstance(shape, list)
+            and all(type(n) is int and n >= 0 for n in shape)
+            and type(nbytes) is int
+        ):
+            raise ValueError(f"array {name!r} needs a dtype, shape and nbytes")
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            raise ValueError(f"array {name!r} has invalid dtype {dtype!r}") from None
+        if dtype.kind not in "biuf":
+            raise ValueError(f"array {name!r} has unsupported dtype {dtype}")
+        expected = math.prod(shape) * dtype.itemsize
+        if nbytes != expected:
+            raise ValueError(
+                f"array {name!r} has nbytes {nbytes}, expected {expected} "
+                f"for shape {shape} and dtype {dtype}"
+            )
+        total += nbytes
+        if total > max_bytes:
+            raise ValueError(f"payloads exceed the limit of {max_bytes} bytes")
+        sizes.append(nbytes)
+    return sizes
+
+
+def read_payload(fh: BinaryIO, nbytes: int) -> bytearray:
+    """Read exactly ``nbytes`` into a new buffer."""
+    buffer = bytearray(nbytes)
+    view = memoryview(buffer)
+    filled = 0
+    while filled < nbytes:
+        n = fh.readinto(view[filled:])
+        if not n:
+            raise ValueError(f"stream ended {nbytes - filled} bytes short")
+        filled += n
+    return buffer
+
+
+# ---- requests ----
+
+
+def _binary(value: Any) -> np.ndarray | None:
+    """Numeric array data that can travel as raw bytes, else None."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        arr = np.asarray(value)
+        if arr.dtype.kind in "biuf" and arr.ndim:
+            return np.ascontiguousarray(arr)
+    return None
+
+
+def _jsonable(value: Any) -> Any:
+    return value.tolist() if isinstance(value, np.ndarray) else value
+
+
+def encode_request(
+    primitive: str,
+    x: Any = None,
+    y: Any = None,
+    *,
+    format: str = "png",
+    **kwargs: Any,
+) -> tuple[dict[str, Any], list[memoryview]]:
+    """Build a render request; numeric arrays become binary payloads.
+
+    Returns:
+        Tuple of (header, payloads).
+    """
+    header: dict[str, Any] = {"primitive": primitive, "format": format}
+    header_kwargs: dict[str, Any] = {}
+    arrays = []
+    payloads = []
+    data = {name: value for name, value in (("x", x), ("y", y)) if value is not None}
+    for name, value in {**data, **kwargs}.items():
+        arr = _binary(value)
+        if arr is None:
+            (header if name in ("x", "y") else header_kwargs)[name] = _jsonable(value)
+            continue
+        arrays.append(
+            {
+                "name": name,
+                "dtype": arr.dtype.str,
+                "shape": list(arr.shape),
+                "nbytes": arr.nbytes,
+            }
+        )
+        payloads.append(memoryview(arr).cast("B"))
+    header["kwargs"] = header_kwargs
+    header["arrays"] = arrays
+    return header, payloads
+
+
+def decode_arrays(
+    header: Mapping[str, Any], payloads: Iterable[bytearray]
+) -> dict[str, Any]:
+    """Map array names to arrays viewing their payloads (no copy)."""
+    arrays = {}
+    for meta, payload in zip(header.get("arrays", ()), payloads):
+        dtype = np.dtype(meta["dtype"])
+        if dtype.kind not in "biuf":
+            raise ValueError(f"array {meta['name']!r} has unsupported dtype {dtype}")
+        arr = np.frombuffer(payload, dtype=dtype)
+        arrays[meta["name"]] = arr.reshape(meta["shape"])
+    return arrays
+
+
+# ---- client ----
+
+
+class RenderClient:
+    """Connection to a render daemon started with ``python -m pureplot serve``.
+
+    Args:
+        path: Socket path (default: :func:`default_socket_path`).
+        timeout: Socket timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> None:
+        self._path = Path(path) if path is not None else default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(os.fspath(self._path))
+        except OSError:
+            self._sock.close()
+            raise
+        self._reader = self._sock.makefile("rb")
+
+    def render(
+        self,
+        primitive: str,
+        x: Any = None,
+        y: Any = None,
+        *,
+        format: str = "png",
+        **kwargs: Any,
+    ) -> RenderReply:
+        """Render a registered primitive remotely.
+
+        ``line`` and ``scatter`` take ``x`` and ``y``; ``histogram`` and
+        ``heatmap`` take their array as ``data=`` instead.
+
+        Args:
+            primitive: Primitive name.
+            x: X data.
+            y: Y data.
+            format: Output format.
+            **kwargs: Keyword arguments for the primitive.
+
+        Returns:
+            RenderReply with the encoded image.
+        """
+        header, payloads = encode_request(primitive, x, y, format=format, **kwargs)
+        start = time.perf_counter()
+        write_message(self._sock, header, payloads)
+        reply = self._read_reply()
+        data = bytes(read_payload(self._reader, reply["size"]))
+        return RenderReply(
+            data=data,
+            format=reply["format"],
+            render_time=reply["render_time"],
+            latency=time.perf_counter() - start,
+        )
+
+    def render_spec(self, spec: Mapping[str, Any]) -> RenderReply:
+        """Render a spec dict (see :func:`load_specs`)."""
+        return self.render(
+            spec["primitive"],
+            spec.get("x"),
+            spec.get("y"),
+            format=spec.get("format", "png"),
+            **spec.get("kwargs", {}),
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Latency statistics of the daemon."""
+        write_message(self._sock, {"op": "stats"})
+        return self._read_reply()["stats"]
+
+    def _read_reply(self) -> dict[str, Any]:
+        reply = read_header(self._reader)
+        if reply is None:
+            raise ConnectionError("render daemon closed the connection")
+        if not reply.get("ok"):
+            raise RuntimeError(f"render daemon error: {reply.get('error')}")
+        return reply
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> RenderClient:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+
+def _resolve(value: Any, base: Path) -> Any:
+    """Load ``{"npy": path}`` references, memory-mapped."""
+    if isinstance(value, dict) and set(value) == {"npy"}:
+        return np.load(base / value["npy"], mmap_mode="r")
+    return value
+
+
+def load_specs(path: str | os.PathLike[str]) -> Iterator[dict[str, Any]]:
+    """Read render specs from a JSON or NDJSON file.
+
+    A spec has ``primitive``, ``x``, ``y`` and optional ``format``,
+    ``kwargs`` and ``output`` keys; ``histogram`` and ``heatmap`` specs
+    pass their array as ``kwargs["data"]`` instead of ``x`` and ``y``. The
+    file holds one spec object, a list of them, or one per line. Data
+    values may be inline lists or ``{"npy": "file.npy"}`` references,
+    resolved relative to the spec file and sent as raw binary.
+
+    Args:
+        path: Spec file.
+
+    Yields:
+        Spec dicts.
+    """
+    path = Path(path)
+    text = path.read_text()
+    try:
+        parsed = json.loads(text)
+        specs = parsed if isinstance(parsed, list) else [parsed]
+    except json.JSONDecodeError:
+        specs = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    for spec in specs:
+        spec = dict(spec)
+        for key in ("x", "y"):
+            spec[key] = _resolve(spec.get(key), path.parent)
+        spec["kwargs"] = {
+            k: _resolve(v, path.parent) for k, v in spec.get("kwargs", {}).items()
+        }
+        yield spec
@@ -1,6 +1,6 @@
 # pureplot/configure.py
 
-from .policy import apply_policy
+from .policy import apply_policy, get_style_registry
 
 _CONFIGURED = False
 
@@ -9,7 +9,9 @@ def configure(**options) -> None:
     """
     One-time global configuration.
 
-    Must be called before any plotting primitive.
+    Must be called before any plotting primitive. Options are rcParams
+    overrides; ``flavor`` selects the Catppuccin flavor. Compiled styles
+    are invalidated so primitives pick up the new options.
     """
     global _CONFIGURED
 
@@ -19,5 +21,6 @@ def configure(**options) -> None:
             "before any plots are created."
         )
 
+    get_style_registry().set_options(options)
     apply_policy(options)
     _CONFIGURED = True
@@ -1,31 +1,59 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
+from contextvars import Token
 
-from .policy import PolicySnapshot, apply_policy, restore_policy
+from .policy import (
+    Options,
+    PolicySnapshot,
+    apply_policy_diff,
+    get_policy_options,
+    pop_policy,
+    push_policy,
+    restore_policy,
+)
 
 
 class PlotContext(AbstractContextManager):
     """
-    Controlled mutation context for matplotlib global state.
+    Controlled mutation context for plotting policy.
 
     This is the ONLY place where mutation is allowed.
+
+    Overrides are applied to matplotlib's rcParams for the duration of
+    the block and restored on exit, so every setting (including ones the
+    primitives do not pass explicitly, such as ``lines.markersize``)
+    takes effect. They are also pushed onto a context-local policy that
+    primitives resolve their style from.
+
+    rcParams are process-global: threads and asyncio tasks rendering
+    with different overrides concurrently should pass
+    ``rcparams=False``. The context-local policy then still sets the
+    style the primitives read (colors, fonts, sizes, savefig options),
+    but matplotlib defaults outside the style are not changed.
     """
 
-    def __init__(self, overrides: dict):
+    def __init__(self, overrides: dict, *, rcparams: bool = True):
         self._overrides = overrides
+        self._rcparams = rcparams
+        self._token: Token[Options] | None = None
         self._previous_policy: PolicySnapshot | None = None
 
     def __enter__(self):
-        # Capture current global state
-        self._previous_policy = PolicySnapshot.capture()
+        self._token = push_policy(self._overrides)
 
-        # Apply overrides (rcParams, fonts, backend, etc.)
-        apply_policy(self._overrides)
+        if self._rcparams:
+            # Apply the configured options plus every enclosing context's
+            # overrides (rcParams, fonts, backend, etc.), capturing the
+            # previous values of only the keys that actually change
+            self._previous_policy = apply_policy_diff(get_policy_options())
 
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         # Restore previous state unconditionally
-        restore_policy(self._previous_policy)
+        if self._previous_policy is not None:
+            restore_policy(self._previous_policy)
+            self._previous_policy = None
+        pop_policy(self._token)
         return False
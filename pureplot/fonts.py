@@ -0,0 +1,218 @@
+"""Font registration, a persistent font list and text cache warm-up."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.font_manager import FontProperties
+
+from .policy import get_style
+
+# os.pathsep-separated font files or directories registered by default
+FONT_PATH_ENV = "PUREPLOT_FONT_PATH"
+
+FONT_SUFFIXES = frozenset({".ttf", ".otf", ".ttc", ".afm"})
+
+# Characters typically found in titles, labels and tick labels
+SAMPLE_TEXT = (
+    "0123456789.,-+−×eE% abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+_LOCK = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FontWarmInfo:
+    """Result of :func:`warm_fonts`.
+
+    Attributes:
+        family: Font family of the policy.
+        files: Font files the family resolved to.
+        sizes: Font sizes warmed, in points.
+        seconds: Time spent warming.
+    """
+
+    family: tuple[str, ...]
+    files: tuple[str, ...]
+    sizes: tuple[float, ...]
+    seconds: float
+
+
+def _font_files(paths: Iterable[str | os.PathLike[str]]) -> list[Path]:
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(
+                sorted(p for p in path.rglob("*") if p.suffix.lower() in FONT_SUFFIXES)
+            )
+        elif path.exists():
+            files.append(path)
+        else:
+            raise ValueError(f"font path {str(path)!r} does not exist")
+    return files
+
+
+def _env_paths() -> list[str]:
+    return [p for p in os.environ.get(FONT_PATH_ENV, "").split(os.pathsep) if p]
+
+
+def register_fonts(paths: Iterable[str | os.PathLike[str]] | None = None) -> list[str]:
+    """Make font files available to matplotlib by family name.
+
+    Files already known to the font manager (e.g. from a font list built
+    by :func:`build_font_cache`) are skipped without being parsed, so
+    calling this at every startup is cheap.
+
+    Args:
+        paths: Font files or directories searched recursively; defaults
+            to the entries of the ``PUREPLOT_FONT_PATH`` environment
+            variable.
+
+    Returns:
+        Family names of the newly registered fonts.
+    """
+    files = _font_files(_env_paths() if paths is None else paths)
+    families = []
+    with _LOCK:
+        manager = font_manager.fontManager
+        known = {entry.fname for entry in (*manager.ttflist, *manager.afmlist)}
+        for file in files:
+            fname = os.fsdecode(file.resolve())
+            if fname in known:
+                continue
+            manager.addfont(fname)
+            known.add(fname)
+            entries = (
+                manager.afmlist if file.suffix.lower() == ".afm" else manager.ttflist
+            )
+            families.append(entries[-1].name)
+    return families
+
+
+def font_cache_path() -> Path:
+    """Location of matplotlib's font list (under ``MPLCONFIGDIR``)."""
+    version = font_manager.FontManager.__version__
+    return Path(mpl.get_cachedir(), f"fontlist-v{version}.json")
+
+
+def build_font_cache(paths: Iterable[str | os.PathLike[str]] | None = None) -> Path:
+    """Write matplotlib's font list, including registered fonts.
+
+    Run this when building an image (with the ``MPLCONFIGDIR`` used at
+    runtime) so the first plot neither scans the system fonts nor parses
+    the registered font files.
+
+    Args:
+        paths: Fonts to register first; see :func:`register_fonts`.
+
+    Returns:
+        Path of the written font list.
+    """
+    register_fonts(paths)
+    path = font_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _LOCK:
+        font_manager.json_dump(font_manager.fontManager, path)
+    return path
+
+
+def _points(size: Any, base: float) -> float:
+    """Font size in points; named sizes ("small", ...) scale ``base``."""
+    if isinstance(size, str) and size in font_manager.font_scalings:
+        return base * font_manager.font_scalings[size]
+    return FontProperties(size=size).get_size_in_points()
+
+
+def _policy_sizes(style: Mapping[str, Any]) -> tuple[float, ...]:
+    """Sizes used for text by the primitives (see ``style_axes``)."""
+    base = _points(style["font.size"], mpl.rcParams["font.size"])
+    return tuple(
+        sorted(
+            {
+                _points(size, base)
+                for size in (
+                    base,
+                    base + 2,  # axes titles
+                    base + 4,  # grid titles
+                    style["xtick.labelsize"],
+                    style["ytick.labelsize"],
+                    style["legend.fontsize"],
+                )
+            }
+        )
+    )
+
+
+def warm_fonts(
+    style: Mapping[str, Any] | None = None, *, text: str = SAMPLE_TEXT
+) -> FontWarmInfo:
+    """Resolve, load and rasterize the policy fonts once.
+
+    Fills matplotlib's font lookup cache, its per-thread cache of loaded
+    font files, and FreeType's glyph state for every policy size at the
+    figure and savefig DPI, so the first plot does not pay for them. Font
+    objects are cached per thread: call this from the thread (or worker
+    process) that will render.
+
+    Args:
+        style: Style to warm; defaults to the active style.
+        text: Characters to lay out and rasterize.
+
+    Returns:
+        FontWarmInfo describing what was warmed.
+    """
+    start = time.perf_counter()
+    style = get_style() if style is None else style
+    family = style["font.family"]
+    family = (family,) if isinstance(family, str) else tuple(family)
+    sizes = _policy_sizes(style)
+
+    figure_dpi = style["figure.dpi"]
+    savefig_dpi = style["savefig.dpi"]
+    if savefig_dpi == "figure":
+        savefig_dpi = figure_dpi
+
+    files = set()
+    for dpi in {float(figure_dpi), float(savefig_dpi)}:
+        renderer = RendererAgg(1, 1, dpi)
+        gc = renderer.new_gc()
+        for size in sizes:
+            prop = FontProperties(family=family, size=size)
+            files.add(font_manager.findfont(prop))
+            renderer.get_text_width_height_descent(text, prop, ismath=False)
+            renderer.draw_text(gc, 0, 0, text, prop, 0)
+        gc.restore()
+
+    return FontWarmInfo(
+        family=family,
+        files=tuple(sorted(files)),
+        sizes=sizes,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def warm_worker() -> None:
+    """Warm the policy fonts in a new render thread, never raising.
+
+    Meant as the ``initializer`` of a render executor, e.g.
+    ``ThreadPoolExecutor(4, initializer=warm_worker)``. An exception in an
+    initializer breaks the whole executor, while a failed warm-up only
+    costs the first render its speed, so failures are logged as warnings
+    instead.
+    """
+    try:
+        warm_fonts()
+    except Exception:
+        logger.warning("font warm-up failed", exc_info=True)
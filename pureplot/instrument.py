@@ -0,0 +1,131 @@
+"""Opt-in per-stage timing of the plotting lifecycle."""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+StageHook = Callable[["StageTiming"], None]
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Timing of one lifecycle stage.
+
+    Attributes:
+        stage: Stage name (validate, figure, draw, style, layout, ...).
+        seconds: Wall time spent in the stage.
+        peak_bytes: Peak traced allocation during the stage, if traced.
+    """
+
+    stage: str
+    seconds: float
+    peak_bytes: int | None = None
+
+
+@dataclass
+class Recorder:
+    """Collects stage timings across every plot rendered while active.
+
+    Attributes:
+        trace_memory: Whether peak allocation is traced per stage.
+        timings: All recorded stage timings, in order.
+    """
+
+    trace_memory: bool = False
+    timings: list[StageTiming] = field(default_factory=list)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregate timings per stage (count, total, mean, max seconds)."""
+        out: dict[str, dict[str, float]] = {}
+        for t in self.timings:
+            agg = out.setdefault(t.stage, {"count": 0, "total": 0.0, "max": 0.0})
+            agg["count"] += 1
+            agg["total"] += t.seconds
+            agg["max"] = max(agg["max"], t.seconds)
+            if t.peak_bytes is not None:
+                agg["peak_bytes"] = max(agg.get("peak_bytes", 0), t.peak_bytes)
+        for agg in out.values():
+            agg["mean"] = agg["total"] / agg["count"]
+        return out
+
+
+_RECORDER: ContextVar[Recorder | None] = ContextVar("pureplot_recorder", default=None)
+_HOOKS: list[StageHook] = []
+
+
+def add_stage_hook(hook: StageHook) -> None:
+    """Register a callback invoked with every recorded StageTiming."""
+    _HOOKS.append(hook)
+
+
+def remove_stage_hook(hook: StageHook) -> None:
+    """Unregister a callback added with :func:`add_stage_hook`."""
+    _HOOKS.remove(hook)
+
+
+def is_active() -> bool:
+    """Whether any recorder or hook would receive stage timings."""
+    return _RECORDER.get() is not None or bool(_HOOKS)
+
+
+@contextmanager
+def instrument(*, trace_memory: bool = False) -> Iterator[Recorder]:
+    """Record stage timings for plots rendered inside the block.
+
+    While active, primitives also add a ``timings`` entry (stage name to
+    seconds) to ``PlotResult.metadata``.
+
+    Args:
+        trace_memory: Also record peak allocation per stage via
+            tracemalloc (noticeably slower).
+
+    Yields:
+        Recorder accumulating timings.
+    """
+    recorder = Recorder(trace_memory=trace_memory)
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    token = _RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _RECORDER.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def stage(name: str, timings: dict[str, float] | None = None) -> Iterator[None]:
+    """Time a lifecycle stage; a no-op unless instrumentation is active.
+
+    Args:
+        name: Stage name.
+        timings: Optional per-call dict the elapsed seconds are stored in.
+    """
+    recorder = _RECORDER.get()
+    if recorder is None and not _HOOKS:
+        yield
+        return
+
+    trace = recorder is not None and recorder.trace_memory and tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace else None
+        timing = StageTiming(name, seconds, peak)
+        if timings is not None:
+            timings[name] = seconds
+        if recorder is not None:
+            recorder.timings.append(timing)
+        for hook in _HOOKS:
+            hook(timing)
@@ -1,12 +1,15 @@
 """Policy module - pure functions for plot configuration."""
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
-from catppuccin import PALETTE
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import Colormap, LinearSegmentedColormap
 from matplotlib.figure import Figure
 
 # -----------------------------------------------------------------------------
@@ -14,104 +17,177 @@ from matplotlib.figure import Figure
 # -----------------------------------------------------------------------------
 
 
+# Reading through the underlying dict skips matplotlib's deprecation
+# lookups. Writes go through ``RcParams.__setitem__`` so validators and
+# side effects run, and the stored value is a fresh copy rather than an
+# object shared with a cached policy or a snapshot.
+_rc_get = dict.__getitem__
+
+
 @dataclass(frozen=True)
 class PolicySnapshot:
-    """Immutable snapshot of matplotlib rcParams."""
+    """Immutable snapshot of matplotlib rcParams.
+
+    May cover all rcParams or only the keys a policy change touched.
+    """
 
     rcparams: dict[str, Any]
 
     @staticmethod
-    def capture() -> "PolicySnapshot":
-        return PolicySnapshot(rcparams=dict(mpl.rcParams))
+    def capture(keys: Iterable[str] | None = None) -> "PolicySnapshot":
+        """Capture all rcParams, or only ``keys`` if given."""
+        if keys is None:
+            return PolicySnapshot(rcparams=dict(mpl.rcParams))
+        return PolicySnapshot(rcparams={k: _rc_get(mpl.rcParams, k) for k in keys})
 
 
 def restore_policy(snapshot: PolicySnapshot) -> None:
     """Restore matplotlib rcParams from a snapshot."""
-    mpl.rcParams.update(snapshot.rcparams)
+    for key, value in snapshot.rcparams.items():
+        mpl.rcParams[key] = value
 
 
 # -----------------------------------------------------------------------------
 # Color Policy
 # -----------------------------------------------------------------------------
 
+FLAVORS: tuple[str, ...] = ("latte", "frappe", "macchiato", "mocha")
+DEFAULT_FLAVOR = "latte"
+
+_COLOR_NAMES: tuple[str, ...] = (
+    "rosewater",
+    "flamingo",
+    "pink",
+    "mauve",
+    "red",
+    "maroon",
+    "peach",
+    "yellow",
+    "green",
+    "teal",
+    "sky",
+    "sapphire",
+    "blue",
+    "lavender",
+    "text",
+    "subtext1",
+    "subtext0",
+    "overlay2",
+    "overlay1",
+    "overlay0",
+    "surface2",
+    "surface1",
+    "surface0",
+    "base",
+    "mantle",
+    "crust",
+)
+
+_SEQUENTIAL_NAMES: tuple[str, ...] = (
+    "surface1",
+    "sapphire",
+    "blue",
+    "mauve",
+    "maroon",
+    "peach",
+)
+
+_CYCLE_NAMES: tuple[str, ...] = (
+    "mauve",
+    "blue",
+    "green",
+    "peach",
+    "pink",
+    "teal",
+    "yellow",
+    "red",
+    "sapphire",
+    "lavender",
+    "flamingo",
+    "sky",
+)
+
+
+def _check_flavor(flavor: str) -> str:
+    if flavor not in FLAVORS:
+        raise ValueError(
+            f"Unknown Catppuccin flavor {flavor!r}; expected one of {FLAVORS}"
+        )
+    return flavor
+
+
+@lru_cache(maxsize=None)
+def _compile_palette(flavor: str) -> tuple[tuple[str, str], ...]:
+    """Resolve a flavor's colors to hex values exactly once."""
+    from catppuccin import PALETTE
+
+    colors = getattr(PALETTE, _check_flavor(flavor)).colors
+    return tuple((name, getattr(colors, name).hex) for name in _COLOR_NAMES)
+
+
+@lru_cache(maxsize=None)
+def _compile_color_cycle(flavor: str) -> tuple[str, ...]:
+    palette = dict(_compile_palette(flavor))
+    return tuple(palette[name] for name in _CYCLE_NAMES)
+
+
+def get_catppuccin_colors(flavor: str = DEFAULT_FLAVOR) -> dict[str, str]:
+    """Get a Catppuccin color palette (Latte, light mode, by default).
 
-def get_catppuccin_colors() -> dict[str, str]:
-    """Get Catppuccin Latte color palette (light mode).
+    Args:
+        flavor: Catppuccin flavor (latte, frappe, macchiato or mocha).
 
     Returns:
         Dictionary mapping color names to hex values.
     """
-    latte = PALETTE.latte
-    return {
-        "rosewater": latte.colors.rosewater.hex,
-        "flamingo": latte.colors.flamingo.hex,
-        "pink": latte.colors.pink.hex,
-        "mauve": latte.colors.mauve.hex,
-        "red": latte.colors.red.hex,
-        "maroon": latte.colors.maroon.hex,
-        "peach": latte.colors.peach.hex,
-        "yellow": latte.colors.yellow.hex,
-        "green": latte.colors.green.hex,
-        "teal": latte.colors.teal.hex,
-        "sky": latte.colors.sky.hex,
-        "sapphire": latte.colors.sapphire.hex,
-        "blue": latte.colors.blue.hex,
-        "lavender": latte.colors.lavender.hex,
-        "text": latte.colors.text.hex,
-        "subtext1": latte.colors.subtext1.hex,
-        "subtext0": latte.colors.subtext0.hex,
-        "overlay2": latte.colors.overlay2.hex,
-        "overlay1": latte.colors.overlay1.hex,
-        "overlay0": latte.colors.overlay0.hex,
-        "surface2": latte.colors.surface2.hex,
-        "surface1": latte.colors.surface1.hex,
-        "surface0": latte.colors.surface0.hex,
-        "base": latte.colors.base.hex,
-        "mantle": latte.colors.mantle.hex,
-        "crust": latte.colors.crust.hex,
-    }
+    return dict(_compile_palette(flavor))
 
 
-def get_color_cycle(n_colors: int = 8) -> Sequence[str]:
+def get_color_cycle(n_colors: int = 8, flavor: str = DEFAULT_FLAVOR) -> Sequence[str]:
     """Get color cycle for multi-series plots.
 
     Args:
         n_colors: Number of colors to return (default: 8).
+        flavor: Catppuccin flavor the colors are taken from.
 
     Returns:
         List of hex color codes.
     """
-    colors = get_catppuccin_colors()
-    cycle = [
-        colors["mauve"],
-        colors["blue"],
-        colors["green"],
-        colors["peach"],
-        colors["pink"],
-        colors["teal"],
-        colors["yellow"],
-        colors["red"],
-        colors["sapphire"],
-        colors["lavender"],
-        colors["flamingo"],
-        colors["sky"],
-    ]
-    return cycle[:n_colors]
+    return list(_compile_color_cycle(flavor)[:n_colors])
 
 
-# -----------------------------------------------------------------------------
-# Style Policy
-# -----------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _compile_colormap(flavor: str) -> Colormap:
+    palette = dict(_compile_palette(flavor))
+    cmap = LinearSegmentedColormap.from_list(
+        f"catppuccin_{flavor}",
+        [palette[name] for name in _SEQUENTIAL_NAMES],
+    )
+    # Masked cells (e.g. empty density bins) let the axes show through
+    return cmap.with_extremes(bad=(0.0, 0.0, 0.0, 0.0))
 
 
-def get_default_style() -> dict[str, Any]:
-    """Get default matplotlib rcParams overrides.
+def get_sequential_colormap(flavor: str | None = None) -> Colormap:
+    """Get a sequential colormap derived from a Catppuccin flavor.
+
+    The lookup table is built once per flavor and shared; treat the
+    returned colormap as read-only.
+
+    Args:
+        flavor: Optional flavor; defaults to the active flavor.
 
     Returns:
-        Dictionary of matplotlib rcParams settings.
+        Matplotlib colormap running from a surface tone to peach.
     """
-    colors = get_catppuccin_colors()
+    return _compile_colormap(flavor or get_style().flavor)
 
+
+# -----------------------------------------------------------------------------
+# Style Policy
+# -----------------------------------------------------------------------------
+
+
+def _default_settings(colors: Mapping[str, str]) -> dict[str, Any]:
     return {
         # Figure
         "figure.facecolor": colors["base"],
@@ -155,18 +231,275 @@ def get_default_style() -> dict[str, Any]:
     }
 
 
+def _freeze(value: Any) -> Any:
+    """Convert list values to tuples so compiled styles stay hashable."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Style(Mapping[str, Any]):
+    """Immutable, hashable set of rcParams settings for one flavor.
+
+    Behaves like a read-only dict, so primitives can keep using
+    ``style["axes.facecolor"]`` lookups.
+
+    Attributes:
+        flavor: Catppuccin flavor the style was compiled from.
+        settings: Ordered (key, value) pairs of rcParams settings.
+        color_cycle: Series colors for this flavor.
+    """
+
+    flavor: str
+    settings: tuple[tuple[str, Any], ...]
+    color_cycle: tuple[str, ...]
+    _lookup: dict[str, Any] = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_lookup", dict(self.settings))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._lookup[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lookup)
+
+    def __len__(self) -> int:
+        return len(self._lookup)
+
+
+# Bound on distinct (flavor, overrides) styles kept per registry
+_MAX_STYLES = 256
+
+Options = tuple[tuple[str, Any], ...]
+
+
+def _freeze_options(options: Mapping[str, Any]) -> Options:
+    return tuple((k, _freeze(v)) for k, v in options.items())
+
+
+class StyleRegistry:
+    """Compiles each flavor into a :class:`Style` once and caches it.
+
+    Styles are keyed on flavor plus any context-local overrides (see
+    :class:`pureplot.context.PlotContext`). Compiled styles are only
+    invalidated when the configured options change (see
+    :func:`pureplot.configure.configure`).
+    """
+
+    def __init__(self) -> None:
+        self._flavor = DEFAULT_FLAVOR
+        self._options: Options = ()
+        self._styles: dict[tuple[str, Options], Style] = {}
+
+    @property
+    def flavor(self) -> str:
+        return self._flavor
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """Configured options, in the form accepted by ``set_options``."""
+        return {"flavor": self._flavor, **dict(self._options)}
+
+    def set_options(self, options: Mapping[str, Any]) -> None:
+        """Replace configured options, invalidating compiled styles."""
+        rc_options = dict(options)
+        flavor = _check_flavor(rc_options.pop("flavor", DEFAULT_FLAVOR))
+        frozen = _freeze_options(rc_options)
+        if flavor == self._flavor and frozen == self._options:
+            return
+        self._flavor = flavor
+        self._options = frozen
+        self._styles = {}
+
+    def get(self, flavor: str | None = None, overrides: Options = ()) -> Style:
+        """Get the compiled style for a flavor and context overrides.
+
+        Args:
+            flavor: Optional flavor; takes precedence over overrides and
+                the configured flavor.
+            overrides: Frozen context-local options (may include flavor).
+
+        Returns:
+            Cached, immutable Style.
+        """
+        rc_overrides = dict(overrides)
+        flavor = flavor or rc_overrides.pop("flavor", None) or self._flavor
+        rc_overrides.pop("flavor", None)
+        key = (flavor, _freeze_options(rc_overrides))
+
+        # Plain dict reads/writes are atomic, so threads may at worst
+        # compile the same style twice
+        styles = self._styles
+        try:
+            style = styles.get(key)
+        except TypeError:  # unhashable override value, e.g. a Cycler
+            return compile_style(flavor, {**dict(self._options), **rc_overrides})
+        if style is None:
+            style = compile_style(flavor, {**dict(self._options), **rc_overrides})
+            if len(styles) >= _MAX_STYLES:
+                styles.clear()
+            styles[key] = style
+        return style
+
+
+def compile_style(
+    flavor: str = DEFAULT_FLAVOR,
+    options: Mapping[str, Any] | None = None,
+) -> Style:
+    """Compile a flavor and optional rcParams overrides into a Style.
+
+    Args:
+        flavor: Catppuccin flavor to build the style from.
+        options: Optional dict of rcParams overrides.
+
+    Returns:
+        Immutable, hashable Style.
+    """
+    settings = _default_settings(dict(_compile_palette(flavor)))
+    if options:
+        settings.update(options)
+    return Style(
+        flavor=flavor,
+        settings=tuple((k, _freeze(v)) for k, v in settings.items()),
+        color_cycle=_compile_color_cycle(flavor),
+    )
+
+
+_REGISTRY = StyleRegistry()
+
+
+def get_style_registry() -> StyleRegistry:
+    """Get the process-wide style registry."""
+    return _REGISTRY
+
+
+# Context-local policy overrides; each thread / asyncio task sees its own
+_CONTEXT_OPTIONS: ContextVar[Options] = ContextVar("pureplot_policy", default=())
+
+
+def push_policy(options: Mapping[str, Any]) -> Token[Options]:
+    """Layer options over the current context's policy.
+
+    Only the calling thread or task sees the change; no global state is
+    mutated.
+
+    Args:
+        options: rcParams overrides, plus an optional ``flavor``.
+
+    Returns:
+        Token for :func:`pop_policy`.
+    """
+    if "flavor" in options:
+        _check_flavor(options["flavor"])
+    merged = {**dict(_CONTEXT_OPTIONS.get()), **options}
+    return _CONTEXT_OPTIONS.set(_freeze_options(merged))
+
+
+def pop_policy(token: Token[Options]) -> None:
+    """Undo a :func:`push_policy`."""
+    _CONTEXT_OPTIONS.reset(token)
+
+
+def get_policy_options() -> dict[str, Any]:
+    """Configured options merged with the current context's overrides."""
+    return {**_REGISTRY.options, **dict(_CONTEXT_OPTIONS.get())}
+
+
+def get_style(flavor: str | None = None) -> Style:
+    """Get the active compiled style.
+
+    Resolves the configured options plus any overrides pushed by an
+    enclosing :class:`pureplot.context.PlotContext` in this context.
+
+    Args:
+        flavor: Optional flavor; defaults to the active flavor.
+
+    Returns:
+        Cached, immutable Style.
+    """
+    return _REGISTRY.get(flavor, _CONTEXT_OPTIONS.get())
+
+
+def get_default_style(flavor: str = DEFAULT_FLAVOR) -> dict[str, Any]:
+    """Get default matplotlib rcParams overrides.
+
+    Args:
+        flavor: Catppuccin flavor the colors are taken from.
+
+    Returns:
+        Dictionary of matplotlib rcParams settings.
+    """
+    return _default_settings(dict(_compile_palette(flavor)))
+
+
+def _validate(key: str, value: Any) -> Any:
+    try:
+        validator = mpl.rcParams.validate[key]
+    except KeyError:
+        raise KeyError(f"{key} is not a valid rc parameter") from None
+    return validator(value)
+
+
+@lru_cache(maxsize=64)
+def _resolve_policy(
+    flavor: str, overrides: tuple[tuple[str, Any], ...]
+) -> tuple[tuple[str, Any], ...]:
+    settings = get_default_style(flavor)
+    settings.update(overrides)
+    return tuple((k, _validate(k, v)) for k, v in settings.items())
+
+
+def resolve_policy(options: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    """Resolve options into validated rcParams values (defaults + overrides).
+
+    Results are cached per (flavor, overrides), so repeated contexts with
+    the same overrides skip both style rebuilding and validation.
+
+    Args:
+        options: Optional dict of rcParams overrides, plus ``flavor``.
+
+    Returns:
+        Dictionary of validated rcParams settings.
+    """
+    rc_options = dict(options or {})
+    flavor = _check_flavor(rc_options.pop("flavor", DEFAULT_FLAVOR))
+    overrides = tuple((k, _freeze(v)) for k, v in rc_options.items())
+    try:
+        return dict(_resolve_policy(flavor, overrides))
+    except TypeError:  # unhashable override value
+        return dict(_resolve_policy.__wrapped__(flavor, overrides))
+
+
+def apply_policy_diff(options: Mapping[str, Any] | None = None) -> PolicySnapshot:
+    """Apply policy, touching only the rcParams whose value changes.
+
+    Args:
+        options: Optional dict of rcParams overrides, plus ``flavor``.
+
+    Returns:
+        Snapshot of the previous values of the changed keys only, for
+        :func:`restore_policy`.
+    """
+    rc = mpl.rcParams
+    changed = {k: v for k, v in resolve_policy(options).items() if _rc_get(rc, k) != v}
+    previous = PolicySnapshot.capture(changed)
+    for key, value in changed.items():
+        rc[key] = value
+    return previous
+
+
 def apply_policy(options: dict[str, Any] | None = None) -> None:
     """Apply policy to matplotlib rcParams.
 
     Merges provided options with defaults.
 
     Args:
-        options: Optional dict of rcParams overrides.
+        options: Optional dict of rcParams overrides. A ``flavor`` key
+            selects the Catppuccin flavor instead of setting an rcParam.
     """
-    defaults = get_default_style()
-    if options:
-        defaults.update(options)
-    mpl.rcParams.update(defaults)
+    apply_policy_diff(options)
 
 
 # -----------------------------------------------------------------------------
@@ -176,17 +509,47 @@ def apply_policy(options: dict[str, Any] | None = None) -> None:
 
 def create_figure(
     figsize: tuple[float, float] | None = None,
+    *,
+    style: Style | None = None,
+    headless: bool = False,
 ) -> Figure:
     """Create a figure with policy-applied styling.
 
     Args:
         figsize: Optional figure size (width, height) in inches.
+        style: Optional compiled style; defaults to the active style.
+        headless: Build the Figure on an Agg canvas directly instead of
+            through pyplot, so it is never registered with the pyplot
+            figure manager.
 
     Returns:
         Configured matplotlib Figure.
     """
-    style = get_default_style()
+    if style is None:
+        style = get_style()
     fig_size = figsize or style["figure.figsize"]
-    fig = plt.figure(figsize=fig_size, dpi=style["figure.dpi"])
+    if headless:
+        fig = Figure(figsize=fig_size, dpi=style["figure.dpi"])
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=fig_size, dpi=style["figure.dpi"])
     fig.patch.set_facecolor(style["figure.facecolor"])
     return fig
+
+
+def release_figure(fig: Figure) -> None:
+    """Release a figure created by :func:`create_figure`.
+
+    Removes pyplot-managed figures from the global figure manager.
+    Headless figures are not registered and are simply left to be
+    garbage collected.
+
+    Args:
+        fig: Figure to release.
+    """
+    # Figures can only be registered if pyplot was ever imported
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is not None:
+        plt.close(fig)
@@ -1,7 +1,36 @@
 """Primitives module - plotting functions."""
 
+from .animate import AnimationResult, animate
+from .binning import Histogram, compute_histogram, merge_histograms
+from .export import BufferPool, ExportResult
+from .grid import GridResult, Panel, subplot_grid
+from .heatmap import heatmap
+from .histogram import histogram
 from .line import line
+from .live import LiveLine
+from .pyramid import Pyramid, build_pyramid
+from .render import render
 from .result import PlotResult
 from .scatter import scatter
 
-__all__ = ["PlotResult", "scatter", "line"]
+__all__ = [
+    "PlotResult",
+    "ExportResult",
+    "AnimationResult",
+    "BufferPool",
+    "LiveLine",
+    "Histogram",
+    "Pyramid",
+    "Panel",
+    "GridResult",
+    "scatter",
+    "line",
+    "histogram",
+    "heatmap",
+    "subplot_grid",
+    "animate",
+    "compute_histogram",
+    "merge_histograms",
+    "build_pyramid",
+    "render",
+]
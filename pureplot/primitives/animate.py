@@ -0,0 +1,273 @@
+# primitives/animate.py
+
+from __future__ import annotations
+
+import io
+import os
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.lines import Line2D
+from numpy.typing import ArrayLike
+from PIL import Image
+
+from .export import PAD_INCHES, _crop, _pil_options, _savefig_state, savefig_options
+from .result import PlotResult
+from .utils import ingest_xy
+
+FRAME_FORMATS = ("png", "gif")
+
+# Handles whose data can be replaced in place between frames
+_ANIMATED_TYPES = (Line2D, LineCollection, PathCollection)
+
+Frame = tuple[ArrayLike, ArrayLike] | Sequence[tuple[ArrayLike, ArrayLike]]
+
+
+@dataclass(frozen=True)
+class AnimationResult:
+    """Encoded animation with timing statistics.
+
+    Attributes:
+        format: "png" (one image per frame) or "gif".
+        n_frames: Number of frames rendered.
+        frame_size: (width, height) of every frame in pixels.
+        data: GIF bytes, or one PNG per frame; None when written to disk.
+        paths: Files written, in frame order.
+        draw_time: Seconds spent updating and drawing frames.
+        encode_time: Seconds spent encoding, summed over workers.
+    """
+
+    format: str
+    n_frames: int
+    frame_size: tuple[int, int]
+    data: bytes | tuple[bytes, ...] | None
+    paths: tuple[Path, ...]
+    draw_time: float
+    encode_time: float
+
+
+def _set_data(handle: Artist, x: np.ndarray, y: np.ndarray) -> None:
+    if isinstance(handle, Line2D):
+        handle.set_data(x, y)
+    elif isinstance(handle, LineCollection):
+        xs = x[:, None] if x.ndim == 1 else x
+        xs, ys = np.broadcast_arrays(xs, y)
+        handle.set_segments(np.stack([xs, ys], axis=-1).transpose(1, 0, 2))
+    else:
+        handle.set_offsets(np.column_stack([x, y]))
+
+
+def _frame_pairs(frame: Frame, n_handles: int) -> list[tuple[ArrayLike, ArrayLike]]:
+    """(x, y) per handle; a single-handle result takes a bare pair."""
+    pairs = [frame] if n_handles == 1 else list(frame)
+    if len(pairs) != n_handles:
+        raise ValueError(
+            f"each frame needs one (x, y) pair per handle: "
+            f"expected {n_handles}, got {len(pairs)}"
+        )
+    return pairs
+
+
+@contextmanager
+def _animated(handles: Sequence[Artist]) -> Iterator[None]:
+    """Leave handles out of full draws so they can be blitted."""
+    previous = [handle.get_animated() for handle in handles]
+    for handle in handles:
+        handle.set_animated(True)
+    try:
+        yield
+    finally:
+        for handle, animated in zip(handles, previous):
+            handle.set_animated(animated)
+
+
+def _encode_png(
+    rgba: np.ndarray, dpi: float, pil_options: Mapping[str, Any], path: Path | None
+) -> tuple[bytes | None, float]:
+    start = time.perf_counter()
+    image = Image.fromarray(rgba)
+    if path is not None:
+        image.save(path, format="png", dpi=(dpi, dpi), **pil_options)
+        return None, time.perf_counter() - start
+    fh = io.BytesIO()
+    image.save(fh, format="png", dpi=(dpi, dpi), **pil_options)
+    return fh.getvalue(), time.perf_counter() - start
+
+
+def _to_palette(rgba: np.ndarray, palette: Image.Image) -> tuple[Image.Image, float]:
+    start = time.perf_counter()
+    image = Image.fromarray(rgba[..., :3]).quantize(
+        palette=palette, dither=Image.Dither.NONE
+    )
+    return image, time.perf_counter() - start
+
+
+def animate(
+    result: PlotResult,
+    frames: Iterable[Frame],
+    *,
+    format: str = "gif",
+    path: str | os.PathLike[str] | None = None,
+    fps: float = 20.0,
+    loop: int | None = 0,
+    workers: int | None = None,
+    compress_level: int | None = None,
+    xlim: tuple[float, float] | None = None,
+    ylim: tuple[float, float] | None = None,
+) -> AnimationResult:
+    """Render a sequence of frames by updating a plot's data in place.
+
+    The figure of ``result`` is drawn once without its handles and kept
+    as a background; each frame restores that background, replaces the
+    handles' data and draws only the handles (blitting), so figure
+    creation, styling and layout are not repeated. Frame pixels are
+    handed to a thread pool for encoding, so drawing and encoding
+    overlap. Limits stay fixed: set ``xlim``/``ylim`` to cover the data
+    of every frame. The handles keep the last frame's data.
+
+    Frames are rendered at the savefig DPI and colors and cropped to the
+    figure's tight bounding box, computed once from the first draw.
+
+    Args:
+        result: Result of ``line()`` or ``scatter()`` (point mode), built
+            on an Agg canvas (e.g. ``headless=True``).
+        frames: Iterable of ``(x, y)`` pairs, or of one pair per handle
+            when the result has several (e.g. ``hue`` groups).
+        format: "gif" for one animated GIF, or "png" for one image per
+            frame.
+        path: GIF file, or directory for ``frame_00000.png``...; when
+            None the encoded data is returned instead.
+        fps: Frames per second of the GIF.
+        loop: GIF loop count (0 loops forever, None plays once).
+        workers: Encoding threads (default: up to 4).
+        compress_level: PNG zlib level 0-9; lower is faster and larger.
+        xlim: Fixed x limits (default: the result's current limits).
+        ylim: Fixed y limits (default: the result's current limits).
+
+    Returns:
+        AnimationResult with the encoded frames and statistics.
+    """
+    if format not in FRAME_FORMATS:
+        raise ValueError(f"format must be one of {FRAME_FORMATS}, got {format!r}")
+    if fps <= 0:
+        raise ValueError(f"fps must be positive, got {fps}")
+    handles = tuple(result.handles)
+    if not handles or not all(isinstance(h, _ANIMATED_TYPES) for h in handles):
+        raise TypeError("animate requires line() or scatter() point handles")
+    canvas = result.fig.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        raise TypeError("animate requires an Agg canvas (e.g. headless=True)")
+
+    pil_options = _pil_options(compress_level)
+    workers = workers or min(4, os.cpu_count() or 1)
+    directory = None
+    if path is not None and format == "png":
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+    if xlim is not None:
+        result.ax.set_xlim(xlim)
+    if ylim is not None:
+        result.ax.set_ylim(ylim)
+
+    options = savefig_options({}, result.style)
+    dpi = options["dpi"]
+    draw_time = encode_time = 0.0
+    encoded: list[Any] = []
+    paths: list[Path] = []
+    palette = None
+
+    with (
+        _savefig_state(result.fig, options),
+        _animated(handles),
+        ThreadPoolExecutor(workers) as pool,
+    ):
+        canvas.draw()
+        bbox = None
+        if options["bbox_inches"] == "tight":
+            bbox = result.fig.get_tightbbox(canvas.get_renderer()).padded(PAD_INCHES)
+        background = canvas.copy_from_bbox(result.fig.bbox)
+
+        # Bounded so frames cannot pile up faster than they are encoded
+        pending: deque[Future] = deque()
+
+        def collect(future: Future) -> None:
+            nonlocal encode_time
+            output, seconds = future.result()
+            encoded.append(output)
+            encode_time += seconds
+
+        for index, frame in enumerate(frames):
+            start = time.perf_counter()
+            canvas.restore_region(background)
+            for handle, (x, y) in zip(handles, _frame_pairs(frame, len(handles))):
+                allow_2d = isinstance(handle, LineCollection)
+                x_arr, y_arr, _ = ingest_xy(x, y, allow_2d=allow_2d)
+                _set_data(handle, x_arr, y_arr)
+                handle.axes.draw_artist(handle)
+            rgba = np.asarray(canvas.buffer_rgba())
+            cropped = _crop(rgba, bbox, dpi)
+            # The canvas buffer is reused by the next frame
+            pixels = (rgba if cropped is None else cropped).copy()
+            draw_time += time.perf_counter() - start
+
+            if format == "png":
+                file = None
+                if directory is not None:
+                    file = directory / f"frame_{index:05d}.png"
+                    paths.append(file)
+                future = pool.submit(_encode_png, pixels, dpi, pil_options, file)
+            else:
+                if palette is None:
+                    # One palette for all frames, from the first, avoids
+                    # flicker between frames
+                    palette = Image.fromarray(pixels[..., :3]).quantize(256)
+                future = pool.submit(_to_palette, pixels, palette)
+
+            pending.append(future)
+            if len(pending) > 2 * workers:
+                collect(pending.popleft())
+
+        while pending:
+            collect(pending.popleft())
+
+    if not encoded:
+        raise ValueError("animate needs at least one frame")
+    frame_size = (pixels.shape[1], pixels.shape[0])
+
+    if format == "png":
+        data = None if directory is not None else tuple(encoded)
+    else:
+        start = time.perf_counter()
+        fh = io.BytesIO() if path is None else Path(path)
+        encoded[0].save(
+            fh,
+            format="gif",
+            save_all=True,
+            append_images=encoded[1:],
+            duration=round(1000 / fps),
+            **({} if loop is None else {"loop": loop}),
+        )
+        encode_time += time.perf_counter() - start
+        data = fh.getvalue() if isinstance(fh, io.BytesIO) else None
+        if path is not None:
+            paths.append(Path(path))
+
+    return AnimationResult(
+        format=format,
+        n_frames=len(encoded),
+        frame_size=frame_size,
+        data=data,
+        paths=tuple(paths),
+        draw_time=draw_time,
+        encode_time=encode_time,
+    )
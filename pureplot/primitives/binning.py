@@ -0,0 +1,151 @@
+# primitives/binning.py
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .density import CHUNK_SIZE
+from .utils import as_array, data_range
+
+HistogramInput = ArrayLike | Iterator[ArrayLike] | Sequence[np.ndarray]
+
+
+@dataclass(frozen=True)
+class Histogram:
+    """Counts over uniform bins; partial histograms can be merged.
+
+    Attributes:
+        counts: Number of values per bin (int64).
+        edges: Bin edges, one more than ``counts``.
+    """
+
+    counts: np.ndarray
+    edges: np.ndarray
+
+    def merge(self, other: Histogram) -> Histogram:
+        """Add the counts of another histogram over the same bins."""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("cannot merge histograms with different bin edges")
+        return Histogram(self.counts + other.counts, self.edges)
+
+
+def uniform_edges(bins: int, range: tuple[float, float]) -> np.ndarray:
+    """Edges of ``bins`` equal-width bins, widened when the range is degenerate."""
+    if bins < 1:
+        raise ValueError(f"bins must be a positive integer, got {bins}")
+    lo, hi = float(range[0]), float(range[1])
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        raise ValueError(f"range must be finite, got {(lo, hi)}")
+    if lo > hi:
+        raise ValueError(f"range must be increasing, got {(lo, hi)}")
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, bins + 1)
+
+
+def _iter_array_chunks(arr: np.ndarray) -> Iterator[np.ndarray]:
+    for start in range(0, len(arr), CHUNK_SIZE):
+        yield arr[start : start + CHUNK_SIZE]
+
+
+def _as_chunks(data: object) -> Iterable[ArrayLike] | None:
+    """Chunks of chunked input, or None for a single array.
+
+    Chunked input is an iterator of arrays, or a list or tuple whose
+    items are all numpy arrays.
+    """
+    if isinstance(data, Iterator):
+        return data
+    if (
+        isinstance(data, (list, tuple))
+        and data
+        and all(isinstance(chunk, np.ndarray) for chunk in data)
+    ):
+        return data
+    return None
+
+
+def _chunks_range(chunks: Sequence[np.ndarray]) -> tuple[float, float]:
+    ranges = [data_range(chunk) for chunk in chunks if chunk.size]
+    if not ranges:
+        return 0.0, 1.0
+    los, his = zip(*ranges)
+    return float(np.fmin.reduce(los)), float(np.fmax.reduce(his))
+
+
+def _bin_chunk(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Count one chunk by index arithmetic, matching ``np.histogram``."""
+    n = len(edges) - 1
+    lo, hi = edges[0], edges[-1]
+    values = values.astype(np.float64, copy=False)
+    values = values[(values >= lo) & (values <= hi)]
+
+    idx = ((values - lo) * (n / (hi - lo))).astype(np.intp)
+    idx[idx == n] -= 1  # the last bin is closed on the right
+
+    # Rounding in the scale can put a value one bin off near an edge
+    idx -= values < edges[idx]
+    idx += (values >= edges[idx + 1]) & (idx != n - 1)
+
+    return np.bincount(idx, minlength=n)
+
+
+def compute_histogram(
+    data: HistogramInput,
+    bins: int = 50,
+    *,
+    range: tuple[float, float] | None = None,
+) -> Histogram:
+    """Bin values into uniform bins.
+
+    Bin indices come from direct index arithmetic and ``np.bincount``
+    rather than a ``searchsorted`` per value. Arrays are processed in
+    chunks. Chunked input (an iterator of arrays, or a list or tuple of
+    numpy arrays) is binned one chunk at a time. An iterator is consumed
+    once, so the full dataset never has to be resident (``range`` is
+    then required); a list of arrays is scanned for its range first if
+    none is given. NaNs and values outside ``range`` are ignored.
+
+    Args:
+        data: 1D array-like, or chunks of 1D arrays.
+        bins: Number of equal-width bins.
+        range: (min, max) covered by the bins; defaults to the data range.
+
+    Returns:
+        Histogram with int64 counts and float64 edges.
+    """
+    chunks = _as_chunks(data)
+    if isinstance(chunks, Iterator):
+        if range is None:
+            raise ValueError("range is required when data is an iterator of chunks")
+    elif chunks is not None:
+        if range is None:
+            range = _chunks_range(chunks)
+    else:
+        arr, _ = as_array(data)
+        if arr.ndim != 1:
+            raise ValueError("histogram data must be a 1D array")
+        if range is None:
+            range = data_range(arr) if len(arr) else (0.0, 1.0)
+        chunks = _iter_array_chunks(arr)
+
+    edges = uniform_edges(bins, range)
+    counts = np.zeros(bins, dtype=np.int64)
+    for chunk in chunks:
+        values = np.asarray(chunk).ravel()
+        counts += _bin_chunk(values, edges)
+    return Histogram(counts, edges)
+
+
+def merge_histograms(parts: Sequence[Histogram]) -> Histogram:
+    """Merge partial histograms computed over the same bins."""
+    if not parts:
+        raise ValueError("no histograms to merge")
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merge(part)
+    return merged
@@ -0,0 +1,136 @@
+# primitives/decimate.py
+
+import numpy as np
+
+DECIMATE_MODES = ("minmax", "lttb", "auto")
+
+# "auto" only decimates once there are this many points per pixel column.
+AUTO_POINTS_PER_PIXEL = 4
+
+
+def _numeric(a: np.ndarray) -> np.ndarray:
+    """View datetime-like arrays as integers so they support arithmetic."""
+    if a.dtype.kind in "mM":
+        return a.view(np.int64)
+    return a
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Select the min and max sample of each of ``n_buckets`` index buckets.
+
+    Peaks survive decimation, so the rasterized line looks the same as
+    the full-resolution one at the given pixel width.
+
+    Args:
+        y: 1D array of values.
+        n_buckets: Number of buckets, typically the output width in pixels.
+
+    Returns:
+        Sorted indices of the samples to keep (first and last included).
+    """
+    n = len(y)
+    if n_buckets < 1 or n <= 2 * n_buckets:
+        return np.arange(n)
+
+    y = _numeric(y)
+    bucket = n // n_buckets
+    usable = bucket * n_buckets
+    blocks = y[:usable].reshape(n_buckets, bucket)
+    offsets = np.arange(n_buckets) * bucket
+
+    parts = [
+        np.array([0, n - 1]),
+        blocks.argmin(axis=1) + offsets,
+        blocks.argmax(axis=1) + offsets,
+    ]
+    if usable < n:
+        tail = y[usable:]
+        parts.append(np.array([tail.argmin(), tail.argmax()]) + usable)
+
+    return np.unique(np.concatenate(parts))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Bucket averages are computed in one vectorized pass; the selection
+    itself depends on the previously chosen point, so it walks the
+    buckets in order with a vectorized triangle-area scan per bucket.
+
+    Args:
+        x: 1D array of x values (assumed sorted).
+        y: 1D array of y values.
+        n_out: Number of points to keep.
+
+    Returns:
+        Sorted indices of the samples to keep (first and last included).
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return np.arange(n)
+
+    x = _numeric(x)
+    y = _numeric(y)
+
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1, dtype=np.float64) / counts
+    mean_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1, dtype=np.float64) / counts
+
+    # For bucket i, the third triangle vertex is the mean of bucket i + 1
+    next_x = np.append(mean_x[1:], float(x[-1]))
+    next_y = np.append(mean_y[1:], float(y[-1]))
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0] = 0
+    out[-1] = n - 1
+    ax_, ay_ = float(x[0]), float(y[0])
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx = x[lo:hi].astype(np.float64, copy=False)
+        by = y[lo:hi].astype(np.float64, copy=False)
+        area = np.abs((ax_ - next_x[i]) * (by - ay_) - (ax_ - bx) * (next_y[i] - ay_))
+        j = lo + int(area.argmax())
+        out[i + 1] = j
+        ax_, ay_ = float(x[j]), float(y[j])
+
+    return out
+
+
+def decimate_xy(
+    x: np.ndarray,
+    y: np.ndarray,
+    mode: str,
+    n_pixels: int,
+) -> tuple[np.ndarray, np.ndarray, str | None]:
+    """Reduce a series to what ``n_pixels`` columns can show.
+
+    Args:
+        x: 1D array of x values.
+        y: 1D array of y values.
+        mode: One of ``DECIMATE_MODES``.
+        n_pixels: Output width in pixels.
+
+    Returns:
+        Tuple of (x, y, mode_applied); ``mode_applied`` is None when the
+        series was already small enough to draw as-is.
+    """
+    if mode not in DECIMATE_MODES:
+        raise ValueError(f"decimate must be one of {DECIMATE_MODES}, got {mode!r}")
+
+    n = len(x)
+    if mode == "auto":
+        if n <= AUTO_POINTS_PER_PIXEL * n_pixels:
+            return x, y, None
+        mode = "minmax"
+
+    if mode == "minmax":
+        idx = minmax_indices(y, n_pixels)
+    else:
+        idx = lttb_indices(x, y, 2 * n_pixels)
+
+    if len(idx) == n:
+        return x, y, None
+    return x[idx], y[idx], mode
@@ -0,0 +1,86 @@
+# primitives/density.py
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from matplotlib.axes import Axes
+from numpy.typing import ArrayLike
+
+from .utils import data_range
+
+SCATTER_MODES = ("points", "density", "auto")
+
+# "auto" scatter switches to density rendering above this many points.
+DENSITY_THRESHOLD = 1_000_000
+
+# Points binned per step; bounds temporaries independently of input size.
+CHUNK_SIZE = 1 << 20
+
+Extent = tuple[float, float, float, float]  # (xmin, xmax, ymin, ymax)
+
+
+def iter_chunks(
+    x: np.ndarray, y: np.ndarray, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield aligned (x, y) slices of at most ``chunk_size`` points."""
+    for start in range(0, len(x), chunk_size):
+        stop = start + chunk_size
+        yield x[start:stop], y[start:stop]
+
+
+def data_extent(x: np.ndarray, y: np.ndarray) -> Extent:
+    """NaN-aware data extent, widened when a dimension is degenerate."""
+    x0, x1 = data_range(x)
+    y0, y1 = data_range(y)
+    if x0 == x1:
+        x0, x1 = x0 - 0.5, x1 + 0.5
+    if y0 == y1:
+        y0, y1 = y0 - 0.5, y1 + 0.5
+    return x0, x1, y0, y1
+
+
+def density_grid(
+    chunks: Iterable[tuple[ArrayLike, ArrayLike]],
+    extent: Extent,
+    shape: tuple[int, int],
+) -> np.ndarray:
+    """Bin points into a 2D count grid.
+
+    Bin indices come from direct index arithmetic and ``np.bincount``
+    rather than ``np.histogram2d``. Memory is bounded by the grid plus
+    one chunk, so arbitrarily large inputs can be streamed in.
+
+    Args:
+        chunks: Iterable of (x, y) array pairs.
+        extent: (xmin, xmax, ymin, ymax) covered by the grid.
+        shape: Grid shape as (rows, columns).
+
+    Returns:
+        Array of counts with shape ``shape``; row 0 is ``ymin``.
+    """
+    ny, nx = shape
+    x0, x1, y0, y1 = extent
+    sx = nx / (x1 - x0)
+    sy = ny / (y1 - y0)
+    counts = np.zeros(nx * ny, dtype=np.int64)
+
+    for cx, cy in chunks:
+        cx = np.asarray(cx)
+        cy = np.asarray(cy)
+        fx = (cx - x0) * sx
+        fy = (cy - y0) * sy
+        keep = (fx >= 0) & (fx <= nx) & (fy >= 0) & (fy <= ny)
+        ix = np.minimum(fx[keep].astype(np.intp), nx - 1)
+        iy = np.minimum(fy[keep].astype(np.intp), ny - 1)
+        counts += np.bincount(iy * nx + ix, minlength=nx * ny)
+
+    return counts.reshape(ny, nx)
+
+
+def grid_shape_for(ax: Axes, dpi: float) -> tuple[int, int]:
+    """Grid shape matching the axes' size in output pixels."""
+    fig = ax.figure
+    pos = ax.get_position()
+    nx = max(1, int(pos.width * fig.get_figwidth() * dpi))
+    ny = max(1, int(pos.height * fig.get_figheight() * dpi))
+    return ny, nx
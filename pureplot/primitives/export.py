@@ -0,0 +1,351 @@
+# primitives/export.py
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection, LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
+from PIL import Image
+
+from ..instrument import stage
+from ..policy import get_style
+
+# Handles with more points than this are rasterized in vector output
+RASTERIZE_THRESHOLD = 50_000
+
+VECTOR_FORMATS = frozenset({"svg", "svgz", "pdf", "eps", "ps"})
+
+# Padding around a tight bounding box (matplotlib's savefig default)
+PAD_INCHES = 0.1
+
+Buffer = io.BytesIO | bytearray
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Encoded figure with export statistics.
+
+    Attributes:
+        data: Encoded image; ``bytes``, or a memoryview over ``buffer``
+            when the output was written into a supplied buffer (call
+            :meth:`release` before reusing the buffer).
+        format: Output format.
+        size: Size of the encoded image in bytes.
+        encode_time: Seconds spent drawing and encoding.
+        rasterized: Number of handles drawn as raster images.
+        buffer: The buffer written to, if one was supplied.
+    """
+
+    data: bytes | memoryview
+    format: str
+    size: int
+    encode_time: float
+    rasterized: int
+    buffer: Buffer | None = None
+
+    def release(self) -> None:
+        """Release the view of ``buffer`` so it can be written again."""
+        if isinstance(self.data, memoryview):
+            self.data.release()
+
+
+class BufferPool:
+    """Thread-safe pool of reusable ``BytesIO`` buffers.
+
+    Args:
+        max_buffers: Most idle buffers kept for reuse.
+    """
+
+    def __init__(self, max_buffers: int = 32) -> None:
+        self._max_buffers = max_buffers
+        self._free: list[io.BytesIO] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> io.BytesIO:
+        """Take an idle buffer, or a new one if none is left."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return io.BytesIO()
+
+    def release(self, buffer: Buffer | None) -> None:
+        """Return a buffer; views of it must have been released."""
+        if not isinstance(buffer, io.BytesIO):
+            return
+        with self._lock:
+            if len(self._free) < self._max_buffers:
+                self._free.append(buffer)
+
+
+class _ByteArrayWriter(io.RawIOBase):
+    """Write-only file object appending to a bytearray."""
+
+    def __init__(self, target: bytearray) -> None:
+        self._target = target
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._target += data
+        return len(memoryview(data))
+
+    def tell(self) -> int:
+        return len(self._target)
+
+
+def _open(buffer: Buffer | None) -> io.IOBase:
+    """File object writing from the start of ``buffer`` (or a new one)."""
+    if buffer is None:
+        return io.BytesIO()
+    try:
+        if isinstance(buffer, bytearray):
+            del buffer[:]
+            return _ByteArrayWriter(buffer)
+        buffer.seek(0)
+        buffer.truncate()
+    except BufferError:
+        raise BufferError(
+            "buffer is still viewed by the data of a previous ExportResult; "
+            "call its release() before reusing the buffer"
+        ) from None
+    return buffer
+
+
+def _finish(
+    fh: io.IOBase,
+    buffer: Buffer | None,
+    format: str,
+    encode_time: float,
+    rasterized: int,
+) -> ExportResult:
+    if buffer is None:
+        data: bytes | memoryview = fh.getvalue()
+    elif isinstance(buffer, bytearray):
+        data = memoryview(buffer)
+    else:
+        data = buffer.getbuffer()
+    return ExportResult(data, format, len(data), encode_time, rasterized, buffer)
+
+
+def _n_points(artist: Artist) -> int:
+    """Number of vertices or markers an artist writes to vector output."""
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, LineCollection):
+        return sum(len(segment) for segment in artist.get_segments())
+    if isinstance(artist, Collection):
+        return len(artist.get_offsets())
+    return 0
+
+
+def heavy_handles(handles: Iterable[Any], threshold: int | None) -> list[Artist]:
+    """Handles with more than ``threshold`` points that are not yet raster."""
+    if threshold is None:
+        return []
+    return [
+        handle
+        for handle in handles
+        if isinstance(handle, Artist)
+        and not handle.get_rasterized()
+        and _n_points(handle) > threshold
+    ]
+
+
+@contextmanager
+def _rasterized(handles: Sequence[Artist]) -> Iterator[None]:
+    for handle in handles:
+        handle.set_rasterized(True)
+    try:
+        yield
+    finally:
+        for handle in handles:
+            handle.set_rasterized(False)
+
+
+def savefig_options(
+    overrides: Mapping[str, Any], style: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """``Figure.savefig`` keyword arguments from the savefig policy.
+
+    Args:
+        overrides: Keyword arguments taking precedence over the policy.
+        style: Style the figure was rendered with; defaults to the
+            active style.
+    """
+    style = get_style() if style is None else style
+    dpi = style["savefig.dpi"]
+    options: dict[str, Any] = {
+        "dpi": style["figure.dpi"] if dpi == "figure" else dpi,
+        "facecolor": style["savefig.facecolor"],
+        "edgecolor": style["savefig.edgecolor"],
+        "bbox_inches": style["savefig.bbox"],
+    }
+    options.update(overrides)
+    return options
+
+
+def _pil_options(compress_level: int | None) -> dict[str, Any]:
+    """Pillow PNG options; lower levels encode faster into larger files."""
+    if compress_level is None:
+        return {}
+    if not 0 <= compress_level <= 9:
+        raise ValueError(f"compress_level must be in 0..9, got {compress_level}")
+    return {"compress_level": compress_level}
+
+
+def encode(
+    fig: Figure,
+    handles: Iterable[Any],
+    format: str = "png",
+    *,
+    buffer: Buffer | None = None,
+    compress_level: int | None = None,
+    rasterize_threshold: int | None = RASTERIZE_THRESHOLD,
+    style: Mapping[str, Any] | None = None,
+    **savefig_kwargs: Any,
+) -> ExportResult:
+    """Encode a figure in one format; see ``PlotResult.export``."""
+    options = savefig_options(savefig_kwargs, style)
+    pil_options = _pil_options(compress_level)
+    if format.lower() == "png" and pil_options:
+        options["pil_kwargs"] = pil_options
+    heavy = []
+    if format.lower() in VECTOR_FORMATS:
+        heavy = heavy_handles(handles, rasterize_threshold)
+
+    fh = _open(buffer)
+    with _rasterized(heavy), stage("encode"):
+        start = time.perf_counter()
+        fig.savefig(fh, format=format, **options)
+        encode_time = time.perf_counter() - start
+    return _finish(fh, buffer, format, encode_time, len(heavy))
+
+
+@contextmanager
+def _savefig_state(fig: Figure, options: Mapping[str, Any]) -> Iterator[None]:
+    """Temporarily give the figure the DPI and colors savefig would use."""
+    dpi = fig.dpi
+    facecolor = fig.patch.get_facecolor()
+    edgecolor = fig.patch.get_edgecolor()
+    fig.dpi = options["dpi"]
+    fig.patch.set_facecolor(options["facecolor"])
+    fig.patch.set_edgecolor(options["edgecolor"])
+    try:
+        yield
+    finally:
+        fig.dpi = dpi
+        fig.patch.set_facecolor(facecolor)
+        fig.patch.set_edgecolor(edgecolor)
+
+
+def _crop(rgba: np.ndarray, bbox: Bbox | None, dpi: float) -> np.ndarray | None:
+    """Pixels inside ``bbox`` (inches), or None if it leaves the canvas."""
+    if bbox is None:
+        return rgba
+    height, width = rgba.shape[:2]
+    x0 = round(bbox.x0 * dpi)
+    top = height - round(bbox.y1 * dpi)
+    w = int(bbox.width * dpi)
+    h = int(bbox.height * dpi)
+    if x0 < 0 or top < 0 or x0 + w > width or top + h > height:
+        return None
+    return rgba[top : top + h, x0 : x0 + w]
+
+
+def encode_many(
+    fig: Figure,
+    handles: Iterable[Any],
+    formats: Sequence[str],
+    *,
+    buffers: Mapping[str, Buffer] | BufferPool | None = None,
+    compress_level: int | None = None,
+    rasterize_threshold: int | None = RASTERIZE_THRESHOLD,
+    style: Mapping[str, Any] | None = None,
+    **savefig_kwargs: Any,
+) -> dict[str, ExportResult]:
+    """Encode a figure in several formats; see ``PlotResult.export_formats``."""
+    formats = list(dict.fromkeys(fmt.lower() for fmt in formats))
+    handles = list(handles)
+    if isinstance(buffers, BufferPool):
+        pool = buffers
+        buffers = {fmt: pool.acquire() for fmt in formats}
+    buffers = buffers or {}
+
+    options = savefig_options(savefig_kwargs, style)
+    extra = set(options) - {"dpi", "facecolor", "edgecolor", "bbox_inches"}
+    shared = (
+        isinstance(fig.canvas, FigureCanvasAgg)
+        and not extra
+        and (options["bbox_inches"] in ("tight", None))
+    )
+    if not shared:
+        return {
+            fmt: encode(
+                fig,
+                handles,
+                fmt,
+                buffer=buffers.get(fmt),
+                compress_level=compress_level,
+                rasterize_threshold=rasterize_threshold,
+                style=style,
+                **savefig_kwargs,
+            )
+            for fmt in formats
+        }
+
+    results: dict[str, ExportResult] = {}
+    pil_options = _pil_options(compress_level)
+    heavy = []
+    if VECTOR_FORMATS.intersection(formats):
+        heavy = heavy_handles(handles, rasterize_threshold)
+    dpi = options["dpi"]
+
+    with _rasterized(heavy), _savefig_state(fig, options):
+        # One Agg draw yields both the tight bounding box shared by every
+        # format and the pixels for PNG
+        with stage("encode"):
+            start = time.perf_counter()
+            fig.canvas.draw()
+            bbox = None
+            if options["bbox_inches"] == "tight":
+                bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(PAD_INCHES)
+            draw_time = time.perf_counter() - start
+
+        for fmt in formats:
+            fh = _open(buffers.get(fmt))
+            with stage("encode"):
+                start = time.perf_counter()
+                pixels = None
+                if fmt == "png":
+                    pixels = _crop(np.asarray(fig.canvas.buffer_rgba()), bbox, dpi)
+                if pixels is not None:
+                    Image.fromarray(pixels).save(
+                        fh,
+                        format="png",
+                        dpi=(dpi, dpi),
+                        **pil_options,
+                    )
+                    elapsed = draw_time + time.perf_counter() - start
+                else:
+                    fmt_options = {**options, "bbox_inches": bbox}
+                    if fmt == "png" and pil_options:
+                        fmt_options["pil_kwargs"] = pil_options
+                    fig.savefig(fh, format=fmt, **fmt_options)
+                    elapsed = time.perf_counter() - start
+            rasterized = len(heavy) if fmt in VECTOR_FORMATS else 0
+            results[fmt] = _finish(fh, buffers.get(fmt), fmt, elapsed, rasterized)
+
+    return results
@@ -0,0 +1,236 @@
+# primitives/grid.py
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from matplotlib.axes import Axes
+from matplotlib.ticker import FixedLocator
+from numpy.typing import ArrayLike
+
+from ..instrument import stage
+from ..policy import create_figure, get_style
+from .interface import style_axes
+from .layout import apply_grid_layout
+from .line import _draw_line
+from .result import PlotResult
+from .scatter import _Density, _draw_scatter
+from .utils import data_range, ingest_xy, style_frame
+
+# Draw functions and the defaults their public primitives use
+_PANEL_KINDS: dict[str, tuple[Any, dict[str, Any]]] = {
+    "line": (_draw_line, {"color": None, "linewidth": 2.0, "alpha": 1.0}),
+    "scatter": (
+        _draw_scatter,
+        {"color": None, "size": None, "alpha": None, "mode": "auto"},
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Panel:
+    """One panel of a subplot grid.
+
+    Attributes:
+        kind: Primitive used to draw the panel, "line" or "scatter".
+        x: X data.
+        y: Y data (2D for multi-series lines).
+        title: Optional panel title.
+        kwargs: Keyword arguments for the primitive's draw function.
+    """
+
+    kind: str
+    x: ArrayLike
+    y: ArrayLike
+    title: str | None = None
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class GridResult(PlotResult):
+    """Result of :func:`subplot_grid`.
+
+    ``ax`` is the first panel's axes; ``axes`` holds every panel's axes
+    in row-major order and ``metadata["panels"]`` their metadata.
+    """
+
+    axes: tuple[Axes, ...] = ()
+
+
+def _share(axes: list[Axes], ncols: int, *, sharex: bool, sharey: bool) -> None:
+    """Give drawn panels common limits and ticks; hide inner tick labels.
+
+    matplotlib's own axis sharing looks up every sibling on each limit
+    access, which makes drawing a large grid quadratic in the number of
+    panels. Instead the union of the panels' autoscaled limits is set on
+    every axes, and the tick locations are computed once and fixed.
+    """
+    for name, enabled in (("x", sharex), ("y", sharey)):
+        if not enabled:
+            continue
+        limits = [getattr(ax, f"get_{name}lim")() for ax in axes]
+        lo = min(min(lim) for lim in limits)
+        hi = max(max(lim) for lim in limits)
+        getattr(axes[0], f"set_{name}lim")(lo, hi)
+        locator = FixedLocator(getattr(axes[0], f"{name}axis").get_majorticklocs())
+        for ax in axes:
+            getattr(ax, f"set_{name}lim")(lo, hi)
+            getattr(ax, f"{name}axis").set_major_locator(locator)
+
+    for index, ax in enumerate(axes):
+        # Bottom panel of its column, counting empty trailing cells
+        if sharex and index + ncols < len(axes):
+            ax.xaxis.set_tick_params(labelbottom=False)
+        if sharey and index % ncols:
+            ax.yaxis.set_tick_params(labelleft=False)
+
+
+def subplot_grid(
+    panels: Sequence[Panel],
+    *,
+    ncols: int | None = None,
+    sharex: bool = True,
+    sharey: bool = True,
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str | None = None,
+    figsize: tuple[float, float] | None = None,
+    headless: bool = False,
+) -> GridResult:
+    """Create a grid of small multiples in one figure.
+
+    Every panel is drawn with the same draw functions as ``line()`` and
+    ``scatter()``. Styling is applied to all axes in a single pass, and
+    layout is computed once for the whole grid from measured tick and
+    title extents instead of running ``tight_layout`` over every axes,
+    so cost grows linearly with the number of panels. With shared axes,
+    inner tick labels are hidden and only one axes is measured.
+
+    Args:
+        panels: Panels in row-major order.
+        ncols: Number of columns (default: roughly square grid).
+        sharex: Share x limits and ticks across panels.
+        sharey: Share y limits and ticks across panels.
+        title: Figure title.
+        xlabel: X label shared by all panels.
+        ylabel: Y label shared by all panels.
+        figsize: Figure size in inches.
+        headless: Build on a standalone Agg canvas (see ``create_figure``).
+
+    Returns:
+        GridResult with one handle per panel.
+    """
+    if not panels:
+        raise ValueError("subplot_grid needs at least one panel")
+    for panel in panels:
+        if panel.kind not in _PANEL_KINDS:
+            raise ValueError(
+                f"Unknown panel kind {panel.kind!r}; "
+                f"expected one of {sorted(_PANEL_KINDS)}"
+            )
+
+    timings: dict[str, float] = {}
+    n_panels = len(panels)
+    ncols = ncols or math.ceil(math.sqrt(n_panels))
+    nrows = math.ceil(n_panels / ncols)
+
+    with stage("validate", timings):
+        data = [
+            ingest_xy(panel.x, panel.y, allow_2d=panel.kind == "line")
+            for panel in panels
+        ]
+
+    with stage("figure", timings):
+        style = get_style()
+        colors = list(style.color_cycle)
+        fig = create_figure(figsize=figsize, style=style, headless=headless)
+        grid = fig.subplots(nrows, ncols, squeeze=False)
+        all_axes = list(grid.flat)
+        axes = all_axes[:n_panels]
+
+    with stage("draw", timings):
+        handles = []
+        panel_metadata = []
+        densities = []
+        for ax, panel, (x_arr, y_arr, copied) in zip(axes, panels, data):
+            draw_fn, defaults = _PANEL_KINDS[panel.kind]
+            kwargs = {**defaults, **panel.kwargs}
+            if panel.kind == "scatter":
+                # Density panels are binned once the grid is laid out
+                kwargs["density"] = _Density()
+                densities.append((ax, len(panel_metadata), kwargs["density"]))
+            handle, color_used, draw_metadata = draw_fn(
+                ax, x_arr, y_arr, style, colors, **kwargs
+            )
+            handles.append(handle)
+            panel_metadata.append(
+                {
+                    "n_points": y_arr.size,
+                    "x_range": data_range(x_arr),
+                    "y_range": data_range(y_arr),
+                    "copied": copied,
+                    "color_used": color_used,
+                    **draw_metadata,
+                }
+            )
+
+        _share(axes, ncols, sharex=sharex, sharey=sharey)
+
+    with stage("style", timings):
+        for ax, panel in zip(axes, panels):
+            style_frame(ax, style)
+            style_axes(ax, style, title=panel.title, xlabel=None, ylabel=None)
+        for ax in all_axes[n_panels:]:
+            ax.set_visible(False)
+
+        font = {"color": style["text.color"], "fontfamily": style["font.family"]}
+        labels = {}
+        if title:
+            labels["suptitle"] = fig.suptitle(
+                title, fontsize=style["font.size"] + 4, **font
+            )
+        if xlabel:
+            labels["supxlabel"] = fig.supxlabel(
+                xlabel, fontsize=style["font.size"], **font
+            )
+        if ylabel:
+            labels["supylabel"] = fig.supylabel(
+                ylabel, fontsize=style["font.size"], **font
+            )
+
+    with stage("layout", timings):
+        apply_grid_layout(
+            fig,
+            grid,
+            style,
+            n_panels=n_panels,
+            sharex=sharex,
+            sharey=sharey,
+            **labels,
+        )
+
+    for ax, index, density in densities:
+        if finished := density.finish(ax, style, timings):
+            panel_metadata[index]["grid_shape"] = finished["grid_shape"]
+
+    metadata: dict[str, Any] = {
+        "n_panels": n_panels,
+        "grid_shape": (nrows, ncols),
+        "n_points": sum(meta["n_points"] for meta in panel_metadata),
+        "copied": any(meta["copied"] for meta in panel_metadata),
+        "panels": panel_metadata,
+    }
+    if timings:
+        metadata["timings"] = timings
+
+    return GridResult(
+        fig=fig,
+        ax=axes[0],
+        handles=tuple(handles),
+        metadata=metadata,
+        style=style,
+        axes=tuple(axes),
+    )
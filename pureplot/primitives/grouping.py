@@ -0,0 +1,103 @@
+# primitives/grouping.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .utils import as_array
+
+
+def column(data: Any, key: ArrayLike | str) -> tuple[np.ndarray | ArrayLike, bool]:
+    """Resolve a column of a table, viewing it without copying if possible.
+
+    ``data`` can be anything indexable by column name: a pandas
+    DataFrame, a pyarrow Table, a dict of arrays, a numpy structured
+    array. Numeric columns backed by one contiguous buffer are viewed in
+    place; others (nullable, chunked or categorical columns) are copied.
+    Non-string keys are returned unchanged, so arrays can be mixed with
+    column names.
+
+    Returns:
+        Tuple of (column or key, whether the column had to be copied).
+    """
+    if data is None or not isinstance(key, str):
+        return key, False
+    try:
+        values = data[key]
+    except (KeyError, IndexError, ValueError):
+        raise ValueError(f"column {key!r} not found in data") from None
+    return as_array(values)
+
+
+@dataclass(frozen=True)
+class Groups:
+    """Row indices of each group of a key column.
+
+    Attributes:
+        labels: Distinct keys, sorted; None labels the group of missing
+            keys, which comes last.
+        order: Row indices sorted by group; rows keep their original
+            order within a group.
+        bounds: Offsets into ``order``; group ``i`` is
+            ``order[bounds[i]:bounds[i + 1]]``.
+    """
+
+    labels: np.ndarray
+    order: np.ndarray
+    bounds: np.ndarray
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of rows in each group."""
+        return np.diff(self.bounds)
+
+    def indices(self, i: int) -> np.ndarray:
+        """Row indices of group ``i``."""
+        return self.order[self.bounds[i] : self.bounds[i + 1]]
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def group_rows(keys: np.ndarray) -> Groups:
+    """Group rows by key in one vectorized pass.
+
+    Keys are factorized to integer codes, then a single stable argsort
+    of the codes lays each group's rows out contiguously, instead of one
+    boolean mask per group (O(groups x rows)). Missing keys (None or NaN
+    in an object column, as pandas produces next to strings) cannot be
+    sorted with the others and form one last group labelled None.
+
+    Args:
+        keys: 1D array of group keys (numbers, strings, categories).
+
+    Returns:
+        Groups in sorted key order.
+    """
+    keys = keys.reshape(-1)
+    missing = None
+    if keys.dtype == object:
+        missing = np.fromiter(map(_is_missing, keys), dtype=bool, count=len(keys))
+        if not missing.any():
+            missing = None
+
+    if missing is None:
+        labels, codes = np.unique(keys, return_inverse=True)
+        codes = codes.reshape(-1)
+    else:
+        present, present_codes = np.unique(keys[~missing], return_inverse=True)
+        labels = np.empty(len(present) + 1, dtype=object)
+        labels[:-1] = present
+        labels[-1] = None
+        codes = np.full(len(keys), len(present), dtype=np.intp)
+        codes[~missing] = present_codes.reshape(-1)
+
+    order = np.argsort(codes, kind="stable")
+    bounds = np.zeros(len(labels) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(codes, minlength=len(labels)), out=bounds[1:])
+    return Groups(labels, order, bounds)
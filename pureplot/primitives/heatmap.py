@@ -0,0 +1,112 @@
+# primitives/heatmap.py
+
+from typing import Any
+
+import numpy as np
+from matplotlib.colors import Colormap
+from matplotlib.image import AxesImage
+from numpy.typing import ArrayLike
+
+from ..instrument import stage
+from ..policy import get_sequential_colormap
+from .density import grid_shape_for
+from .export import savefig_options
+from .interface import style_axes
+from .layout import apply_layout
+from .pyramid import Pyramid, check_reduce, pool_to, validate_matrix
+from .result import PlotResult
+from .utils import data_range, make_figure_and_axes
+
+
+def heatmap(
+    data: ArrayLike | Pyramid,
+    *,
+    reduce: str = "mean",
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str | None = None,
+    cmap: str | Colormap | None = None,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    figsize: tuple[float, float] | None = None,
+    headless: bool = False,
+    **kwargs: Any,
+) -> PlotResult:
+    """Create a heatmap of a 2D array (row 0 at the top).
+
+    Large matrices are pooled ("mean" or "max", NaN-aware) down to the
+    coarsest power-of-two resolution that still covers the axes' output
+    pixels at the savefig DPI, so imshow never sees more cells than can
+    be shown. Memory-mapped input is streamed through once. Pass a
+    :class:`Pyramid` from ``build_pyramid()`` to reuse the pooled levels
+    across renders. The default colormap is the Catppuccin sequential
+    map of the active flavor.
+    """
+    timings: dict[str, float] = {}
+
+    with stage("validate", timings):
+        check_reduce(reduce)
+        source = data.levels[0] if isinstance(data, Pyramid) else validate_matrix(data)
+        n_rows, n_cols = source.shape
+
+    with stage("figure", timings):
+        fig, ax, style, _ = make_figure_and_axes(figsize=figsize, headless=headless)
+
+    with stage("pool", timings):
+        target = grid_shape_for(ax, savefig_options({}, style)["dpi"])
+        if isinstance(data, Pyramid):
+            level = data.level_for(target)
+            image = data.levels[level]
+            factors = data.factors[level]
+            reduce = data.reduce
+        else:
+            image, factors = pool_to(source, target, reduce)
+
+    with stage("draw", timings):
+        if vmin is None or vmax is None:
+            lo, hi = data_range(np.asarray(image).reshape(-1))
+            vmin = lo if vmin is None else vmin
+            vmax = hi if vmax is None else vmax
+        colormap = cmap if cmap is not None else get_sequential_colormap()
+        handle: AxesImage = ax.imshow(
+            image,
+            extent=(0, n_cols, n_rows, 0),
+            origin="upper",
+            aspect="auto",
+            interpolation="nearest",
+            cmap=colormap,
+            vmin=vmin,
+            vmax=vmax,
+            **kwargs,
+        )
+        # A heatmap fills the axes; a grid on top would hide cells
+        ax.grid(False)
+
+    with stage("style", timings):
+        style_axes(ax, style, title=title, xlabel=xlabel, ylabel=ylabel)
+
+    with stage("layout", timings):
+        apply_layout(fig, ax, style)
+
+    with stage("metadata", timings):
+        metadata = {
+            "n_points": n_rows * n_cols,
+            "x_range": (0.0, float(n_cols)),
+            "y_range": (0.0, float(n_rows)),
+            "color_used": handle.get_cmap().name,
+            "shape": (n_rows, n_cols),
+            "rendered_shape": image.shape,
+            "pool_factors": factors,
+            "reduce": reduce,
+            "value_range": (float(vmin), float(vmax)),
+        }
+    if timings:
+        metadata["timings"] = timings
+
+    return PlotResult(
+        fig=fig,
+        ax=ax,
+        handles=(handle,),
+        metadata=metadata,
+        style=style,
+    )
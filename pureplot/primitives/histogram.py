@@ -0,0 +1,105 @@
+# primitives/histogram.py
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.patches import StepPatch
+
+from ..instrument import stage
+from .binning import Histogram, HistogramInput, compute_histogram, merge_histograms
+from .interface import DrawResult, plot_template
+from .result import PlotResult
+
+
+def _draw_histogram(
+    ax: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    style: Mapping[str, Any],
+    colors: list[str],
+    *,
+    edges: np.ndarray,
+    color: str | None,
+    alpha: float,
+    **kwargs: Any,
+) -> DrawResult:
+    """Draw counts ``y`` over bins starting at ``x`` as filled steps."""
+    plot_color = color if color is not None else colors[0]
+    handle: StepPatch = ax.stairs(
+        y,
+        edges,
+        fill=True,
+        color=plot_color,
+        alpha=alpha,
+        **kwargs,
+    )
+
+    return (
+        handle,
+        plot_color,
+        {
+            "n_points": int(y.sum()),
+            "x_range": (float(edges[0]), float(edges[-1])),
+            "y_range": (0.0, float(y.max(initial=0))),
+            "counts": y,
+            "edges": edges,
+        },
+    )
+
+
+def histogram(
+    data: HistogramInput | Histogram | Sequence[Histogram],
+    bins: int = 50,
+    *,
+    range: tuple[float, float] | None = None,
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str | None = None,
+    color: str | None = None,
+    alpha: float = 0.8,
+    figsize: tuple[float, float] | None = None,
+    headless: bool = False,
+    **kwargs: Any,
+) -> PlotResult:
+    """Create a histogram over uniform bins.
+
+    ``data`` may be a 1D array, chunked input binned one chunk at a time
+    (an iterator of arrays, for which ``range`` is required, or a list
+    of arrays), or one or more precomputed :class:`Histogram` partials
+    (e.g. from ``compute_histogram`` in worker processes) which are
+    merged. Bin counts and edges are returned in ``metadata["counts"]``
+    and ``metadata["edges"]``.
+    """
+    timings: dict[str, float] = {}
+
+    with stage("bin", timings):
+        if isinstance(data, Histogram):
+            hist = data
+        elif (
+            isinstance(data, (list, tuple))
+            and data
+            and all(isinstance(part, Histogram) for part in data)
+        ):
+            hist = merge_histograms(data)
+        else:
+            hist = compute_histogram(data, bins, range=range)
+
+    result = plot_template(
+        _draw_histogram,
+        x=hist.edges[:-1],
+        y=hist.counts,
+        title=title,
+        xlabel=xlabel,
+        ylabel=ylabel,
+        figsize=figsize,
+        headless=headless,
+        edges=hist.edges,
+        color=color,
+        alpha=alpha,
+        **kwargs,
+    )
+    if timings and "timings" in result.metadata:
+        result.metadata["timings"] = {**timings, **result.metadata["timings"]}
+    return result
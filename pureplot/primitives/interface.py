@@ -1,77 +1,50 @@
 # primitives/interface.py
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 import numpy as np
 from matplotlib.axes import Axes
 from numpy.typing import ArrayLike
 
+from ..instrument import stage
+from .grouping import Groups, column, group_rows
+from .layout import apply_layout
 from .result import PlotResult
-from .utils import make_figure_and_axes, validate_xy
+from .utils import as_array, data_range, ingest_xy, make_figure_and_axes
 
-DrawResult = tuple[Any, str]  # (handle, color_used)
+DrawResult = tuple[Any, str, dict[str, Any]]  # (handle, color_used, metadata)
 
 
-def plot_template(
-    draw_fn: Callable[
-        [Axes, np.ndarray, np.ndarray, dict[str, Any], list[str]],
-        DrawResult,
-    ],
+def style_axes(
+    ax: Axes,
+    style: Mapping[str, Any],
     *,
-    x: ArrayLike,
-    y: ArrayLike,
     title: str | None,
     xlabel: str | None,
     ylabel: str | None,
-    figsize: tuple[float, float] | None,
-    **draw_kwargs: Any,
-) -> PlotResult:
-    """
-    Canonical plotting lifecycle.
-
-    Responsibilities:
-    - validate inputs
-    - create figure / axes
-    - query style policy
-    - delegate drawing
-    - apply common styling
-    - return PlotResult
-
-    Forbidden:
-    - rcParams mutation
-    - backend switching
-    """
-
-    x_arr, y_arr = validate_xy(x, y)
-    fig, ax, style, colors = make_figure_and_axes(figsize=figsize)
-
-    handle, color_used = draw_fn(
-        ax,
-        x_arr,
-        y_arr,
-        style,
-        colors,
-        **draw_kwargs,
-    )
-
+) -> None:
+    """Apply title, labels, spines and ticks from an explicit style."""
     if title:
         ax.set_title(
             title,
             color=style["text.color"],
             fontsize=style["font.size"] + 2,
+            fontfamily=style["font.family"],
         )
     if xlabel:
         ax.set_xlabel(
             xlabel,
             color=style["axes.labelcolor"],
             fontsize=style["font.size"],
+            fontfamily=style["font.family"],
         )
     if ylabel:
         ax.set_ylabel(
             ylabel,
             color=style["axes.labelcolor"],
             fontsize=style["font.size"],
+            fontfamily=style["font.family"],
         )
 
     for spine in ax.spines.values():
@@ -83,26 +56,185 @@ def plot_template(
         labelsize=style["xtick.labelsize"],
     )
 
-    fig.tight_layout()
 
-    # Center plot by mirroring left margin to right
-    # This balances y-axis/label space for report layouts
-    pos = ax.get_position()
-    left_margin = pos.x0
-    right_margin = 1.0 - pos.x1
-    if left_margin > right_margin:
-        # Add space on right to match left
-        extra = left_margin - right_margin
-        ax.set_position([pos.x0, pos.y0, pos.width - extra, pos.height])
+def _per_point(value: Any, n: int) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.shape[:1] == (n,)
+    return isinstance(value, list) and len(value) == n
+
+
+def _draw_groups(
+    draw_fn: Callable[..., DrawResult],
+    ax: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    groups: Groups,
+    style: Mapping[str, Any],
+    colors: list[str],
+    draw_kwargs: dict[str, Any],
+) -> tuple[tuple[Any, ...], str, dict[str, Any]]:
+    """Draw each group with the next color of the cycle."""
+    if draw_kwargs.get("color") is not None:
+        raise ValueError("color cannot be combined with hue")
+
+    n = len(x)
+    handles = []
+    group_colors = []
+    group_metadata = []
+    for i, label in enumerate(groups.labels):
+        idx = groups.indices(i)
+        # Per-point arrays and lists (e.g. scatter sizes) are split with
+        # the rows
+        kwargs = {
+            key: np.asarray(value)[idx] if _per_point(value, n) else value
+            for key, value in draw_kwargs.items()
+        }
+        kwargs["color"] = colors[i % len(colors)]
+        handle, color_used, metadata = draw_fn(
+            ax, x[idx], y[idx], style, colors, label=str(label), **kwargs
+        )
+        handles.append(handle)
+        group_colors.append(color_used)
+        group_metadata.append(metadata)
+
+    return (
+        tuple(handles),
+        group_colors[0] if group_colors else colors[0],
+        {
+            "groups": groups.labels.tolist(),
+            "group_counts": groups.counts.tolist(),
+            "group_colors": group_colors,
+            "group_metadata": group_metadata,
+        },
+    )
+
+
+def plot_template(
+    draw_fn: Callable[
+        [Axes, np.ndarray, np.ndarray, Mapping[str, Any], list[str]],
+        DrawResult,
+    ],
+    *,
+    x: ArrayLike | str,
+    y: ArrayLike | str,
+    title: str | None,
+    xlabel: str | None,
+    ylabel: str | None,
+    figsize: tuple[float, float] | None,
+    headless: bool = False,
+    allow_2d: bool = False,
+    data: Any = None,
+    hue: ArrayLike | str | None = None,
+    finish_fn: Callable[[Axes, Mapping[str, Any], dict[str, float]], dict[str, Any]]
+    | None = None,
+    **draw_kwargs: Any,
+) -> PlotResult:
+    """
+    Canonical plotting lifecycle.
+
+    Responsibilities:
+    - validate inputs
+    - create figure / axes
+    - query style policy
+    - delegate drawing
+    - apply common styling
+    - return PlotResult
+
+    Inputs are viewed rather than copied where possible (memmaps,
+    buffer-protocol objects, strided views); ``metadata["copied"]``
+    reports whether a copy was needed. With ``allow_2d``, ``y`` may hold
+    one series per column (see ``ingest_xy``).
+
+    ``x``, ``y`` and ``hue`` may name columns of ``data`` (see
+    ``grouping.column``). With ``hue``, rows are grouped in one
+    vectorized pass and each group is drawn with the next color of the
+    cycle; ``metadata["group_counts"]`` holds the rows per group.
+
+    ``finish_fn(ax, style, timings)`` runs after layout, for drawing that
+    depends on the final axes size (e.g. binning to output pixels); it
+    times its own stages and returns metadata entries.
+
+    Style is read explicitly from the active (context-local) policy, so
+    concurrent calls from different threads do not interfere.
+
+    Forbidden:
+    - rcParams mutation
+    - backend switching
+    """
+
+    timings: dict[str, float] = {}
+
+    with stage("validate", timings):
+        x, x_copied = column(data, x)
+        y, y_copied = column(data, y)
+        x_arr, y_arr, copied = ingest_xy(x, y, allow_2d=allow_2d and hue is None)
+        copied = copied or x_copied or y_copied
+        groups = None
+        if hue is not None:
+            hue_col, hue_copied = column(data, hue)
+            hue_arr, hue_converted = as_array(hue_col)
+            copied = copied or hue_copied or hue_converted
+            if hue_arr.shape != x_arr.shape:
+                raise ValueError(
+                    f"hue must have one value per point: {hue_arr.shape} != "
+                    f"{x_arr.shape}"
+                )
+            groups = group_rows(hue_arr)
+    with stage("figure", timings):
+        fig, ax, style, colors = make_figure_and_axes(
+            figsize=figsize, headless=headless
+        )
+
+    with stage("draw", timings):
+        if groups is None:
+            handle, color_used, draw_metadata = draw_fn(
+                ax,
+                x_arr,
+                y_arr,
+                style,
+                colors,
+                **draw_kwargs,
+            )
+            handles: tuple[Any, ...] = (handle,)
+        else:
+            handles, color_used, draw_metadata = _draw_groups(
+                draw_fn, ax, x_arr, y_arr, groups, style, colors, draw_kwargs
+            )
+            ax.legend(
+                title=hue if isinstance(hue, str) else None,
+                frameon=style["legend.frameon"],
+                facecolor=style["legend.facecolor"],
+                edgecolor=style["legend.edgecolor"],
+                fontsize=style["legend.fontsize"],
+                title_fontsize=style["legend.fontsize"],
+                labelcolor=style["text.color"],
+            ).get_title().set_color(style["text.color"])
+
+    with stage("style", timings):
+        style_axes(ax, style, title=title, xlabel=xlabel, ylabel=ylabel)
+
+    with stage("layout", timings):
+        apply_layout(fig, ax, style)
+
+    if finish_fn is not None:
+        draw_metadata = {**draw_metadata, **finish_fn(ax, style, timings)}
+
+    with stage("metadata", timings):
+        metadata = {
+            "n_points": y_arr.size,
+            "x_range": data_range(x_arr) if x_arr.size else None,
+            "y_range": data_range(y_arr) if y_arr.size else None,
+            "copied": copied,
+            "color_used": color_used,
+            **draw_metadata,
+        }
+    if timings:
+        metadata["timings"] = timings
 
     return PlotResult(
         fig=fig,
         ax=ax,
-        handles=(handle,),
-        metadata={
-            "n_points": len(x_arr),
-            "x_range": (float(x_arr.min()), float(x_arr.max())),
-            "y_range": (float(y_arr.min()), float(y_arr.max())),
-            "color_used": color_used,
-        },
+        handles=handles,
+        metadata=metadata,
+        style=style,
     )
@@ -0,0 +1,243 @@
+# primitives/layout.py
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from matplotlib.axes import Axes
+from matplotlib.axis import Axis
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.text import Text
+
+LAYOUT_CACHE_SIZE = 256
+
+# Padding between grid elements, in points
+GRID_PAD = 6.0
+
+Extent = tuple[float, float]  # (max width, max height) in pixels
+
+
+@dataclass(frozen=True)
+class _Layout:
+    position: tuple[float, float, float, float]
+    xticks: Extent
+    yticks: Extent
+
+
+@dataclass
+class LayoutCacheInfo:
+    """Layout cache statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+_CACHE: OrderedDict[Hashable, _Layout] = OrderedDict()
+_INFO = LayoutCacheInfo()
+_LOCK = threading.Lock()
+
+
+def clear_layout_cache() -> None:
+    """Drop all cached layouts and reset statistics."""
+    with _LOCK:
+        _CACHE.clear()
+        _INFO.hits = _INFO.misses = 0
+
+
+def layout_cache_info() -> LayoutCacheInfo:
+    """Get a copy of the layout cache statistics."""
+    with _LOCK:
+        return LayoutCacheInfo(_INFO.hits, _INFO.misses, len(_CACHE))
+
+
+def _tick_extent(axis: Axis, renderer: Any, prop: FontProperties) -> Extent:
+    """Largest tick label size, measured without drawing the axes."""
+    labels = axis.major.formatter.format_ticks(axis.get_majorticklocs())
+    width = height = 0.0
+    for label in labels:
+        if not label:
+            continue
+        w, h, _ = renderer.get_text_width_height_descent(
+            label, prop, ismath="$" in label
+        )
+        width = max(width, w)
+        height = max(height, h)
+    return width, height
+
+
+def _fits(current: Extent, cached: Extent) -> bool:
+    return current[0] <= cached[0] and current[1] <= cached[1]
+
+
+def _compute_layout(fig: Figure, ax: Axes) -> tuple[float, float, float, float]:
+    fig.tight_layout()
+
+    # Center plot by mirroring left margin to right
+    # This balances y-axis/label space for report layouts
+    pos = ax.get_position()
+    left_margin = pos.x0
+    right_margin = 1.0 - pos.x1
+    if left_margin > right_margin:
+        # Add space on right to match left
+        extra = left_margin - right_margin
+        return (pos.x0, pos.y0, pos.width - extra, pos.height)
+    return (pos.x0, pos.y0, pos.width, pos.height)
+
+
+def apply_layout(fig: Figure, ax: Axes, style: Mapping[str, Any]) -> bool:
+    """Lay out a single-axes figure, reusing cached positions when possible.
+
+    The cache is keyed on figure size, DPI, title/label text and font
+    settings. A cached position is only reused if the current tick labels
+    are no larger than the ones it was computed for; wider tick labels
+    fall back to ``tight_layout`` and refresh the entry.
+
+    Args:
+        fig: Figure to lay out.
+        ax: Its only axes.
+        style: Active style (for tick label size and font family).
+
+    Returns:
+        True if a cached layout was reused.
+    """
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if get_renderer is None:
+        ax.set_position(_compute_layout(fig, ax))
+        return False
+
+    key = (
+        tuple(fig.get_size_inches()),
+        fig.dpi,
+        ax.get_title(),
+        ax.get_xlabel(),
+        ax.get_ylabel(),
+        style["font.size"],
+        style["font.family"],
+        style["xtick.labelsize"],
+        style["ytick.labelsize"],
+    )
+
+    renderer = get_renderer()
+    prop = FontProperties(family=style["font.family"], size=style["xtick.labelsize"])
+    xticks = _tick_extent(ax.xaxis, renderer, prop)
+    yticks = _tick_extent(ax.yaxis, renderer, prop)
+
+    with _LOCK:
+        cached = _CACHE.get(key)
+        hit = (
+            cached is not None
+            and _fits(xticks, cached.xticks)
+            and _fits(yticks, cached.yticks)
+        )
+        if hit:
+            _CACHE.move_to_end(key)
+            _INFO.hits += 1
+        else:
+            _INFO.misses += 1
+
+    if hit:
+        ax.set_position(cached.position)
+        return True
+
+    position = _compute_layout(fig, ax)
+    ax.set_position(position)
+    with _LOCK:
+        _CACHE[key] = _Layout(position, xticks, yticks)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > LAYOUT_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return False
+
+
+def _text_height(text: Text | None, renderer: Any) -> float:
+    if text is None or not text.get_visible() or not text.get_text():
+        return 0.0
+    return text.get_window_extent(renderer).height
+
+
+def apply_grid_layout(
+    fig: Figure,
+    grid: Any,
+    style: Mapping[str, Any],
+    *,
+    n_panels: int,
+    sharex: bool,
+    sharey: bool,
+    suptitle: Text | None = None,
+    supxlabel: Text | None = None,
+    supylabel: Text | None = None,
+) -> None:
+    """Lay out a grid of axes once, from measured text extents.
+
+    Tick label extents are measured with text metrics only (nothing is
+    drawn); with shared axes a single axes is measured since all share
+    the same ticks. Margins and spacing are then set in one
+    ``subplots_adjust`` call, so the cost is linear in the number of
+    panels rather than a ``tight_layout`` over every axes.
+
+    Args:
+        fig: Figure holding the grid.
+        grid: 2D array of axes, as returned by ``Figure.subplots``.
+        style: Active style (for tick label size and font family).
+        n_panels: Number of axes in use, in row-major order.
+        sharex: Whether x ticks are shared (inner labels hidden).
+        sharey: Whether y ticks are shared (inner labels hidden).
+        suptitle: Figure title, if any.
+        supxlabel: Figure-level x label, if any.
+        supylabel: Figure-level y label, if any.
+    """
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if get_renderer is None:
+        fig.tight_layout()
+        return
+
+    renderer = get_renderer()
+    nrows, ncols = grid.shape
+    axes = list(grid.flat)[:n_panels]
+    prop = FontProperties(family=style["font.family"], size=style["xtick.labelsize"])
+    px = fig.dpi / 72.0
+    pad = GRID_PAD * px
+
+    xticks = [_tick_extent(ax.xaxis, renderer, prop)[1] for ax in axes[:1] if sharex]
+    xticks = xticks or [_tick_extent(ax.xaxis, renderer, prop)[1] for ax in axes]
+    yticks = [_tick_extent(ax.yaxis, renderer, prop)[0] for ax in axes[:1] if sharey]
+    yticks = yticks or [_tick_extent(ax.yaxis, renderer, prop)[0] for ax in axes]
+    tick_pad = axes[0].xaxis.get_tick_padding() * px
+    xtick = max(xticks) + tick_pad
+    ytick = max(yticks) + tick_pad
+    panel_title = max(_text_height(ax.title, renderer) for ax in axes)
+    panel_title = panel_title + pad if panel_title else 0.0
+
+    title_h = _text_height(suptitle, renderer)
+    xlabel_h = _text_height(supxlabel, renderer)
+    ylabel_w = supylabel.get_window_extent(renderer).width if supylabel else 0.0
+
+    width, height = fig.get_size_inches() * fig.dpi
+    left = pad + ytick + (ylabel_w + pad if ylabel_w else 0.0)
+    right = pad
+    bottom = pad + xtick + (xlabel_h + pad if xlabel_h else 0.0)
+    top = pad + panel_title + (title_h + pad if title_h else 0.0)
+    hgap = pad + (0.0 if sharey else ytick)
+    vgap = pad + panel_title + (0.0 if sharex else xtick)
+
+    cell_w = (width - left - right - (ncols - 1) * hgap) / ncols
+    cell_h = (height - top - bottom - (nrows - 1) * vgap) / nrows
+    if cell_w <= 0 or cell_h <= 0:
+        # Too many panels for the figure size; let matplotlib squeeze them
+        fig.tight_layout()
+        return
+
+    fig.subplots_adjust(
+        left=left / width,
+        right=1.0 - right / width,
+        bottom=bottom / height,
+        top=1.0 - top / height,
+        wspace=hgap / cell_w,
+        hspace=vgap / cell_h,
+    )
@@ -1,12 +1,16 @@
 # primitives/line.py
 
+from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 from numpy.typing import ArrayLike
 
+from .decimate import decimate_xy
+from .export import savefig_options
 from .interface import DrawResult, plot_template
 from .result import PlotResult
 
@@ -15,17 +19,37 @@ def _draw_line(
     ax: Axes,
     x: np.ndarray,
     y: np.ndarray,
-    style: dict[str, Any],
+    style: Mapping[str, Any],
     colors: list[str],
     *,
     color: str | None,
     linewidth: float,
     alpha: float,
+    decimate: str | None = None,
     **kwargs: Any,
 ) -> DrawResult:
     """Draw line plot on axes."""
+    if y.ndim == 2:
+        return _draw_series(
+            ax,
+            x,
+            y,
+            style,
+            colors,
+            color=color,
+            linewidth=linewidth,
+            alpha=alpha,
+            decimate=decimate,
+            **kwargs,
+        )
+
     plot_color = color if color is not None else colors[0]
 
+    decimated = None
+    if decimate is not None:
+        n_pixels = _output_width(ax, style)
+        x, y, decimated = decimate_xy(x, y, decimate, n_pixels)
+
     handle: Line2D = ax.plot(
         x,
         y,
@@ -35,12 +59,87 @@ def _draw_line(
         **kwargs,
     )[0]
 
-    return handle, plot_color
+    return handle, plot_color, {"n_rendered": len(x), "decimated": decimated}
+
+
+def _draw_series(
+    ax: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    style: Mapping[str, Any],
+    colors: list[str],
+    *,
+    color: str | None,
+    linewidth: float,
+    alpha: float,
+    decimate: str | None = None,
+    **kwargs: Any,
+) -> DrawResult:
+    """Draw each column of ``y`` as one segment of a single LineCollection."""
+    n_series = y.shape[1]
+    series_colors = (
+        [color]
+        if color is not None
+        else [colors[i % len(colors)] for i in range(n_series)]
+    )
+
+    decimated = None
+    if decimate is None:
+        segments = np.empty((n_series, y.shape[0], 2), dtype=np.result_type(x, y))
+        segments[..., 0] = x.T if x.ndim == 2 else x
+        segments[..., 1] = y.T
+        n_rendered = segments.shape[0] * segments.shape[1]
+    else:
+        n_pixels = _output_width(ax, style)
+        segments = []
+        for i in range(n_series):
+            sx, sy, applied = decimate_xy(
+                x[:, i] if x.ndim == 2 else x, y[:, i], decimate, n_pixels
+            )
+            segments.append(np.column_stack([sx, sy]))
+            decimated = decimated or applied
+        n_rendered = sum(len(segment) for segment in segments)
+
+    handle = LineCollection(
+        segments,
+        colors=series_colors,
+        linewidths=linewidth,
+        alpha=alpha,
+        **kwargs,
+    )
+    ax.add_collection(handle)
+    ax.autoscale_view()
+
+    # Per-series ranges, reduced along each column in one vectorized pass
+    x_cols = x if x.ndim == 2 else x[:, None]
+    series_x_range = np.column_stack(
+        [np.fmin.reduce(x_cols, axis=0), np.fmax.reduce(x_cols, axis=0)]
+    )
+    series_y_range = np.column_stack(
+        [np.fmin.reduce(y, axis=0), np.fmax.reduce(y, axis=0)]
+    )
+
+    return (
+        handle,
+        series_colors[0],
+        {
+            "n_series": n_series,
+            "n_rendered": n_rendered,
+            "decimated": decimated,
+            "series_x_range": np.broadcast_to(series_x_range, (n_series, 2)),
+            "series_y_range": series_y_range,
+        },
+    )
+
+
+def _output_width(ax: Axes, style: Mapping[str, Any]) -> int:
+    """Figure width in output pixels at the savefig DPI."""
+    return int(ax.figure.get_figwidth() * savefig_options({}, style)["dpi"])
 
 
 def line(
-    x: ArrayLike,
-    y: ArrayLike,
+    x: ArrayLike | str,
+    y: ArrayLike | str,
     *,
     title: str | None = None,
     xlabel: str | None = None,
@@ -48,10 +147,33 @@ def line(
     color: str | None = None,
     linewidth: float = 2.0,
     alpha: float = 1.0,
+    decimate: str | None = None,
+    data: Any = None,
+    hue: ArrayLike | str | None = None,
     figsize: tuple[float, float] | None = None,
+    headless: bool = False,
     **kwargs: Any,
 ) -> PlotResult:
-    """Create a line plot."""
+    """Create a line plot.
+
+    ``x``, ``y`` and ``hue`` may be column names of ``data`` (a pandas
+    DataFrame, pyarrow Table or dict of arrays); numeric columns are
+    used without copying where possible. With ``hue``, each group gets
+    its own line in the next color of the cycle, and
+    ``metadata["group_counts"]`` holds the points per group.
+
+    ``decimate`` ("minmax", "lttb" or "auto") reduces very large series to
+    what the output width can show at the savefig DPI while preserving
+    peaks; ``metadata["n_points"]`` keeps the input size and
+    ``metadata["n_rendered"]`` reports how many points were drawn.
+
+    A 2D ``y`` plots one series per column, sharing a 1D ``x`` or taking
+    a per-series ``x`` of the same shape. All series are drawn as a
+    single LineCollection, colored from the active color cycle unless
+    ``color`` is given, and decimated individually when requested.
+    ``metadata["series_x_range"]`` and ``metadata["series_y_range"]``
+    hold one (min, max) row per series.
+    """
     return plot_template(
         _draw_line,
         x=x,
@@ -60,8 +182,13 @@ def line(
         xlabel=xlabel,
         ylabel=ylabel,
         figsize=figsize,
+        headless=headless,
+        data=data,
+        hue=hue,
+        allow_2d=True,
         color=color,
         linewidth=linewidth,
         alpha=alpha,
+        decimate=decimate,
         **kwargs,
     )
@@ -0,0 +1,243 @@
+# primitives/live.py
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from matplotlib.lines import Line2D
+from numpy.typing import ArrayLike
+
+from .result import PlotResult
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO whose window is always a contiguous view.
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the
+    current window can be handed to matplotlib without copying.
+    """
+
+    def __init__(self, capacity: int, dtype: Any = np.float64) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._data = np.empty(2 * capacity, dtype=dtype)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def view(self) -> np.ndarray:
+        """Current window, oldest first (a view, not a copy)."""
+        return self._data[self._start : self._start + self._size]
+
+    def extend(self, values: ArrayLike) -> np.ndarray:
+        """Append values, returning the ones evicted from the window."""
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        cap = self._capacity
+        # Values that would be overwritten within this same call never land
+        dropped = max(0, len(values) - cap)
+        overflow = max(0, self._size + len(values) - dropped - cap)
+        evicted = np.concatenate([self.view[:overflow], values[:dropped]])
+        values = values[dropped:]
+
+        pos = (self._start + self._size + np.arange(len(values))) % cap
+        self._data[pos] = values
+        self._data[pos + cap] = values
+
+        self._start = (self._start + overflow) % cap
+        self._size = min(cap, self._size + len(values))
+        return evicted
+
+
+# Limits are recomputed once the view is this many times wider (or
+# taller) than the current window needs, e.g. after an outlier left it
+LOOSE_VIEW_FACTOR = 2.0
+
+
+def _buffer_dtype(dtype: np.dtype) -> np.dtype:
+    """Datetimes keep their dtype; numbers widen to at least float64."""
+    if dtype.kind in "mM":
+        return dtype
+    return np.result_type(dtype, np.float64)
+
+
+class _RunningRange:
+    """Min/max of a sliding window, rescanned only when an extreme leaves.
+
+    NaN and NaT are skipped; bounds keep the window's dtype.
+    """
+
+    def __init__(self) -> None:
+        self.lo: Any = None
+        self.hi: Any = None
+
+    def update(self, added: np.ndarray, evicted: np.ndarray, window: np.ndarray):
+        if self.lo is None or (
+            len(evicted)
+            and (
+                np.fmin.reduce(evicted) <= self.lo or np.fmax.reduce(evicted) >= self.hi
+            )
+        ):
+            if len(window):
+                self.lo = np.fmin.reduce(window)
+                self.hi = np.fmax.reduce(window)
+        elif len(added):
+            self.lo = np.fmin(self.lo, np.fmin.reduce(added))
+            self.hi = np.fmax(self.hi, np.fmax.reduce(added))
+
+
+def _padded(lo: float, hi: float, margin: float) -> tuple[float, float]:
+    span = hi - lo or 1.0
+    return lo - margin * span, hi + margin * span
+
+
+class LiveLine:
+    """Append samples to a ``line()`` result and redraw it in place.
+
+    Data lives in ring buffers of ``max_window`` samples and is pushed to
+    the existing ``Line2D``. While the data stays inside the current view
+    limits, only the line is redrawn over a cached background (blitting);
+    limits and the full figure are recomputed from the window when data
+    leaves them, or when the window needs much less room than the view
+    (``LOOSE_VIEW_FACTOR``), so limits also shrink as old samples are
+    evicted. x may be numeric or ``datetime64``.
+
+    Args:
+        result: Result of :func:`pureplot.line`.
+        max_window: Maximum number of samples kept on screen.
+        headroom: Fraction of the x span reserved past the newest sample
+            when limits are recomputed, so growing series do not force a
+            full redraw on every append.
+    """
+
+    def __init__(
+        self, result: PlotResult, max_window: int, *, headroom: float = 0.1
+    ) -> None:
+        line = result.handles[0] if result.handles else None
+        if not isinstance(line, Line2D):
+            raise TypeError("LiveLine requires a result produced by line()")
+
+        self._result = result
+        self._line = line
+        self._headroom = headroom
+        self._canvas = result.fig.canvas
+        self._background = None
+
+        x0 = np.asarray(line.get_xdata())
+        y0 = np.asarray(line.get_ydata())
+        self._x = RingBuffer(max_window, dtype=_buffer_dtype(x0.dtype))
+        self._y = RingBuffer(max_window, dtype=_buffer_dtype(y0.dtype))
+        self._x_range = _RunningRange()
+        self._y_range = _RunningRange()
+        self._n_appended = 0
+        self._push(x0, y0)
+        self._redraw_full()
+
+    @property
+    def result(self) -> PlotResult:
+        return self._result
+
+    def append(self, x: ArrayLike, y: ArrayLike) -> dict[str, Any]:
+        """Append samples and update the figure.
+
+        Args:
+            x: New x values.
+            y: New y values (same length as ``x``).
+
+        Returns:
+            Metadata for the current window; ``redrawn`` reports whether
+            limits changed and the whole figure was redrawn.
+        """
+        x_new = np.atleast_1d(np.asarray(x))
+        y_new = np.atleast_1d(np.asarray(y))
+        if x_new.shape != y_new.shape:
+            raise ValueError(
+                f"x and y must have same shape: {x_new.shape} != {y_new.shape}"
+            )
+
+        self._n_appended += len(x_new)
+        self._push(x_new, y_new)
+
+        if self._view_fits():
+            self._blit()
+            redrawn = False
+        else:
+            self._redraw_full()
+            redrawn = True
+
+        return {**self.metadata, "redrawn": redrawn}
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "n_points": len(self._x),
+            "n_appended": self._n_appended,
+            "x_range": (self._x_range.lo, self._x_range.hi),
+            "y_range": (self._y_range.lo, self._y_range.hi),
+        }
+
+    # ---- internals ----
+
+    def _push(self, x: np.ndarray, y: np.ndarray) -> None:
+        x_evicted = self._x.extend(x)
+        y_evicted = self._y.extend(y)
+        self._x_range.update(x[-len(self._x) :], x_evicted, self._x.view)
+        self._y_range.update(y[-len(self._y) :], y_evicted, self._y.view)
+        self._line.set_data(self._x.view, self._y.view)
+
+    def _data_bounds(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Window ranges in axis coordinates (dates become numbers)."""
+        ax = self._result.ax
+        return (
+            (
+                float(ax.xaxis.convert_units(self._x_range.lo)),
+                float(ax.xaxis.convert_units(self._x_range.hi)),
+            ),
+            (float(self._y_range.lo), float(self._y_range.hi)),
+        )
+
+    def _target_limits(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Limits fitted to the current window, with margins and headroom."""
+        margin_x, margin_y = self._result.ax.margins()
+        (x_lo, x_hi), (y_lo, y_hi) = self._data_bounds()
+        x_lo, x_hi = _padded(x_lo, x_hi, margin_x)
+        return (
+            (x_lo, x_hi + self._headroom * (x_hi - x_lo)),
+            _padded(y_lo, y_hi, margin_y),
+        )
+
+    def _view_fits(self) -> bool:
+        """Whether the window is inside the view and fills enough of it."""
+        ax = self._result.ax
+        views = (sorted(ax.get_xlim()), sorted(ax.get_ylim()))
+        for (lo, hi), (view_lo, view_hi), (target_lo, target_hi) in zip(
+            self._data_bounds(), views, self._target_limits()
+        ):
+            if not (view_lo <= lo and hi <= view_hi):
+                return False
+            if view_hi - view_lo > LOOSE_VIEW_FACTOR * (target_hi - target_lo):
+                return False
+        return True
+
+    def _redraw_full(self) -> None:
+        ax = self._result.ax
+        xlim, ylim = self._target_limits()
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+
+        # Render everything but the line once and keep it as background
+        self._line.set_visible(False)
+        self._canvas.draw()
+        self._background = self._canvas.copy_from_bbox(ax.bbox)
+        self._line.set_visible(True)
+        self._blit()
+
+    def _blit(self) -> None:
+        ax = self._result.ax
+        self._canvas.restore_region(self._background)
+        ax.draw_artist(self._line)
+        self._canvas.blit(ax.bbox)
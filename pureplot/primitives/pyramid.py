@@ -0,0 +1,226 @@
+# primitives/pyramid.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .density import CHUNK_SIZE
+from .utils import as_array
+
+POOL_MODES = ("mean", "max")
+
+Factors = tuple[int, int]  # (rows, columns) pooled into one cell
+
+
+@dataclass(frozen=True)
+class Pyramid:
+    """Multi-resolution pyramid of a 2D array.
+
+    Level 0 is the source array itself (possibly a memmap); each further
+    level pools blocks of the source into one cell. Build once with
+    :func:`build_pyramid` and pass to ``heatmap()`` to reuse it across
+    renders.
+
+    Attributes:
+        levels: Arrays from finest (the source) to coarsest.
+        factors: Pooling factors of each level relative to the source.
+        reduce: Pooling mode, "mean" or "max".
+    """
+
+    levels: tuple[np.ndarray, ...]
+    factors: tuple[Factors, ...]
+    reduce: str
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the source array."""
+        return self.levels[0].shape
+
+    def level_for(self, shape: tuple[int, int]) -> int:
+        """Index of the coarsest level that still covers ``shape`` pixels."""
+        best = 0
+        for index, level in enumerate(self.levels):
+            if all(
+                n >= target or n == full
+                for n, target, full in zip(level.shape, shape, self.shape)
+            ):
+                best = index
+        return best
+
+
+def validate_matrix(data: ArrayLike) -> np.ndarray:
+    """Validate and view 2D input as a numpy array without copying."""
+    arr, _ = as_array(data)
+    if arr.ndim != 2:
+        raise ValueError(f"heatmap data must be a 2D array, got {arr.ndim}D")
+    if arr.size == 0:
+        raise ValueError("heatmap data must not be empty")
+    return arr
+
+
+def check_reduce(reduce: str) -> str:
+    """Validate a pooling mode name."""
+    if reduce not in POOL_MODES:
+        raise ValueError(f"reduce must be one of {POOL_MODES}, got {reduce!r}")
+    return reduce
+
+
+def _pool_mean(
+    data: np.ndarray, factors: Factors, weights: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """NaN-aware block means and the number of source cells behind each.
+
+    ``weights`` gives the source cells behind each cell of ``data`` (for
+    an already pooled level), so means of means stay exact where edge
+    blocks are ragged.
+    """
+    fr, fc = factors
+    n_rows, n_cols = data.shape
+    shape = (-(-n_rows // fr), -(-n_cols // fc))
+    out = np.empty(shape, dtype=np.result_type(data.dtype, np.float32))
+    out_counts = np.empty(shape, dtype=np.int64)
+    col_starts = np.arange(0, n_cols, fc)
+    band_rows = max(1, CHUNK_SIZE // (fr * n_cols)) * fr
+
+    for start in range(0, n_rows, band_rows):
+        band = np.asarray(data[start : start + band_rows])
+        row_starts = np.arange(0, len(band), fr)
+        valid = ~np.isnan(band)
+        if weights is None:
+            counts = valid
+            values = np.where(valid, band, 0)
+        else:
+            counts = np.where(valid, weights[start : start + band_rows], 0)
+            values = np.where(valid, band * counts, 0)
+        sums = np.add.reduceat(values, row_starts, axis=0, dtype=np.float64)
+        sums = np.add.reduceat(sums, col_starts, axis=1)
+        counts = np.add.reduceat(counts, row_starts, axis=0, dtype=np.int64)
+        counts = np.add.reduceat(counts, col_starts, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pooled = sums / counts
+        rows = slice(start // fr, start // fr + len(pooled))
+        out[rows] = pooled
+        out_counts[rows] = counts
+
+    return out, out_counts
+
+
+def pool(data: np.ndarray, factors: Factors, reduce: str = "mean") -> np.ndarray:
+    """Pool blocks of ``factors`` cells into one, NaN-aware.
+
+    The source is read in bands of whole block rows, so a memory-mapped
+    array is streamed through once with bounded temporaries. Edge blocks
+    that do not fill a whole block are pooled over the cells they have.
+
+    Args:
+        data: 2D array.
+        factors: Block size as (rows, columns).
+        reduce: "mean" or "max".
+
+    Returns:
+        Pooled array; float32 input stays float32.
+    """
+    check_reduce(reduce)
+    fr, fc = factors
+    n_rows, n_cols = data.shape
+    if (fr, fc) == (1, 1):
+        return data
+    if reduce == "mean":
+        return _pool_mean(data, factors)[0]
+
+    out = np.empty((-(-n_rows // fr), -(-n_cols // fc)), dtype=data.dtype)
+    col_starts = np.arange(0, n_cols, fc)
+    band_rows = max(1, CHUNK_SIZE // (fr * n_cols)) * fr
+
+    for start in range(0, n_rows, band_rows):
+        band = np.asarray(data[start : start + band_rows])
+        row_starts = np.arange(0, len(band), fr)
+        # fmax skips NaNs; all-NaN blocks stay NaN
+        rows = np.fmax.reduceat(band, row_starts, axis=0)
+        pooled = np.fmax.reduceat(rows, col_starts, axis=1)
+        out[start // fr : start // fr + len(pooled)] = pooled
+
+    return out
+
+
+def _factor_for(n: int, target: int) -> int:
+    """Largest power of two that still leaves at least ``target`` cells."""
+    factor = 1
+    while -(-n // (2 * factor)) >= max(1, target):
+        factor *= 2
+    return factor
+
+
+def _first_factor(n: int, min_size: int, max_size: int) -> int:
+    if n <= min_size:
+        return 1
+    factor = 2
+    while -(-n // factor) > max_size:
+        factor *= 2
+    return factor
+
+
+def pool_to(
+    data: np.ndarray, shape: tuple[int, int], reduce: str = "mean"
+) -> tuple[np.ndarray, Factors]:
+    """Pool directly to the coarsest power-of-two level covering ``shape``.
+
+    Returns:
+        Tuple of (pooled array, factors used).
+    """
+    check_reduce(reduce)
+    factors = (
+        _factor_for(data.shape[0], shape[0]),
+        _factor_for(data.shape[1], shape[1]),
+    )
+    return pool(data, factors, reduce), factors
+
+
+def build_pyramid(
+    data: ArrayLike,
+    *,
+    reduce: str = "mean",
+    min_size: int = 64,
+    max_size: int = 4096,
+) -> Pyramid:
+    """Build a pooled resolution pyramid of a 2D array.
+
+    The first pooled level is computed from the source in one streaming
+    pass, at the smallest power-of-two factor that brings each axis down
+    to ``max_size``; further levels halve the previous one until every
+    axis is at most ``min_size``. Mean levels are weighted by the source
+    cells behind each cell, so they equal pooling the source directly.
+
+    Args:
+        data: 2D array-like; memmaps are read in place.
+        reduce: "mean" or "max" pooling.
+        min_size: Stop halving an axis once it is this small.
+        max_size: Largest axis length of the first pooled level.
+
+    Returns:
+        Pyramid whose level 0 is the source.
+    """
+    arr = validate_matrix(data)
+    check_reduce(reduce)
+
+    levels = [arr]
+    factors: list[Factors] = [(1, 1)]
+
+    step = tuple(_first_factor(n, min_size, max_size) for n in arr.shape)
+    current = arr
+    weights = None
+    total = (1, 1)
+    while step != (1, 1):
+        if reduce == "mean":
+            current, weights = _pool_mean(current, step, weights)
+        else:
+            current = pool(current, step, reduce)
+        total = (total[0] * step[0], total[1] * step[1])
+        levels.append(current)
+        factors.append(total)
+        step = tuple(2 if n > min_size else 1 for n in current.shape)
+
+    return Pyramid(tuple(levels), tuple(factors), reduce)
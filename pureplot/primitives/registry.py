@@ -0,0 +1,34 @@
+# primitives/registry.py
+
+from collections.abc import Callable
+
+from .heatmap import heatmap
+from .histogram import histogram
+from .line import line
+from .result import PlotResult
+from .scatter import scatter
+
+PRIMITIVES: dict[str, Callable[..., PlotResult]] = {
+    "line": line,
+    "scatter": scatter,
+    "histogram": histogram,
+    "heatmap": heatmap,
+}
+
+# Data arguments each primitive takes positionally, in order
+PRIMITIVE_ARGS: dict[str, tuple[str, ...]] = {
+    "line": ("x", "y"),
+    "scatter": ("x", "y"),
+    "histogram": ("data",),
+    "heatmap": ("data",),
+}
+
+
+def get_primitive(name: str) -> Callable[..., PlotResult]:
+    """Look up a plotting primitive by name."""
+    try:
+        return PRIMITIVES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown primitive {name!r}; expected one of {sorted(PRIMITIVES)}"
+        ) from None
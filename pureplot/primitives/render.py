@@ -0,0 +1,30 @@
+# primitives/render.py
+
+from collections.abc import Callable
+from typing import Any
+
+from .result import PlotResult
+
+
+def render(
+    primitive: Callable[..., PlotResult],
+    *args: Any,
+    format: str = "png",
+    **kwargs: Any,
+) -> bytes:
+    """Render a primitive headlessly and release the figure immediately.
+
+    The figure never touches the pyplot figure manager, so this is the
+    entry point to use from long-running services.
+
+    Args:
+        primitive: Plotting primitive, e.g. ``line`` or ``scatter``.
+        *args: Positional arguments for the primitive.
+        format: Output format passed to ``Figure.savefig``.
+        **kwargs: Keyword arguments for the primitive.
+
+    Returns:
+        Encoded image bytes.
+    """
+    with primitive(*args, headless=True, **kwargs) as result:
+        return result.to_bytes(format)
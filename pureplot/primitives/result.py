@@ -1,24 +1,158 @@
 """Plot result dataclass for returning structured outputs."""
 
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from ..policy import Style, release_figure
+from .export import (
+    RASTERIZE_THRESHOLD,
+    Buffer,
+    BufferPool,
+    ExportResult,
+    encode,
+    encode_many,
+)
+
 
 @dataclass(frozen=True)
 class PlotResult:
     """Immutable result from a plotting function.
 
+    Can be used as a context manager; the figure is released on exit.
+
     Attributes:
         fig: Matplotlib Figure object
         ax: Matplotlib Axes object
         handles: Artist objects created by the plot (lines, scatter points, etc)
         metadata: Additional plot-specific information
+        style: Style the plot was rendered with; encoding uses its savefig
+            settings, so results can be encoded after leaving the
+            PlotContext they were created in (None: the active style)
     """
 
     fig: Figure
     ax: Axes
     handles: tuple[Any, ...]
     metadata: dict[str, Any]
+    style: Style | None = None
+
+    def to_bytes(
+        self,
+        format: str = "png",
+        *,
+        rasterize_threshold: int | None = RASTERIZE_THRESHOLD,
+        **savefig_kwargs: Any,
+    ) -> bytes:
+        """Encode the figure using the savefig policy.
+
+        Args:
+            format: Output format understood by matplotlib (png, svg, pdf...).
+            rasterize_threshold: See :meth:`export`.
+            **savefig_kwargs: Overrides passed through to ``Figure.savefig``.
+
+        Returns:
+            Encoded image bytes.
+        """
+        return encode(
+            self.fig,
+            self.handles,
+            format,
+            rasterize_threshold=rasterize_threshold,
+            style=self.style,
+            **savefig_kwargs,
+        ).data
+
+    def export(
+        self,
+        format: str = "png",
+        *,
+        buffer: Buffer | None = None,
+        compress_level: int | None = None,
+        rasterize_threshold: int | None = RASTERIZE_THRESHOLD,
+        **savefig_kwargs: Any,
+    ) -> ExportResult:
+        """Encode the figure and report its size and encode time.
+
+        For vector formats, handles with more than ``rasterize_threshold``
+        points are drawn as embedded images at the savefig DPI while axes,
+        text and grid stay vector, keeping files from large scatters and
+        lines compact. Handles are restored afterwards.
+
+        Args:
+            format: Output format understood by matplotlib (png, svg, pdf...).
+            buffer: Optional ``BytesIO`` or ``bytearray`` to write into
+                (cleared first) instead of allocating a new one.
+            compress_level: PNG zlib level 0-9; lower is faster and larger.
+            rasterize_threshold: Point count above which a handle is
+                rasterized; None keeps everything vector.
+            **savefig_kwargs: Overrides passed through to ``Figure.savefig``.
+
+        Returns:
+            ExportResult with the encoded data and statistics.
+        """
+        return encode(
+            self.fig,
+            self.handles,
+            format,
+            buffer=buffer,
+            compress_level=compress_level,
+            rasterize_threshold=rasterize_threshold,
+            style=self.style,
+            **savefig_kwargs,
+        )
+
+    def export_formats(
+        self,
+        formats: Sequence[str],
+        *,
+        buffers: Mapping[str, Buffer] | BufferPool | None = None,
+        compress_level: int | None = None,
+        rasterize_threshold: int | None = RASTERIZE_THRESHOLD,
+        **savefig_kwargs: Any,
+    ) -> dict[str, ExportResult]:
+        """Encode the figure in several formats from one render.
+
+        The figure is drawn once on its Agg canvas; that draw provides the
+        PNG pixels and the tight bounding box, which every other format
+        reuses instead of running its own layout pass. The PNG matches
+        :meth:`export` up to sub-pixel placement.
+
+        Args:
+            formats: Output formats, e.g. ``("png", "svg", "pdf")``.
+            buffers: Buffers to write into, keyed by format, or a
+                :class:`BufferPool` to take them from (return them with
+                ``pool.release(result.buffer)`` once the data is used).
+            compress_level: PNG zlib level 0-9; lower is faster and larger.
+            rasterize_threshold: See :meth:`export`.
+            **savefig_kwargs: Overrides passed through to ``Figure.savefig``.
+
+        Returns:
+            ExportResult per format.
+        """
+        return encode_many(
+            self.fig,
+            self.handles,
+            formats,
+            buffers=buffers,
+            compress_level=compress_level,
+            rasterize_threshold=rasterize_threshold,
+            style=self.style,
+            **savefig_kwargs,
+        )
+
+    def close(self) -> None:
+        """Release the figure; the result must not be used afterwards."""
+        release_figure(self.fig)
+
+    def __enter__(self) -> PlotResult:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
@@ -1,56 +1,234 @@
 # primitives/scatter.py
 
+import warnings
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.collections import PathCollection
+from matplotlib.colors import LogNorm
+from matplotlib.image import AxesImage
 from numpy.typing import ArrayLike
 
+from ..instrument import stage
+from ..policy import get_sequential_colormap
+from .density import (
+    DENSITY_THRESHOLD,
+    SCATTER_MODES,
+    Extent,
+    data_extent,
+    density_grid,
+    grid_shape_for,
+    iter_chunks,
+)
+from .export import savefig_options
 from .interface import DrawResult, plot_template
 from .result import PlotResult
 
+# Marker size (points squared) and opacity when not given
+DEFAULT_SIZE = 50
+DEFAULT_ALPHA = 0.7
+
+
+@dataclass
+class _Density:
+    """Density image whose binning waits for the final axes layout.
+
+    The grid matches the axes' size in output pixels, which is only known
+    once layout has run, so :meth:`draw` places an empty image over the
+    extent (setting the limits layout depends on) and :meth:`finish`
+    bins the points afterwards, consuming chunk iterators exactly once.
+    """
+
+    chunks: Iterable[tuple[ArrayLike, ArrayLike]] | None = None
+    extent: Extent | None = None
+    handle: AxesImage | None = None
+    streamed: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.streamed = self.chunks is not None
+
+    def draw(self, ax: Axes, x: np.ndarray, y: np.ndarray) -> DrawResult:
+        if self.chunks is None:
+            self.chunks = iter_chunks(x, y)
+            if self.extent is None:
+                self.extent = data_extent(x, y)
+
+        cmap = get_sequential_colormap()
+        self.handle = ax.imshow(
+            np.ma.masked_all((1, 1)),
+            extent=self.extent,
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            cmap=cmap,
+            norm=LogNorm(vmin=1, vmax=1),
+        )
+
+        # Drop the image's sticky edges so autoscaling applies the same
+        # margins as a regular scatter of the same points
+        self.handle.sticky_edges.x.clear()
+        self.handle.sticky_edges.y.clear()
+        ax.autoscale_view()
+
+        return self.handle, cmap.name, {"mode": "density"}
+
+    def finish(
+        self, ax: Axes, style: Mapping[str, Any], timings: dict[str, float]
+    ) -> dict[str, Any]:
+        if self.handle is None:
+            return {}
+        with stage("bin", timings):
+            shape = grid_shape_for(ax, savefig_options({}, style)["dpi"])
+            n_points = 0
+
+            def counted() -> Iterator[tuple[ArrayLike, ArrayLike]]:
+                nonlocal n_points
+                for cx, cy in self.chunks:
+                    n_points += np.size(cx)
+                    yield cx, cy
+
+            counts = density_grid(counted(), self.extent, shape)
+            self.handle.set_data(np.ma.masked_equal(counts, 0))
+            self.handle.set_norm(LogNorm(vmin=1, vmax=max(1, int(counts.max()))))
+
+        if not self.streamed:
+            return {"grid_shape": shape}
+        # Streamed points are only seen here; their range is the extent
+        x0, x1, y0, y1 = self.extent
+        return {
+            "n_points": n_points,
+            "x_range": (x0, x1),
+            "y_range": (y0, y1),
+            "grid_shape": shape,
+        }
+
 
 def _draw_scatter(
     ax: Axes,
     x: np.ndarray,
     y: np.ndarray,
-    style: dict[str, Any],
+    style: Mapping[str, Any],
     colors: list[str],
     *,
     color: str | None,
-    size: float | ArrayLike,
-    alpha: float,
+    size: float | ArrayLike | None,
+    alpha: float | None,
+    mode: str = "points",
+    density: _Density,
     **kwargs: Any,
 ) -> DrawResult:
-    """Draw scatter plot on axes."""
+    """Draw scatter plot on axes.
+
+    In density mode the image is drawn through ``density``; callers run
+    ``density.finish()`` once the axes are laid out.
+    """
+    if mode not in SCATTER_MODES:
+        raise ValueError(f"mode must be one of {SCATTER_MODES}, got {mode!r}")
+    if mode == "density" or (mode == "auto" and len(x) > DENSITY_THRESHOLD):
+        if ignored := _marker_options(color, size, alpha, kwargs):
+            warnings.warn(
+                f"density mode ignores {ignored}",
+                stacklevel=4,  # the caller of scatter()
+            )
+        return density.draw(ax, x, y)
+
     plot_color = color if color is not None else colors[0]
 
     handle: PathCollection = ax.scatter(
         x,
         y,
         c=plot_color,
-        s=size,
-        alpha=alpha,
+        s=DEFAULT_SIZE if size is None else size,
+        alpha=DEFAULT_ALPHA if alpha is None else alpha,
         **kwargs,
     )
 
-    return handle, plot_color
+    return handle, plot_color, {"mode": "points"}
+
+
+def _marker_options(
+    color: Any, size: Any, alpha: Any, kwargs: Mapping[str, Any]
+) -> str:
+    """Names of the given marker options, which density images cannot use."""
+    given = [
+        name
+        for name, value in (("color", color), ("size", size), ("alpha", alpha))
+        if value is not None
+    ]
+    return ", ".join([*given, *kwargs])
 
 
 def scatter(
-    x: ArrayLike,
-    y: ArrayLike,
+    x: ArrayLike | str | None = None,
+    y: ArrayLike | str | None = None,
     *,
     title: str | None = None,
     xlabel: str | None = None,
     ylabel: str | None = None,
     color: str | None = None,
-    size: float | ArrayLike = 50,
-    alpha: float = 0.7,
+    size: float | ArrayLike | None = None,
+    alpha: float | None = None,
+    mode: str = "auto",
+    data: Any = None,
+    hue: ArrayLike | str | None = None,
+    chunks: Iterable[tuple[ArrayLike, ArrayLike]] | None = None,
+    extent: Extent | None = None,
     figsize: tuple[float, float] | None = None,
+    headless: bool = False,
     **kwargs: Any,
 ) -> PlotResult:
+    """Create a scatter plot.
+
+    ``x``, ``y`` and ``hue`` may be column names of ``data`` (a pandas
+    DataFrame, pyarrow Table or dict of arrays); numeric columns are
+    used without copying where possible. With ``hue``, rows are grouped
+    in one vectorized pass and each group is drawn in the next color of
+    the cycle; ``metadata["group_counts"]`` holds the points per group.
+    Markers default to ``DEFAULT_SIZE`` and ``DEFAULT_ALPHA``.
+
+    ``mode="density"`` bins the points into a grid matching the output
+    pixels and draws it as one image with a Catppuccin colormap, keeping
+    the same axis ranges as the regular markers. ``mode="auto"`` does so
+    above ``DENSITY_THRESHOLD`` points, unless ``hue`` is given: a
+    density image cannot show group colors. Marker options (``color``,
+    ``size``, ``alpha``, extra keyword arguments) raise a ValueError in
+    density mode and are ignored with a warning when ``"auto"`` switches
+    to it.
+
+    Instead of ``x`` and ``y``, density plots take ``chunks``, an
+    iterable of (x, y) array pairs binned one at a time so memory is
+    bounded by the grid, together with the ``extent`` (xmin, xmax, ymin,
+    ymax) to bin over. ``extent`` also skips the extra pass over array
+    input; points outside it are not drawn.
+    """
+    density_only = mode == "density" or chunks is not None
+    if density_only:
+        if hue is not None:
+            raise ValueError("hue cannot be combined with density mode")
+        if ignored := _marker_options(color, size, alpha, kwargs):
+            raise ValueError(f"{ignored} cannot be used in density mode")
+    if chunks is not None:
+        if x is not None or y is not None:
+            raise ValueError("pass either x and y or chunks, not both")
+        if mode == "points":
+            raise ValueError("chunks can only be drawn in density mode")
+        if extent is None:
+            raise ValueError("extent is required with chunks")
+        x = y = np.empty(0)
+        mode = "density"
+    elif x is None or y is None:
+        raise ValueError("x and y are required unless chunks are given")
+    if extent is not None:
+        x0, x1, y0, y1 = extent
+        if not (x0 < x1 and y0 < y1):
+            raise ValueError(f"extent must be (xmin, xmax, ymin, ymax), got {extent}")
+    if hue is not None and mode == "auto":
+        mode = "points"
+
+    density = _Density(chunks, extent)
     return plot_template(
         _draw_scatter,
         x=x,
@@ -59,8 +237,14 @@ def scatter(
         xlabel=xlabel,
         ylabel=ylabel,
         figsize=figsize,
+        headless=headless,
+        data=data,
+        hue=hue,
+        finish_fn=density.finish,
         color=color,
         size=size,
         alpha=alpha,
+        mode=mode,
+        density=density,
         **kwargs,
     )
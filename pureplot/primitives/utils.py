@@ -1,19 +1,60 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from numpy.typing import ArrayLike
 
-from ..policy import create_figure, get_color_cycle, get_default_style
+from ..policy import Style, create_figure, get_style
 
+# Elements reduced per step of the range pass; small enough that the min
+# and max reductions of a chunk hit cache rather than memory
+RANGE_CHUNK_SIZE = 1 << 16
+
+
+def as_array(data: ArrayLike) -> tuple[np.ndarray, bool]:
+    """Convert input to an ndarray, avoiding a copy whenever possible.
+
+    ndarrays (including ``np.memmap`` and strided views), buffer-protocol
+    objects and objects exposing the array interface are viewed in place
+    with their dtype preserved, so float32 data stays float32.
+
+    Returns:
+        Tuple of (array, whether the data had to be copied).
+    """
+    try:
+        return np.asarray(data, copy=False), False
+    except ValueError:  # e.g. lists, which have no buffer to view
+        return np.asarray(data), True
+    except TypeError:  # numpy < 2 has no ``copy`` argument
+        arr = np.asarray(data)
+        return arr, arr.base is None and not isinstance(data, np.ndarray)
 
-def validate_xy(x: ArrayLike, y: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
-    """Validate and convert x/y inputs to numpy arrays."""
-    x_arr = np.asarray(x)
-    y_arr = np.asarray(y)
+
+def ingest_xy(
+    x: ArrayLike, y: ArrayLike, *, allow_2d: bool = False
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """Validate x/y inputs, converting them without copying where possible.
+
+    Args:
+        x: X data.
+        y: Y data.
+        allow_2d: Also accept 2D ``y`` with one series per column, with
+            either a shared 1D ``x`` or a per-series ``x`` of y's shape.
+
+    Returns:
+        Tuple of (x array, y array, whether either input was copied).
+    """
+    x_arr, x_copied = as_array(x)
+    y_arr, y_copied = as_array(y)
+
+    if allow_2d and y_arr.ndim == 2:
+        if x_arr.shape != y_arr.shape and x_arr.shape != y_arr.shape[:1]:
+            raise ValueError(
+                "x must be 1D with one value per row of y, or match y's shape: "
+                f"{x_arr.shape} vs {y_arr.shape}"
+            )
+        return x_arr, y_arr, x_copied or y_copied
 
     if x_arr.shape != y_arr.shape:
         raise ValueError(
@@ -23,19 +64,62 @@ def validate_xy(x: ArrayLike, y: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
     if x_arr.ndim != 1:
         raise ValueError("x and y must be 1D arrays")
 
+    return x_arr, y_arr, x_copied or y_copied
+
+
+def validate_xy(x: ArrayLike, y: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """Validate and convert x/y inputs to numpy arrays."""
+    x_arr, y_arr, _ = ingest_xy(x, y)
     return x_arr, y_arr
 
 
+def data_range(
+    arr: np.ndarray, chunk_size: int = RANGE_CHUNK_SIZE
+) -> tuple[float, float]:
+    """NaN-aware (min, max) of an array in a single chunked pass.
+
+    Each chunk is reduced for both bounds while it is still in cache, so
+    memory-mapped inputs are read from disk once. Arrays with more than
+    one dimension are flattened (a view when contiguous).
+
+    Returns:
+        Tuple of (min, max); both are NaN if every value is NaN. Datetime
+        and timedelta arrays give numpy scalars of their own dtype (NaT
+        if every value is NaT).
+    """
+    arr = arr.reshape(-1)
+    if len(arr) == 0:
+        raise ValueError("cannot compute the range of an empty array")
+
+    lo = hi = arr[0]
+    for start in range(0, len(arr), chunk_size):
+        chunk = arr[start : start + chunk_size]
+        # fmin/fmax skip NaNs without the warnings nanmin/nanmax emit
+        lo = np.fmin(lo, np.fmin.reduce(chunk))
+        hi = np.fmax(hi, np.fmax.reduce(chunk))
+    if arr.dtype.kind in "mM":
+        return lo, hi
+    return float(lo), float(hi)
+
+
 def make_figure_and_axes(
     *,
     figsize: tuple[float, float] | None,
-) -> tuple[Figure, Axes, dict[str, Any], list[str]]:
+    headless: bool = False,
+) -> tuple[Figure, Axes, Style, list[str]]:
     """Create figure and axes with policy-applied styling."""
-    style = get_default_style()
-    colors = list(get_color_cycle(12))
+    style = get_style()
+    colors = list(style.color_cycle)
 
-    fig = create_figure(figsize=figsize)
+    fig = create_figure(figsize=figsize, style=style, headless=headless)
     ax = fig.add_subplot(111)
+    style_frame(ax, style)
+
+    return fig, ax, style, colors
+
+
+def style_frame(ax: Axes, style: Style) -> None:
+    """Apply axes background and grid settings from an explicit style."""
     ax.set_facecolor(style["axes.facecolor"])
 
     if style["axes.grid"]:
@@ -47,5 +131,6 @@ def make_figure_and_axes(
             alpha=style["grid.alpha"],
         )
         ax.set_axisbelow(style["axes.axisbelow"])
-
-    return fig, ax, style, colors
+    else:
+        # Don't inherit a grid from global rcParams
+        ax.grid(False)
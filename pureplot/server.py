@@ -0,0 +1,261 @@
+"""Local render daemon serving warm renderers over a Unix domain socket."""
+
+from __future__ import annotations
+
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .client import (
+    MAX_PAYLOAD_BYTES,
+    decode_arrays,
+    default_socket_path,
+    payload_sizes,
+    read_header,
+    read_payload,
+    write_message,
+)
+from .fonts import register_fonts, warm_worker
+from .policy import apply_policy, get_style_registry
+from .primitives import line, render
+from .primitives.registry import PRIMITIVE_ARGS, get_primitive
+
+# Latencies kept for percentile statistics
+LATENCY_WINDOW = 4096
+
+
+@dataclass(frozen=True)
+class ServerStats:
+    """Request statistics of a :class:`RenderServer`.
+
+    ``requests`` counts every render request, ``errors`` those that
+    failed. Latency covers reading a successful request's payloads,
+    rendering and encoding; percentiles are over the most recent ones.
+    """
+
+    requests: int
+    errors: int
+    mean_latency: float
+    p50_latency: float
+    p95_latency: float
+    max_latency: float
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _SocketServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                header = read_header(self.rfile)
+            except ValueError as exc:
+                write_message(self.connection, {"ok": False, "error": str(exc)})
+                return
+            if header is None:
+                return
+            try:
+                reply, data = self.server.renderer.handle(header, self.rfile)
+            except ValueError as exc:
+                # The payloads cannot be skipped, so the stream is lost
+                write_message(self.connection, {"ok": False, "error": str(exc)})
+                return
+            write_message(self.connection, reply, [data] if data else [])
+
+
+class _SocketServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    block_on_close = False
+    renderer: RenderServer
+
+
+class RenderServer:
+    """Render daemon keeping warm renderers resident between requests.
+
+    Each connection is served by its own thread, which reads requests
+    (see :mod:`pureplot.client` for the protocol) and hands them to a
+    fixed pool of render threads. The pool threads warm the policy fonts
+    once and are reused, so every request after startup renders as fast
+    as a warm process would. Array payloads are read straight into
+    buffers that the primitives view without copying.
+
+    Args:
+        path: Socket path (default: ``default_socket_path()``).
+        workers: Render threads (default: up to 4).
+        options: Policy options applied to this process, as for
+            ``configure()``.
+        max_payload_bytes: Largest total payload of one request.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        workers: int | None = None,
+        options: Mapping[str, Any] | None = None,
+        max_payload_bytes: int = MAX_PAYLOAD_BYTES,
+    ) -> None:
+        self._path = Path(path) if path is not None else default_socket_path()
+        self._workers = workers or min(4, os.cpu_count() or 1)
+        self._max_payload_bytes = max_payload_bytes
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._requests = self._errors = 0
+        self._total_latency = self._max_latency = 0.0
+
+        register_fonts()
+        if options:
+            get_style_registry().set_options(options)
+            apply_policy(dict(options))
+        self._executor = ThreadPoolExecutor(
+            self._workers, thread_name_prefix="pureplot-serve", initializer=warm_worker
+        )
+        # Start every render thread and pay for the first figure now
+        warm = [
+            self._executor.submit(render, line, [0, 1], [0, 1], title="warm-up")
+            for _ in range(self._workers)
+        ]
+        for future in warm:
+            future.result()
+
+        self._remove_stale_socket()
+        # Create the socket owner-only (0600) rather than chmod it after
+        # binding, which would leave a window for other users to connect
+        umask = os.umask(0o177)
+        try:
+            self._server = _SocketServer(os.fspath(self._path), _Handler)
+        finally:
+            os.umask(umask)
+        self._server.renderer = self
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            mode = self._path.lstat().st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise ValueError(f"{self._path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(os.fspath(self._path))
+        except OSError:
+            self._path.unlink()
+        else:
+            raise RuntimeError(f"a render daemon is already listening on {self._path}")
+        finally:
+            probe.close()
+
+    def handle(self, header: Mapping[str, Any], rfile: Any) -> tuple[dict, bytes]:
+        """Answer one request whose header was read from ``rfile``.
+
+        Returns:
+            Tuple of (reply header, encoded image or empty bytes).
+
+        Raises:
+            ValueError: If the array descriptions are malformed, too large
+                or do not match their payload size; the payloads cannot be
+                located and the connection must be closed.
+        """
+        start = time.perf_counter()
+        if header.get("op", "render") == "stats":
+            return {"ok": True, "stats": asdict(self.stats())}, b""
+        with self._lock:
+            self._requests += 1
+        try:
+            sizes = payload_sizes(header, self._max_payload_bytes)
+        except ValueError:
+            with self._lock:
+                self._errors += 1
+            raise
+        try:
+            # Payloads are consumed even if the request turns out invalid,
+            # keeping the stream aligned for the next request
+            payloads = [read_payload(rfile, nbytes) for nbytes in sizes]
+            data, render_time = self._executor.submit(
+                self._render, header, payloads
+            ).result()
+        except Exception as exc:
+            with self._lock:
+                self._errors += 1
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}, b""
+
+        latency = time.perf_counter() - start
+        with self._lock:
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._latencies.append(latency)
+        reply = {
+            "ok": True,
+            "format": header.get("format", "png"),
+            "size": len(data),
+            "render_time": render_time,
+            "latency": latency,
+        }
+        return reply, data
+
+    @staticmethod
+    def _render(
+        header: Mapping[str, Any], payloads: list[bytearray]
+    ) -> tuple[bytes, float]:
+        start = time.perf_counter()
+        kwargs = dict(header.get("kwargs", {}))
+        kwargs.update(decode_arrays(header, payloads))
+        primitive = get_primitive(header["primitive"])
+        args = [
+            kwargs.pop(name, header.get(name))
+            for name in PRIMITIVE_ARGS[header["primitive"]]
+        ]
+        data = render(primitive, *args, format=header.get("format", "png"), **kwargs)
+        return data, time.perf_counter() - start
+
+    def stats(self) -> ServerStats:
+        """Request statistics so far."""
+        with self._lock:
+            latencies = np.asarray(self._latencies)
+            requests, errors = self._requests, self._errors
+            total, peak = self._total_latency, self._max_latency
+        succeeded = requests - errors
+        p50, p95 = np.percentile(latencies, [50, 95]) if len(latencies) else (0, 0)
+        return ServerStats(
+            requests=requests,
+            errors=errors,
+            mean_latency=total / succeeded if succeeded else 0.0,
+            p50_latency=float(p50),
+            p95_latency=float(p95),
+            max_latency=peak,
+        )
+
+    def serve_forever(self) -> None:
+        """Serve requests until :meth:`shutdown` is called."""
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever` (from another thread)."""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        """Close the socket and stop the render threads."""
+        self._server.server_close()
+        self._path.unlink(missing_ok=True)
+        self._executor.shutdown()
+
+    def __enter__(self) -> RenderServer:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
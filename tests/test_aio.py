@@ -0,0 +1,110 @@
+"""Tests for asyncio rendering entry points."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pureplot import aio, line, render, scatter
+from pureplot.context import PlotContext
+
+
+def test_async_line_matches_sync() -> None:
+    """Test async rendering produces the same bytes as render()."""
+    x = np.linspace(0, 1, 30)
+
+    data = asyncio.run(aio.line(x, np.sin(x), title="async"))
+
+    assert data == render(line, x, np.sin(x), title="async")
+
+
+def test_async_uses_caller_context() -> None:
+    """Test the caller's PlotContext applies in the worker thread."""
+    x = np.linspace(0, 1, 30)
+
+    async def main() -> bytes:
+        with PlotContext({"flavor": "mocha"}, rcparams=False):
+            return await aio.scatter(x, x)
+
+    with PlotContext({"flavor": "mocha"}):
+        expected = render(scatter, x, x)
+
+    assert asyncio.run(main()) == expected
+
+
+def _tracking_primitive(state: dict, delay: float = 0.05):
+    lock = threading.Lock()
+
+    def primitive(*args, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            time.sleep(delay)
+            return line(*args, **kwargs)
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return primitive
+
+
+def test_in_flight_renders_bounded() -> None:
+    """Test no more than max_in_flight renders run at once."""
+    state = {"active": 0, "peak": 0}
+    primitive = _tracking_primitive(state)
+
+    async def main() -> list[bytes]:
+        renderer = aio.AsyncRenderer(max_workers=4, max_in_flight=2)
+        try:
+            jobs = [renderer.render(primitive, [0, 1], [i, 0]) for i in range(8)]
+            return await asyncio.gather(*jobs)
+        finally:
+            renderer.close()
+
+    results = asyncio.run(main())
+
+    assert len(results) == 8
+    assert state["peak"] <= 2
+
+
+def test_cancellation_releases_slot() -> None:
+    """Test a cancelled render frees its slot once the thread finishes."""
+    state = {"active": 0, "peak": 0}
+    slow = _tracking_primitive(state, delay=0.2)
+
+    async def main() -> bytes:
+        renderer = aio.AsyncRenderer(max_workers=1, max_in_flight=1)
+        try:
+            task = asyncio.create_task(renderer.render(slow, [0, 1], [0, 1]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await asyncio.wait_for(renderer.line([0, 1], [1, 0]), 5)
+        finally:
+            renderer.close()
+
+    assert asyncio.run(main()).startswith(b"\x89PNG")
+
+
+def test_renderer_reused_across_event_loops() -> None:
+    """Test one renderer serves successive asyncio.run calls with backpressure."""
+    state = {"active": 0, "peak": 0}
+    primitive = _tracking_primitive(state, delay=0.01)
+    renderer = aio.AsyncRenderer(max_workers=2, max_in_flight=2)
+
+    async def main() -> list[bytes]:
+        jobs = [renderer.render(primitive, [0, 1], [i, 0]) for i in range(5)]
+        return await asyncio.gather(*jobs)
+
+    try:
+        first = asyncio.run(main())
+        second = asyncio.run(main())
+    finally:
+        renderer.close()
+
+    assert len(first) == len(second) == 5
+    assert state["peak"] <= 2
@@ -0,0 +1,98 @@
+"""Tests for blitted animation rendering."""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pureplot import animate, line, scatter
+from pureplot.primitives import AnimationResult
+
+
+def _wave_frames(x: np.ndarray, n: int):
+    for phase in np.linspace(0, np.pi, n):
+        yield x, np.sin(x + phase)
+
+
+def test_gif_frames() -> None:
+    """Test a line animation encodes every frame into one GIF."""
+    x = np.linspace(0, 2 * np.pi, 200)
+
+    with line(x, np.sin(x), headless=True) as result:
+        anim = animate(result, _wave_frames(x, 12), ylim=(-1.1, 1.1), workers=2)
+        last = result.handles[0].get_ydata()
+
+    assert isinstance(anim, AnimationResult)
+    assert anim.n_frames == 12
+    assert anim.data[:6] == b"GIF89a"
+    image = Image.open(io.BytesIO(anim.data))
+    assert image.n_frames == 12
+    assert image.size == anim.frame_size
+    np.testing.assert_allclose(last, np.sin(x + np.pi))
+    assert not result.handles[0].get_animated()
+
+
+def test_png_sequence_matches_full_redraw() -> None:
+    """Test a blitted frame matches the figure drawn from scratch."""
+    x = np.linspace(0, 1, 50)
+    frames = [(x, x), (x, 1 - x)]
+
+    with line(x, x, headless=True) as result:
+        anim = animate(result, frames, format="png")
+        expected = result.export("png").data
+
+    assert len(anim.data) == 2
+    assert all(png[:8] == b"\x89PNG\r\n\x1a\n" for png in anim.data)
+    last = np.asarray(Image.open(io.BytesIO(anim.data[-1])))
+    full = np.asarray(Image.open(io.BytesIO(expected)))
+    assert last.shape == full.shape
+    # Equal up to antialiasing of sub-pixel placement
+    assert np.abs(last.astype(int) - full).mean() < 2
+
+
+def test_png_directory_and_scatter_groups(tmp_path) -> None:
+    """Test hue groups take one pair per handle and frames go to files."""
+    rng = np.random.default_rng(0)
+    x, y = rng.random(40), rng.random(40)
+    hue = np.repeat(["a", "b"], 20)
+
+    with scatter(x, y, hue=hue, headless=True) as result:
+        frames = [[(x[:20] + t, y[:20]), (x[20:], y[20:] + t)] for t in (0, 0.1, 0.2)]
+        anim = animate(result, frames, format="png", path=tmp_path / "out")
+
+    assert anim.data is None
+    assert [p.name for p in anim.paths] == [f"frame_0000{i}.png" for i in range(3)]
+    assert all(p.stat().st_size > 0 for p in anim.paths)
+    offsets = result.handles[1].get_offsets()
+    np.testing.assert_allclose(offsets[:, 1], y[20:] + 0.2)
+
+
+def test_multi_series_line(tmp_path) -> None:
+    """Test 2D line input is animated through its LineCollection."""
+    x = np.arange(30.0)
+    y = np.column_stack([x, -x])
+
+    with line(x, y, headless=True) as result:
+        anim = animate(result, [(x, y), (x, y * 0.5)], path=tmp_path / "a.gif")
+
+    assert anim.paths == (tmp_path / "a.gif",)
+    assert Image.open(anim.paths[0]).n_frames == 2
+    np.testing.assert_allclose(result.handles[0].get_segments()[1][:, 1], -x * 0.5)
+
+
+def test_invalid_input() -> None:
+    """Test bad formats, frames and handles are rejected."""
+    x = np.arange(10.0)
+
+    with line(x, x, headless=True) as result:
+        with pytest.raises(ValueError, match="format"):
+            animate(result, [(x, x)], format="mp4")
+        with pytest.raises(ValueError, match="at least one frame"):
+            animate(result, [])
+        with pytest.raises(ValueError, match="same shape"):
+            animate(result, [(x, x[:5])])
+
+    with scatter(x, x, mode="density", headless=True) as result:
+        with pytest.raises(TypeError, match="handles"):
+            animate(result, [(x, x)])
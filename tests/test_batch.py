@@ -0,0 +1,68 @@
+"""Tests for parallel batch rendering."""
+
+import numpy as np
+import pytest
+
+from pureplot import line, render, scatter
+from pureplot.batch import BatchRenderer, PlotSpec, render_batch
+from pureplot.context import PlotContext
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    with BatchRenderer(workers=2) as pool:
+        yield pool
+
+
+def test_batch_matches_serial_render(renderer: BatchRenderer) -> None:
+    """Test batch output is byte-identical to rendering in-process."""
+    x = np.linspace(0, 1, 20)
+    specs = [
+        PlotSpec("line", x, np.sin(x), {"title": "sin"}),
+        PlotSpec("scatter", x, np.cos(x), {"size": 20}),
+        PlotSpec("scatter", x, np.cos(x), format="svg"),
+    ]
+
+    results = renderer.render(specs)
+
+    # Workers run with the policy applied to rcParams
+    with PlotContext({}, rcparams=True):
+        assert results[0] == render(line, x, np.sin(x), title="sin")
+        assert results[1] == render(scatter, x, np.cos(x), size=20)
+    assert b"<svg" in results[2]
+
+
+def test_batch_shared_memory_inputs(renderer: BatchRenderer) -> None:
+    """Test large arrays handed over through shared memory render correctly."""
+    x = np.arange(50_000, dtype=float)
+    y = np.sin(x / 1000.0)
+
+    [data] = renderer.render([PlotSpec("line", x, y, {"decimate": "minmax"})])
+
+    with PlotContext({}, rcparams=True):
+        assert data == render(line, x, y, decimate="minmax")
+
+
+def test_batch_streaming_order(renderer: BatchRenderer) -> None:
+    """Test the streaming iterator covers every spec exactly once."""
+    specs = [PlotSpec("line", [0, 1], [i, i + 1]) for i in range(6)]
+
+    ordered = [i for i, _ in renderer.iter_render(specs)]
+    unordered = sorted(i for i, _ in renderer.iter_render(specs, ordered=False))
+
+    assert ordered == list(range(6))
+    assert unordered == list(range(6))
+
+
+def test_batch_unknown_primitive(renderer: BatchRenderer) -> None:
+    """Test unknown primitive names surface as ValueError."""
+    with pytest.raises(ValueError, match="Unknown primitive"):
+        renderer.render([PlotSpec("pie", [1], [1])])
+
+
+def test_render_batch_convenience() -> None:
+    """Test the one-shot helper returns encoded images in order."""
+    results = render_batch([PlotSpec("line", [0, 1], [1, 0])], workers=1)
+
+    assert len(results) == 1
+    assert results[0].startswith(b"\x89PNG")
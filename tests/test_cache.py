@@ -0,0 +1,119 @@
+"""Tests for the content-addressed render cache."""
+
+import numpy as np
+import pytest
+
+from pureplot import line, render, scatter
+from pureplot.cache import RenderCache, render_key
+from pureplot.context import PlotContext
+
+
+def test_cache_hit_returns_same_bytes() -> None:
+    """Test a repeated request is served from memory."""
+    cache = RenderCache()
+    x = np.linspace(0, 1, 50)
+
+    first = cache.render(line, x, np.sin(x), title="t")
+    second = cache.render(line, x.copy(), np.sin(x), title="t")
+
+    assert first == second == render(line, x, np.sin(x), title="t")
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_key_covers_data_kwargs_and_primitive() -> None:
+    """Test any change in the request changes the key."""
+    x = np.arange(10.0)
+    base = render_key(line, x, x, "png", {})
+
+    assert render_key(line, x, x + 1e-9, "png", {}) != base
+    assert render_key(line, x.astype(np.float32), x, "png", {}) != base
+    assert render_key(line, x, x, "png", {"title": "a"}) != base
+    assert render_key(scatter, x, x, "png", {}) != base
+    assert render_key(line, x, x, "svg", {}) != base
+    assert render_key(line, x[::-1][::-1], x, "png", {}) == base
+
+
+def test_policy_change_invalidates() -> None:
+    """Test a PlotContext style change misses the cache."""
+    cache = RenderCache()
+    x = np.arange(5.0)
+
+    cache.render(line, x, x)
+    with PlotContext({"flavor": "mocha"}):
+        cache.render(line, x, x)
+    cache.render(line, x, x)
+
+    stats = cache.stats
+    assert stats.misses == 2
+    assert stats.hits == 1
+
+
+def test_memory_lru_eviction() -> None:
+    """Test the memory tier stays within its byte budget."""
+    cache = RenderCache(max_bytes=60_000)
+
+    for i in range(5):
+        cache.render(line, [0, 1], [0, i])
+
+    stats = cache.stats
+    assert stats.memory_bytes <= 60_000
+    assert stats.evictions > 0
+
+
+def test_disk_tier_persists(tmp_path) -> None:
+    """Test a fresh cache on the same directory hits on disk."""
+    x = np.arange(5.0)
+    data = RenderCache(directory=tmp_path).render(scatter, x, x)
+
+    cache = RenderCache(directory=tmp_path)
+    assert cache.render(scatter, x, x) == data
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.disk_bytes == len(data)
+
+
+def test_disk_tier_bounded(tmp_path) -> None:
+    """Test the disk tier evicts least recently used files."""
+    cache = RenderCache(max_bytes=0, directory=tmp_path, max_disk_bytes=80_000)
+
+    for i in range(6):
+        cache.render(line, [0, 1], [0, i])
+
+    assert cache.stats.disk_bytes <= 80_000
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*")) <= 80_000
+
+
+def test_string_arrays_hashed_by_value() -> None:
+    """Test equal string/object columns give equal keys, different ones not."""
+    x = np.arange(4.0)
+
+    def key(hue):
+        return render_key(scatter, x, x, "png", {"hue": hue})
+
+    def labels():
+        # Built at runtime so the two arrays hold distinct str objects
+        return [f"group-{i}" for i in (1, 2, 1, 3)]
+
+    assert key(np.array(labels(), dtype=object)) == key(
+        np.array(labels(), dtype=object)
+    )
+    assert key(np.array(labels())) == key(np.array(labels()))
+    assert key(np.array(labels(), dtype=object)) != key(
+        np.array(labels()[:3] + ["group-4"], dtype=object)
+    )
+    if hasattr(np.dtypes, "StringDType"):
+        strings = np.dtypes.StringDType()
+        assert key(np.array(labels(), dtype=strings)) == key(
+            np.array(labels(), dtype=strings)
+        )
+
+
+def test_unhashable_kwargs_rejected() -> None:
+    """Test values without a by-value encoding raise instead of using repr."""
+    x = np.arange(3.0)
+
+    with pytest.raises(TypeError, match="render cache key"):
+        render_key(line, x, x, "png", {"marker": object()})
+    assert render_key(line, x, x, "png", {"alpha": 0.5}) != render_key(
+        line, x, x, "png", {"alpha": "0.5"}
+    )
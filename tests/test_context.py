@@ -0,0 +1,103 @@
+"""Tests for PlotContext and policy snapshots."""
+
+import matplotlib as mpl
+import pytest
+from cycler import cycler
+
+from pureplot import get_style, line
+from pureplot.configure import configure
+from pureplot.context import PlotContext
+from pureplot.policy import (
+    PolicySnapshot,
+    apply_policy_diff,
+    get_style_registry,
+    restore_policy,
+)
+
+
+def test_context_restores_rcparams() -> None:
+    """Test rcParams are back to their previous values after exit."""
+    before = PolicySnapshot.capture()
+
+    with PlotContext({"font.size": 17, "flavor": "mocha"}, rcparams=True):
+        assert mpl.rcParams["font.size"] == 17
+
+    assert PolicySnapshot.capture() == before
+
+
+def test_snapshot_covers_only_changed_keys() -> None:
+    """Test a second identical application changes and captures nothing."""
+    with PlotContext({"lines.linewidth": 3.5}, rcparams=True) as ctx:
+        assert 0 < len(ctx._previous_policy.rcparams) < 60
+        again = apply_policy_diff({"lines.linewidth": 3.5})
+        assert again.rcparams == {}
+
+
+def test_nested_contexts() -> None:
+    """Test nested contexts unwind in order."""
+    before = PolicySnapshot.capture()
+
+    with PlotContext({"font.size": 13}, rcparams=True):
+        with PlotContext({"font.size": 15}, rcparams=True):
+            assert mpl.rcParams["font.size"] == 15
+        assert mpl.rcParams["font.size"] == 13
+
+    assert PolicySnapshot.capture() == before
+
+
+def test_partial_capture_and_restore() -> None:
+    """Test capturing selected keys restores just those keys."""
+    snapshot = PolicySnapshot.capture(["axes.linewidth"])
+    original = mpl.rcParams["axes.linewidth"]
+
+    mpl.rcParams["axes.linewidth"] = original + 1
+    restore_policy(snapshot)
+
+    assert list(snapshot.rcparams) == ["axes.linewidth"]
+    assert mpl.rcParams["axes.linewidth"] == original
+
+
+def test_context_applies_rcparams_by_default() -> None:
+    """Test overrides the primitives do not pass explicitly still apply."""
+    with PlotContext({"lines.markersize": 20}):
+        with line([0, 1], [0, 1], marker="o", headless=True) as result:
+            inside = result.handles[0].get_markersize()
+
+    with PlotContext({"lines.markersize": 20}, rcparams=False):
+        assert mpl.rcParams["lines.markersize"] != 20
+
+    assert inside == 20.0
+
+
+def test_rcparams_do_not_share_cached_values() -> None:
+    """Test mutating a list rcParam in place cannot corrupt later contexts."""
+    with PlotContext({"figure.figsize": (3, 2)}):
+        mpl.rcParams["figure.figsize"][0] = 99
+
+    with PlotContext({"figure.figsize": (3, 2)}):
+        assert mpl.rcParams["figure.figsize"] == [3, 2]
+
+
+def test_unhashable_override() -> None:
+    """Test a Cycler override compiles a style instead of raising."""
+    prop_cycle = cycler(color=["#ff0000", "#00ff00"])
+    with PlotContext({"axes.prop_cycle": prop_cycle}):
+        with line([0, 1, 2], [0, 1, 0], headless=True) as result:
+            assert result.metadata["n_points"] == 3
+
+
+def test_context_keeps_configured_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a context layers its overrides over configure(), not the defaults."""
+    monkeypatch.setattr("pureplot.configure._CONFIGURED", False)
+    before = PolicySnapshot.capture()
+    try:
+        configure(flavor="mocha", **{"font.size": 14})
+        with PlotContext({"lines.linewidth": 3}):
+            style = get_style()
+            assert mpl.rcParams["axes.facecolor"] == style["axes.facecolor"]
+            assert mpl.rcParams["axes.facecolor"] != "#eff1f5"
+            assert mpl.rcParams["font.size"] == style["font.size"] == 14
+            assert mpl.rcParams["lines.linewidth"] == 3
+    finally:
+        get_style_registry().set_options({})
+        restore_policy(before)
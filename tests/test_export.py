@@ -0,0 +1,169 @@
+"""Tests for export with automatic rasterization."""
+
+import io
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pureplot import line, scatter
+from pureplot.context import PlotContext
+from pureplot.primitives import BufferPool, ExportResult
+
+SVG = {"svg": "http://www.w3.org/2000/svg"}
+
+
+@pytest.mark.parametrize("fmt", ["svg", "pdf"])
+def test_heavy_scatter_rasterized(fmt: str) -> None:
+    """Test large scatters embed an image instead of one path per marker."""
+    rng = np.random.default_rng(0)
+    x, y = rng.random(20_000), rng.random(20_000)
+
+    with scatter(x, y, mode="points", headless=True) as result:
+        vector = result.export(fmt, rasterize_threshold=None)
+        mixed = result.export(fmt, rasterize_threshold=10_000)
+
+    assert isinstance(mixed, ExportResult)
+    assert mixed.rasterized == 1 and vector.rasterized == 0
+    assert mixed.size == len(mixed.data)
+    assert mixed.size < vector.size
+    assert mixed.encode_time > 0
+    assert not result.handles[0].get_rasterized()
+
+
+def _svg_tree(data: bytes) -> ET.Element:
+    builder = ET.TreeBuilder(insert_comments=True)
+    return ET.fromstring(data, parser=ET.XMLParser(target=builder))
+
+
+def test_text_stays_vector() -> None:
+    """Test only the heavy line is an image; the title stays vector glyphs."""
+    x = np.arange(200_000.0)
+
+    with line(x, np.sin(x), title="Signal", headless=True) as result:
+        root = _svg_tree(result.export("svg").data)
+
+    axes = root.find(".//svg:g[@id='axes_1']", SVG)
+    images = root.findall(".//svg:image", SVG)
+    assert len(images) == 1
+    assert images[0] in axes.iter()
+    # The image fits inside the axes background, which the title is above
+    background = axes.find("svg:g/svg:path", SVG).attrib["d"].split()
+    xs = [float(v) for v in background[1::3]]
+    ys = [float(v) for v in background[2::3]]
+    assert float(images[0].attrib["width"]) <= max(xs) - min(xs)
+    assert float(images[0].attrib["height"]) <= max(ys) - min(ys)
+
+    title = next(
+        group
+        for group in root.iterfind(".//svg:g", SVG)
+        if any(
+            node.tag is ET.Comment and node.text.strip() == "Signal" for node in group
+        )
+    )
+    assert not title.findall(".//svg:image", SVG)
+    glyphs = title.findall(".//svg:use", SVG) + title.findall(".//svg:path", SVG)
+    assert len(glyphs) >= len("Signal")
+    translate = title.find("svg:g", SVG).attrib["transform"]
+    title_y = float(translate.split("(")[1].split()[1].rstrip(")"))
+    assert title_y < min(ys)
+
+
+def test_small_and_raster_formats_untouched() -> None:
+    """Test light handles and PNG output skip rasterization."""
+    with scatter([1, 2, 3], [3, 1, 2], headless=True) as result:
+        assert result.export("svg").rasterized == 0
+        png = result.export("png", rasterize_threshold=0)
+
+    assert png.rasterized == 0
+    assert png.data.startswith(b"\x89PNG")
+
+
+def test_export_formats_one_render() -> None:
+    """Test several formats come from one call with valid headers."""
+    x = np.arange(500.0)
+
+    with line(x, np.sin(x), title="Signal", headless=True) as result:
+        outputs = result.export_formats(["png", "svg", "pdf"])
+        single = result.to_bytes("png")
+
+    assert set(outputs) == {"png", "svg", "pdf"}
+    assert bytes(outputs["png"].data[:8]) == b"\x89PNG\r\n\x1a\n"
+    assert b"<svg" in bytes(outputs["svg"].data)
+    assert bytes(outputs["pdf"].data[:5]) == b"%PDF-"
+    shared = Image.open(io.BytesIO(outputs["png"].data)).size
+    assert shared == Image.open(io.BytesIO(single)).size
+
+
+def test_compress_level() -> None:
+    """Test lower PNG compression levels produce larger files."""
+    rng = np.random.default_rng(0)
+
+    with scatter(rng.random(2_000), rng.random(2_000), headless=True) as result:
+        fast = result.export("png", compress_level=0)
+        small = result.export("png", compress_level=9)
+        many = result.export_formats(["png"], compress_level=0)["png"]
+        with pytest.raises(ValueError, match="compress_level"):
+            result.export("png", compress_level=10)
+
+    assert fast.size > small.size
+    assert many.size > small.size
+
+
+@pytest.mark.parametrize("factory", [bytearray, io.BytesIO])
+def test_export_into_buffer(factory) -> None:
+    """Test output is written into a supplied buffer, which is reused."""
+    buffer = factory()
+    x = np.arange(100.0)
+
+    with line(x, x, headless=True) as result:
+        first = result.export("svg", buffer=buffer)
+        with pytest.raises(BufferError, match="release"):
+            result.export("svg", buffer=buffer)
+        first.release()
+        second = result.export_formats(["svg"], buffers={"svg": buffer})["svg"]
+
+    assert first.buffer is buffer and second.buffer is buffer
+    assert isinstance(second.data, memoryview)
+    assert (
+        second.size
+        == len(second.data)
+        == len(buffer.getbuffer() if isinstance(buffer, io.BytesIO) else buffer)
+    )
+    assert bytes(second.data).startswith(b"<?xml")
+    assert b"<svg" in bytes(second.data)
+
+
+def test_buffer_pool() -> None:
+    """Test pooled buffers are handed out again after release."""
+    pool = BufferPool(max_buffers=1)
+    x = np.arange(100.0)
+
+    with line(x, x, headless=True) as result:
+        outputs = result.export_formats(["png", "svg"], buffers=pool)
+
+    buffers = [output.buffer for output in outputs.values()]
+    assert all(isinstance(buffer, io.BytesIO) for buffer in buffers)
+    for output in outputs.values():
+        output.release()
+        pool.release(output.buffer)
+    assert pool.acquire() in buffers
+    assert pool.acquire() not in buffers
+
+
+@pytest.mark.parametrize("rcparams", [True, False])
+def test_encode_uses_render_style(rcparams: bool) -> None:
+    """Test a result encodes with its own style after leaving the context."""
+    with PlotContext({"flavor": "mocha"}, rcparams=rcparams):
+        result = scatter([1, 2], [1, 2], headless=True)
+        inside = result.to_bytes("png")
+        many_inside = bytes(result.export_formats(["png"])["png"].data)
+    outside = result.to_bytes("png")
+    many_outside = bytes(result.export_formats(["png"])["png"].data)
+    result.close()
+
+    corner = Image.open(io.BytesIO(outside)).convert("RGB").getpixel((0, 0))
+    assert corner == (30, 30, 46)  # mocha base
+    assert outside == inside
+    assert many_outside == many_inside
@@ -0,0 +1,100 @@
+"""Tests for font registration and warm-up."""
+
+import copy
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from matplotlib import font_manager
+
+from pureplot import fonts
+from pureplot.policy import get_style
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Isolated copy of matplotlib's font manager."""
+    fresh = copy.copy(font_manager.fontManager)
+    fresh.ttflist = list(fresh.ttflist)
+    fresh.afmlist = list(fresh.afmlist)
+    monkeypatch.setattr(font_manager, "fontManager", fresh)
+    return fresh
+
+
+@pytest.fixture
+def font_dir(tmp_path: Path) -> Path:
+    source = font_manager.findfont("DejaVu Sans")
+    (tmp_path / "fonts").mkdir()
+    shutil.copy(source, tmp_path / "fonts" / "Bundled.ttf")
+    return tmp_path / "fonts"
+
+
+def test_register_fonts_once(manager, font_dir: Path) -> None:
+    """Test fonts are registered by family and known files are skipped."""
+    n_fonts = len(manager.ttflist)
+
+    assert fonts.register_fonts([font_dir]) == ["DejaVu Sans"]
+    assert fonts.register_fonts([font_dir / "Bundled.ttf"]) == []
+    assert len(manager.ttflist) == n_fonts + 1
+    with pytest.raises(ValueError, match="does not exist"):
+        fonts.register_fonts([font_dir / "missing.ttf"])
+
+
+def test_register_fonts_from_env(manager, font_dir: Path, monkeypatch) -> None:
+    """Test the font path environment variable is the default source."""
+    monkeypatch.setenv(fonts.FONT_PATH_ENV, str(font_dir))
+
+    assert fonts.register_fonts() == ["DejaVu Sans"]
+
+
+def test_build_font_cache(manager, font_dir: Path, tmp_path: Path, monkeypatch):
+    """Test the persisted font list includes registered fonts."""
+    target = tmp_path / "cache" / "fontlist.json"
+    monkeypatch.setattr(fonts, "font_cache_path", lambda: target)
+
+    assert fonts.build_font_cache([font_dir]) == target
+    loaded = font_manager.json_load(target)
+    assert str((font_dir / "Bundled.ttf").resolve()) in {
+        entry.fname for entry in loaded.ttflist
+    }
+
+
+def test_warm_fonts_policy_sizes() -> None:
+    """Test every text size used by the primitives is warmed."""
+    style = get_style()
+    info = fonts.warm_fonts()
+
+    assert info.family == (style["font.family"],)
+    assert info.files and all(Path(f).exists() for f in info.files)
+    assert style["font.size"] + 2 in info.sizes
+    assert style["xtick.labelsize"] in info.sizes
+
+
+def test_warm_fonts_named_sizes_and_figure_dpi() -> None:
+    """Test named font sizes and a "figure" savefig DPI are resolved."""
+    style = {
+        **get_style(),
+        "font.size": 10.0,
+        "legend.fontsize": "small",
+        "xtick.labelsize": "large",
+        "savefig.dpi": "figure",
+    }
+
+    info = fonts.warm_fonts(style)
+
+    assert 10.0 * font_manager.font_scalings["small"] in info.sizes
+    assert 10.0 * font_manager.font_scalings["large"] in info.sizes
+
+
+def test_warm_worker_logs_failures(monkeypatch, caplog) -> None:
+    """Test a failed warm-up is logged instead of breaking the executor."""
+
+    def fail() -> None:
+        raise RuntimeError("no fonts")
+
+    monkeypatch.setattr(fonts, "warm_fonts", fail)
+    with ThreadPoolExecutor(1, initializer=fonts.warm_worker) as pool:
+        assert pool.submit(lambda: 42).result() == 42
+
+    assert "font warm-up failed" in caplog.text
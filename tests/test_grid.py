@@ -0,0 +1,78 @@
+"""Tests for subplot_grid."""
+
+import time
+
+import numpy as np
+import pytest
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+
+from pureplot import Panel, render, subplot_grid
+from pureplot.primitives import GridResult
+
+
+def _panels(n: int) -> list[Panel]:
+    x = np.linspace(0, 1, 50)
+    return [
+        Panel("line" if i % 2 else "scatter", x, np.sin(x * (i + 1)), title=f"p{i}")
+        for i in range(n)
+    ]
+
+
+def test_grid_draws_every_panel() -> None:
+    """Test panels are drawn with the line/scatter draw functions."""
+    result = subplot_grid(
+        _panels(5), title="Grid", xlabel="x", ylabel="y", headless=True
+    )
+
+    assert isinstance(result, GridResult)
+    assert result.metadata["grid_shape"] == (2, 3)
+    assert len(result.axes) == len(result.handles) == 5
+    assert isinstance(result.handles[0], PathCollection)
+    assert isinstance(result.handles[1], Line2D)
+    assert result.metadata["panels"][1]["n_points"] == 50
+    assert result.axes[2].get_title() == "p2"
+    # The unused sixth cell is hidden
+    assert sum(ax.get_visible() for ax in result.fig.axes) == 5
+    # The panel above the empty cell keeps its x tick labels
+    assert result.axes[2].xaxis.get_major_ticks()[0].label1.get_visible()
+    assert not result.axes[0].xaxis.get_major_ticks()[0].label1.get_visible()
+
+
+def test_grid_layout_within_figure() -> None:
+    """Test every panel and its tick labels stay inside the figure."""
+    result = subplot_grid(_panels(12), ncols=4, sharey=False, headless=True)
+
+    renderer = result.fig.canvas.get_renderer()
+    fig_box = result.fig.bbox
+    for ax in result.axes:
+        box = ax.get_tightbbox(renderer)
+        assert box.x0 >= fig_box.x0 - 1 and box.x1 <= fig_box.x1 + 1
+        assert box.y0 >= fig_box.y0 - 1 and box.y1 <= fig_box.y1 + 1
+    a, b = result.axes[0].get_position(), result.axes[1].get_position()
+    assert a.x1 < b.x0
+
+
+def test_grid_shares_axes() -> None:
+    """Test shared axes have identical limits."""
+    x = np.arange(10.0)
+    result = subplot_grid(
+        [Panel("line", x, x), Panel("line", x * 2, -x)], headless=True
+    )
+
+    assert result.axes[0].get_xlim() == result.axes[1].get_xlim()
+    assert result.axes[0].get_ylim() == result.axes[1].get_ylim()
+
+
+def test_grid_many_panels_renders() -> None:
+    """Test a 120-panel grid lays out and encodes."""
+    start = time.perf_counter()
+    data = render(subplot_grid, _panels(120), figsize=(16, 12))
+    assert data.startswith(b"\x89PNG")
+    assert time.perf_counter() - start < 60
+
+
+def test_grid_rejects_unknown_kind() -> None:
+    """Test unknown panel kinds raise ValueError."""
+    with pytest.raises(ValueError, match="kind"):
+        subplot_grid([Panel("bar", [1], [1])], headless=True)
@@ -0,0 +1,131 @@
+"""Tests for column access and hue grouping."""
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_hex
+
+from pureplot import get_style, line, scatter
+from pureplot.cache import render_key
+from pureplot.primitives.grouping import column, group_rows
+
+
+class _Column:
+    """Minimal column exposing the array protocol, like a pandas Series."""
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+
+    def __array__(self, dtype=None, copy=None):
+        return self._values if dtype is None else self._values.astype(dtype)
+
+
+class _Table:
+    """Minimal table indexable by column name, like a DataFrame."""
+
+    def __init__(self, **columns: np.ndarray) -> None:
+        self._columns = {k: _Column(v) for k, v in columns.items()}
+
+    def __getitem__(self, key: str) -> _Column:
+        return self._columns[key]
+
+
+def test_group_rows_single_pass() -> None:
+    """Test groups are sorted and keep row order within a group."""
+    keys = np.array(["b", "a", "b", "c", "a", "b"])
+
+    groups = group_rows(keys)
+
+    assert groups.labels.tolist() == ["a", "b", "c"]
+    assert groups.counts.tolist() == [2, 3, 1]
+    assert groups.indices(1).tolist() == [0, 2, 5]
+
+
+def test_group_rows_missing_keys() -> None:
+    """Test None and NaN next to strings form one trailing group."""
+    keys = np.array(["b", None, "a", float("nan"), "b"], dtype=object)
+
+    groups = group_rows(keys)
+
+    assert groups.labels.tolist() == ["a", "b", None]
+    assert groups.counts.tolist() == [1, 2, 2]
+    assert groups.indices(2).tolist() == [1, 3]
+
+    x = np.arange(5.0)
+    with scatter(x, x, hue=keys, headless=True) as result:
+        assert result.metadata["groups"] == ["a", "b", None]
+        assert len(result.handles) == 3
+
+
+def test_column_zero_copy() -> None:
+    """Test numeric table columns are viewed in place."""
+    x = np.arange(10.0)
+    table = _Table(x=x)
+
+    values, copied = column(table, "x")
+
+    assert not copied
+    assert np.shares_memory(values, x)
+    with pytest.raises(ValueError, match="missing"):
+        column({"x": x}, "missing")
+
+
+def test_scatter_hue_from_table() -> None:
+    """Test each group is drawn in the next cycle color."""
+    rng = np.random.default_rng(0)
+    n = 1000
+    table = _Table(
+        a=rng.random(n),
+        b=rng.random(n),
+        kind=rng.choice(np.array(["x", "y", "z"]), n),
+    )
+
+    result = scatter("a", "b", data=table, hue="kind", mode="points", headless=True)
+
+    counts = result.metadata["group_counts"]
+    assert result.metadata["groups"] == ["x", "y", "z"]
+    assert sum(counts) == n
+    assert [len(h.get_offsets()) for h in result.handles] == counts
+    cycle = [to_hex(c) for c in get_style().color_cycle[:3]]
+    assert result.metadata["group_colors"] == cycle
+    assert result.metadata["copied"] is False
+    legend = result.ax.get_legend()
+    assert [t.get_text() for t in legend.get_texts()] == ["x", "y", "z"]
+
+
+def test_line_hue_with_arrays() -> None:
+    """Test hue works with plain arrays and keeps row order per group."""
+    x = np.arange(6.0)
+    y = x * 2
+    hue = np.array([1, 0, 1, 0, 1, 0])
+
+    result = line(x, y, hue=hue, headless=True)
+
+    assert result.metadata["group_counts"] == [3, 3]
+    assert result.handles[0].get_xdata().tolist() == [1.0, 3.0, 5.0]
+    with pytest.raises(ValueError):
+        line(x, y, hue=hue, color="red", headless=True)
+    with pytest.raises(ValueError, match="hue"):
+        line(x, y, hue=hue[:3], headless=True)
+
+
+def test_render_key_uses_columns() -> None:
+    """Test cache keys depend on column contents, not the table object."""
+    x = np.arange(5.0)
+    key = render_key(scatter, "a", "b", "png", {"data": {"a": x, "b": x}})
+
+    assert key == render_key(scatter, x, x, "png", {})
+    assert key != render_key(scatter, "a", "b", "png", {"data": {"a": x, "b": -x}})
+
+
+def test_scatter_hue_density_and_list_kwargs() -> None:
+    """Test hue keeps markers and splits per-point lists with the rows."""
+    x = np.arange(4.0)
+    hue = ["a", "b", "a", "b"]
+
+    with pytest.raises(ValueError, match="hue cannot be combined"):
+        scatter(x, x, hue=hue, mode="density", headless=True)
+
+    result = scatter(x, x, hue=hue, size=[10, 20, 30, 40], headless=True)
+
+    assert {m["mode"] for m in result.metadata["group_metadata"]} == {"points"}
+    assert [h.get_sizes().tolist() for h in result.handles] == [[10, 30], [20, 40]]
@@ -0,0 +1,127 @@
+"""Tests for heatmap primitive and resolution pyramid."""
+
+import numpy as np
+import pytest
+
+from pureplot import PlotResult, heatmap
+from pureplot.context import PlotContext
+from pureplot.policy import get_sequential_colormap, get_style
+from pureplot.primitives import build_pyramid
+from pureplot.primitives.density import grid_shape_for
+from pureplot.primitives.pyramid import pool, pool_to
+
+
+def test_heatmap_small_matrix_drawn_as_is() -> None:
+    """Test matrices smaller than the output are not pooled."""
+    data = np.arange(12.0).reshape(3, 4)
+
+    result = heatmap(data, headless=True)
+
+    assert isinstance(result, PlotResult)
+    assert result.metadata["shape"] == (3, 4)
+    assert result.metadata["rendered_shape"] == (3, 4)
+    assert result.metadata["value_range"] == (0.0, 11.0)
+    assert result.handles[0].get_cmap() is get_sequential_colormap()
+
+
+def test_heatmap_pools_large_matrix_to_output_size() -> None:
+    """Test large matrices are pooled but still cover the output pixels."""
+    data = np.random.default_rng(0).random((4000, 3000), dtype=np.float32)
+
+    result = heatmap(data, figsize=(4, 3), headless=True)
+
+    rows, cols = result.metadata["rendered_shape"]
+    assert rows < 4000 and cols < 3000
+    assert result.handles[0].get_array().shape == (rows, cols)
+    assert result.handles[0].get_array().dtype == np.float32
+    target = grid_shape_for(result.ax, get_style()["savefig.dpi"])
+    assert rows >= target[0] and cols >= target[1]
+    assert result.metadata["x_range"] == (0.0, 3000.0)
+
+
+def test_heatmap_figure_dpi() -> None:
+    """Test pooling sizes to the figure DPI when savefig.dpi is "figure"."""
+    data = np.random.default_rng(0).random((4000, 3000))
+
+    with PlotContext({"savefig.dpi": "figure"}):
+        result = heatmap(data, figsize=(4, 3), headless=True)
+
+    target = grid_shape_for(result.ax, get_style()["figure.dpi"])
+    rows, cols = result.metadata["rendered_shape"]
+    assert target[0] <= rows < 4000 and target[1] <= cols < 3000
+
+
+@pytest.mark.parametrize("reduce", ["mean", "max"])
+def test_pool_matches_reference(reduce: str) -> None:
+    """Test NaN-aware pooling, including ragged edge blocks."""
+    data = np.arange(35.0).reshape(5, 7)
+    data[0, 0] = np.nan
+
+    pooled = pool(data, (2, 3), reduce)
+
+    expected = np.empty((3, 3))
+    for i in range(3):
+        for j in range(3):
+            block = data[2 * i : 2 * i + 2, 3 * j : 3 * j + 3]
+            expected[i, j] = np.nanmean(block) if reduce == "mean" else np.nanmax(block)
+    np.testing.assert_allclose(pooled, expected)
+
+
+def test_pyramid_levels_and_selection() -> None:
+    """Test levels shrink by powers of two and selection covers the target."""
+    data = np.random.default_rng(1).random((1000, 600))
+
+    pyramid = build_pyramid(data, reduce="max", min_size=64)
+
+    assert pyramid.levels[0] is data or np.shares_memory(pyramid.levels[0], data)
+    assert all(max(level.shape) >= 1 for level in pyramid.levels)
+    assert max(pyramid.levels[-1].shape) <= 64
+    index = pyramid.level_for((300, 200))
+    level = pyramid.levels[index]
+    assert level.shape[0] >= 300 and level.shape[1] >= 200
+    assert pyramid.levels[index + 1].shape[0] < 300 or (
+        pyramid.levels[index + 1].shape[1] < 200
+    )
+    assert np.nanmax(pyramid.levels[-1]) == data.max()
+
+
+def test_pyramid_mean_levels_exact_on_ragged_edges() -> None:
+    """Test every mean level equals pooling the source directly."""
+    data = np.random.default_rng(2).random((301, 203))
+    data[::7, ::5] = np.nan
+
+    pyramid = build_pyramid(data, min_size=8, max_size=64)
+
+    assert len(pyramid.levels) > 2
+    for level, factors in zip(pyramid.levels[1:], pyramid.factors[1:]):
+        np.testing.assert_allclose(level, pool(data, factors), rtol=1e-6)
+
+
+def test_reduce_validated_up_front() -> None:
+    """Test unknown pooling modes fail even when nothing is pooled."""
+    data = np.ones((3, 3))
+
+    with pytest.raises(ValueError, match="reduce"):
+        pool_to(data, (10, 10), "avg")
+    with pytest.raises(ValueError, match="reduce"):
+        heatmap(build_pyramid(data), reduce="avg", headless=True)
+
+
+def test_heatmap_from_pyramid_and_memmap(tmp_path) -> None:
+    """Test a memmapped matrix renders via a reusable pyramid."""
+    mm = np.memmap(tmp_path / "m.dat", dtype=np.float32, mode="w+", shape=(2048, 2048))
+    mm[:] = 1.0
+    pyramid = build_pyramid(mm)
+
+    first = heatmap(pyramid, figsize=(2, 2), headless=True)
+    second = heatmap(pyramid, figsize=(2, 2), headless=True)
+
+    assert first.metadata["rendered_shape"] == second.metadata["rendered_shape"]
+    assert first.metadata["rendered_shape"] != (2048, 2048)
+    assert first.metadata["reduce"] == "mean"
+
+
+def test_heatmap_rejects_1d() -> None:
+    """Test non-matrix input raises ValueError."""
+    with pytest.raises(ValueError, match="2D"):
+        heatmap(np.arange(5), headless=True)
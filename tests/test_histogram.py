@@ -0,0 +1,92 @@
+"""Tests for histogram primitive."""
+
+import numpy as np
+import pytest
+
+from pureplot import PlotResult, histogram
+from pureplot.instrument import instrument
+from pureplot.primitives import Histogram, compute_histogram, merge_histograms
+
+
+def test_histogram_basic() -> None:
+    """Test counts and edges are returned in metadata."""
+    data = np.random.default_rng(0).normal(size=10_000)
+
+    result = histogram(data, bins=30, headless=True)
+
+    expected, edges = np.histogram(data, bins=30)
+    assert isinstance(result, PlotResult)
+    np.testing.assert_array_equal(result.metadata["counts"], expected)
+    np.testing.assert_allclose(result.metadata["edges"], edges)
+    assert result.metadata["n_points"] == 10_000
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int64])
+def test_binning_matches_numpy(dtype) -> None:
+    """Test index arithmetic agrees with np.histogram, edges included."""
+    rng = np.random.default_rng(1)
+    data = (rng.uniform(-3, 7, size=50_000) * 10).astype(dtype)
+    data[:3] = [-30, 70, 0]
+
+    hist = compute_histogram(data, 17, range=(-30, 70))
+
+    expected, _ = np.histogram(data, bins=17, range=(-30, 70))
+    np.testing.assert_array_equal(hist.counts, expected)
+
+
+def test_streaming_chunks_and_nan() -> None:
+    """Test an iterator of chunks matches binning the whole array."""
+    data = np.random.default_rng(2).uniform(0, 1, size=10_000)
+    data[::100] = np.nan
+
+    streamed = compute_histogram(iter(np.array_split(data, 7)), 10, range=(0, 1))
+    whole = compute_histogram(data, 10, range=(0, 1))
+
+    np.testing.assert_array_equal(streamed.counts, whole.counts)
+    assert streamed.counts.sum() == 9_900
+    with pytest.raises(ValueError, match="range"):
+        compute_histogram(iter([data]), 10)
+
+
+def test_merge_partials() -> None:
+    """Test partial histograms from several workers merge into one."""
+    parts = [np.arange(100.0), np.arange(50.0, 150.0)]
+    partials = [compute_histogram(p, 15, range=(0, 150)) for p in parts]
+
+    result = histogram(partials, headless=True)
+
+    whole = compute_histogram(np.concatenate(parts), 15, range=(0, 150))
+    np.testing.assert_array_equal(result.metadata["counts"], whole.counts)
+    assert merge_histograms(partials).counts.sum() == 200
+
+    other = compute_histogram(parts[0], 5, range=(0, 150))
+    with pytest.raises(ValueError):
+        partials[0].merge(other)
+
+
+def test_histogram_accepts_single_partial() -> None:
+    """Test a precomputed histogram is drawn as-is."""
+    hist = Histogram(np.array([1, 3, 2]), np.array([0.0, 1.0, 2.0, 3.0]))
+
+    result = histogram(hist, headless=True)
+
+    assert result.metadata["y_range"] == (0.0, 3.0)
+    assert result.metadata["x_range"] == (0.0, 3.0)
+
+
+def test_list_of_arrays_is_chunked() -> None:
+    """Test a list of arrays is binned chunk by chunk, not as a 2D array."""
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(size=1000), rng.normal(size=1000), rng.normal(size=10)]
+
+    with instrument():
+        result = histogram(parts[:2], bins=20, headless=True)
+    ragged = compute_histogram(parts, 20)
+
+    whole = np.concatenate(parts[:2])
+    expected, edges = np.histogram(whole, bins=20)
+    np.testing.assert_array_equal(result.metadata["counts"], expected)
+    np.testing.assert_allclose(result.metadata["edges"], edges)
+    assert result.metadata["n_points"] == 2000
+    assert list(result.metadata["timings"])[:3] == ["bin", "validate", "figure"]
+    assert ragged.counts.sum() == 2010
@@ -0,0 +1,53 @@
+"""Tests for lazy package imports."""
+
+import json
+import subprocess
+import sys
+
+import pureplot
+
+HEAVY = ["catppuccin", "matplotlib", "matplotlib.pyplot", "numpy"]
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    """Test `import pureplot` defers matplotlib, numpy and catppuccin."""
+    out = _run(
+        "import sys, json, pureplot; "
+        f"print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+
+    assert json.loads(out) == []
+
+
+def test_import_time_bounded() -> None:
+    """Test the bare package import stays fast."""
+    out = _run(
+        "import time; t = time.perf_counter(); import pureplot; "
+        "print(time.perf_counter() - t)"
+    )
+
+    assert float(out) < 0.2
+
+
+def test_headless_render_skips_pyplot() -> None:
+    """Test headless rendering never imports pyplot."""
+    out = _run(
+        "import sys, pureplot; "
+        "pureplot.render(pureplot.line, [0, 1], [0, 1]); "
+        "print('matplotlib.pyplot' in sys.modules)"
+    )
+
+    assert out.strip() == "False"
+
+
+def test_public_api_resolves() -> None:
+    """Test every public name resolves lazily."""
+    for name in pureplot.__all__:
+        assert getattr(pureplot, name) is not None
+    assert set(pureplot.__all__) <= set(dir(pureplot))
@@ -0,0 +1,64 @@
+"""Tests for zero-copy input ingestion."""
+
+import array
+
+import numpy as np
+import pytest
+
+from pureplot import line, scatter
+from pureplot.primitives.utils import data_range, ingest_xy
+
+
+def test_memmap_is_viewed(tmp_path) -> None:
+    """Test memory-mapped inputs are not copied."""
+    path = tmp_path / "y.dat"
+    mm = np.memmap(path, dtype=np.float32, mode="w+", shape=(1000,))
+    mm[:] = np.arange(1000)
+
+    x_arr, y_arr, copied = ingest_xy(mm, mm)
+
+    assert not copied
+    assert np.shares_memory(y_arr, mm)
+    assert y_arr.dtype == np.float32
+
+
+def test_buffer_and_strided_views() -> None:
+    """Test buffer-protocol objects and strided views are not copied."""
+    buf = array.array("d", range(10))
+    base = np.arange(20.0)
+
+    x_arr, y_arr, copied = ingest_xy(buf, base[::2])
+
+    assert not copied
+    assert np.shares_memory(y_arr, base)
+    assert x_arr.dtype == np.float64
+
+
+def test_lists_report_copy() -> None:
+    """Test inputs without a buffer are flagged as copied."""
+    result = line([0, 1, 2], [2, 1, 0], headless=True)
+
+    assert result.metadata["copied"] is True
+    assert (
+        line(np.arange(3.0), np.arange(3.0), headless=True).metadata["copied"] is False
+    )
+
+
+def test_data_range_nan_aware_and_chunked() -> None:
+    """Test the chunked range pass skips NaNs."""
+    y = np.arange(1000, dtype=np.float32)
+    y[::7] = np.nan
+
+    assert data_range(y, chunk_size=64) == (1.0, 999.0)
+    assert np.isnan(data_range(np.full(5, np.nan))).all()
+    with pytest.raises(ValueError):
+        data_range(np.array([]))
+
+
+def test_metadata_range_ignores_nan() -> None:
+    """Test primitives report finite ranges for data with gaps."""
+    y = np.array([1.0, np.nan, 3.0, -2.0])
+
+    result = scatter(np.arange(4), y, mode="points", headless=True)
+
+    assert result.metadata["y_range"] == (-2.0, 3.0)
@@ -0,0 +1,54 @@
+"""Tests for lifecycle instrumentation."""
+
+from pureplot import line, scatter
+from pureplot.instrument import (
+    StageTiming,
+    add_stage_hook,
+    instrument,
+    remove_stage_hook,
+)
+
+STAGES = {"validate", "figure", "draw", "style", "layout", "metadata"}
+
+
+def test_no_timings_by_default() -> None:
+    """Test metadata is unchanged when instrumentation is off."""
+    result = line([1, 2, 3], [1, 2, 3], headless=True)
+
+    assert "timings" not in result.metadata
+
+
+def test_instrument_records_stages() -> None:
+    """Test every lifecycle stage plus encode is recorded."""
+    with instrument() as recorder:
+        result = scatter([1, 2, 3], [1, 2, 3], headless=True)
+        result.to_bytes()
+
+    assert set(result.metadata["timings"]) == STAGES
+    summary = recorder.summary()
+    assert set(summary) == STAGES | {"encode"}
+    assert all(agg["count"] == 1 for agg in summary.values())
+
+
+def test_instrument_aggregates_and_traces_memory() -> None:
+    """Test timings aggregate across calls and record peak allocation."""
+    with instrument(trace_memory=True) as recorder:
+        for _ in range(3):
+            line([1, 2, 3], [3, 2, 1], headless=True)
+
+    summary = recorder.summary()
+    assert summary["draw"]["count"] == 3
+    assert summary["draw"]["peak_bytes"] > 0
+    assert summary["draw"]["mean"] <= summary["draw"]["max"]
+
+
+def test_stage_hooks() -> None:
+    """Test hooks receive stage timings without a recorder."""
+    seen: list[StageTiming] = []
+    add_stage_hook(seen.append)
+    try:
+        line([1, 2], [1, 2], headless=True)
+    finally:
+        remove_stage_hook(seen.append)
+
+    assert {t.stage for t in seen} == STAGES
@@ -0,0 +1,58 @@
+"""Tests for layout caching."""
+
+import numpy as np
+
+from pureplot import line
+from pureplot.primitives.layout import clear_layout_cache, layout_cache_info
+
+
+def test_identical_charts_reuse_layout() -> None:
+    """Test a second identically-shaped chart hits the cache."""
+    clear_layout_cache()
+    x = np.arange(10)
+
+    first = line(x, x, title="T", xlabel="X", ylabel="Y", headless=True)
+    second = line(x, x + 1, title="T", xlabel="X", ylabel="Y", headless=True)
+
+    info = layout_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert np.allclose(first.ax.get_position().bounds, second.ax.get_position().bounds)
+
+
+def test_cached_layout_matches_computed() -> None:
+    """Test a reused layout equals what tight_layout would produce."""
+    x = np.arange(10)
+
+    clear_layout_cache()
+    line(x, x, ylabel="Y", headless=True)
+    cached = line(x, x, ylabel="Y", headless=True)
+
+    clear_layout_cache()
+    computed = line(x, x, ylabel="Y", headless=True)
+
+    assert np.allclose(
+        cached.ax.get_position().bounds, computed.ax.get_position().bounds
+    )
+
+
+def test_wider_tick_labels_recompute() -> None:
+    """Test wider tick labels invalidate the cached layout."""
+    clear_layout_cache()
+    x = np.arange(10)
+
+    line(x, x, ylabel="Y", headless=True)
+    line(x, x * 10_000, ylabel="Y", headless=True)
+
+    assert layout_cache_info().misses == 2
+
+
+def test_different_labels_miss() -> None:
+    """Test different label text gets its own layout."""
+    clear_layout_cache()
+    x = np.arange(10)
+
+    line(x, x, title="A", headless=True)
+    line(x, x, title="B", headless=True)
+
+    assert layout_cache_info().misses == 2
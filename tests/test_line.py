@@ -0,0 +1,135 @@
+"""Tests for line primitive."""
+
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_hex
+
+from pureplot import PlotResult, get_style, line
+from pureplot.context import PlotContext
+from pureplot.primitives.decimate import lttb_indices, minmax_indices
+
+
+def test_line_basic() -> None:
+    """Test basic line plot creation."""
+    x = np.arange(10)
+    y = x**2
+
+    result = line(x, y, headless=True)
+
+    assert isinstance(result, PlotResult)
+    assert result.metadata["n_points"] == 10
+    assert result.metadata["n_rendered"] == 10
+    assert result.metadata["decimated"] is None
+
+
+@pytest.mark.parametrize("mode", ["minmax", "lttb", "auto"])
+def test_line_decimate_reduces_points(mode: str) -> None:
+    """Test decimation draws fewer points but reports the input size."""
+    x = np.arange(200_000, dtype=float)
+    y = np.sin(x / 500.0)
+
+    result = line(x, y, decimate=mode, figsize=(4, 3), headless=True)
+
+    n_rendered = result.metadata["n_rendered"]
+    assert result.metadata["n_points"] == 200_000
+    assert n_rendered < 200_000
+    assert len(result.handles[0].get_xdata()) == n_rendered
+    assert result.metadata["y_range"] == (float(y.min()), float(y.max()))
+
+
+def test_line_decimate_figure_dpi() -> None:
+    """Test decimation sizes to the figure DPI when savefig.dpi is "figure"."""
+    x = np.arange(200_000, dtype=float)
+
+    with PlotContext({"savefig.dpi": "figure"}):
+        result = line(x, np.sin(x), decimate="minmax", headless=True)
+
+    assert result.metadata["n_rendered"] < 200_000
+
+
+def test_line_decimate_small_series_untouched() -> None:
+    """Test small series are drawn as-is."""
+    result = line([1, 2, 3], [3, 1, 2], decimate="minmax", headless=True)
+
+    assert result.metadata["n_rendered"] == 3
+    assert result.metadata["decimated"] is None
+
+
+def test_line_decimate_invalid_mode() -> None:
+    """Test unknown decimation modes raise ValueError."""
+    x = np.arange(100_000)
+
+    with pytest.raises(ValueError, match="decimate must be one of"):
+        line(x, x, decimate="median", headless=True)
+
+
+def test_minmax_preserves_peaks() -> None:
+    """Test min-max decimation keeps extreme samples and endpoints."""
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=100_003)
+    y[12_345] = 50.0
+    y[67_890] = -50.0
+
+    idx = minmax_indices(y, 100)
+
+    assert idx[0] == 0
+    assert idx[-1] == len(y) - 1
+    assert 12_345 in idx
+    assert 67_890 in idx
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_output_size() -> None:
+    """Test LTTB keeps exactly n_out sorted points including endpoints."""
+    x = np.linspace(0, 10, 10_000)
+    y = np.sin(x)
+
+    idx = lttb_indices(x, y, 500)
+
+    assert len(idx) == 500
+    assert idx[0] == 0
+    assert idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_line_multi_series_single_collection() -> None:
+    """Test 2D y draws every column in one LineCollection."""
+    x = np.linspace(0, 1, 50)
+    y = np.column_stack([np.sin(x * k) for k in range(1, 21)])
+
+    result = line(x, y, headless=True)
+
+    (handle,) = result.handles
+    assert isinstance(handle, LineCollection)
+    assert len(handle.get_segments()) == 20
+    assert result.metadata["n_series"] == 20
+    assert result.metadata["n_points"] == 50 * 20
+    cycle = list(get_style().color_cycle)
+    colors = [to_hex(c) for c in handle.get_colors()]
+    assert colors[: len(cycle)] == [to_hex(c) for c in cycle]
+    np.testing.assert_allclose(
+        result.metadata["series_y_range"], np.column_stack([y.min(0), y.max(0)])
+    )
+    assert result.metadata["series_x_range"].shape == (20, 2)
+
+
+def test_line_multi_series_per_series_x_and_decimation() -> None:
+    """Test per-series x and per-series decimation."""
+    x = np.arange(100_000.0)[:, None] + np.arange(3.0)
+    y = np.sin(x / 300.0)
+
+    result = line(x, y, decimate="minmax", figsize=(4, 3), headless=True)
+
+    segments = result.handles[0].get_segments()
+    assert len(segments) == 3
+    assert result.metadata["decimated"] == "minmax"
+    assert result.metadata["n_rendered"] == sum(len(s) for s in segments)
+    assert result.metadata["n_rendered"] < 300_000
+    assert result.metadata["series_x_range"][2].tolist() == [2.0, 100_001.0]
+
+
+def test_line_multi_series_shape_mismatch() -> None:
+    """Test x must match y's rows or shape."""
+    with pytest.raises(ValueError):
+        line(np.arange(5), np.zeros((4, 3)), headless=True)
@@ -0,0 +1,94 @@
+"""Tests for live line updates."""
+
+import numpy as np
+import pytest
+
+from pureplot import LiveLine, line, scatter
+from pureplot.primitives.live import RingBuffer
+
+
+def test_ring_buffer_window_is_contiguous_view() -> None:
+    """Test ring buffer keeps the newest values in order without copying."""
+    buf = RingBuffer(4)
+    buf.extend([1, 2, 3])
+    evicted = buf.extend([4, 5, 6])
+
+    assert list(buf.view) == [3, 4, 5, 6]
+    assert list(evicted) == [1, 2]
+    assert buf.view.base is not None
+
+
+def test_ring_buffer_oversized_extend() -> None:
+    """Test extending by more than the capacity keeps only the tail."""
+    buf = RingBuffer(3)
+    buf.extend([1, 2])
+    evicted = buf.extend(np.arange(10, 15))
+
+    assert list(buf.view) == [12, 13, 14]
+    assert sorted(evicted) == [1, 2, 10, 11]
+
+
+def test_live_line_append_updates_in_place() -> None:
+    """Test appends update the existing Line2D and running metadata."""
+    x = np.arange(10, dtype=float)
+    result = line(x, x, headless=True)
+    live = LiveLine(result, max_window=15)
+
+    meta = live.append([10, 11], [4, 5])
+
+    assert result.handles[0].get_xdata()[-1] == 11
+    assert meta["n_points"] == 12
+    assert meta["x_range"] == (0.0, 11.0)
+    assert meta["y_range"] == (0.0, 9.0)
+
+
+def test_live_line_blits_inside_limits() -> None:
+    """Test appends inside current limits skip the full redraw."""
+    x = np.arange(100, dtype=float)
+    result = line(x, np.sin(x), headless=True)
+    live = LiveLine(result, max_window=1000, headroom=0.5)
+
+    assert live.append([100.0], [0.0])["redrawn"] is False
+    assert live.append([1000.0], [0.0])["redrawn"] is True
+
+
+def test_live_line_window_eviction_rescans_range() -> None:
+    """Test the y range shrinks once the extreme sample leaves the window."""
+    result = line([0, 1, 2], [100, 0, 0], headless=True)
+    live = LiveLine(result, max_window=3)
+
+    meta = live.append([3], [1])
+
+    assert meta["y_range"] == (0.0, 1.0)
+
+
+def test_live_line_rejects_scatter() -> None:
+    """Test LiveLine only accepts line() results."""
+    with pytest.raises(TypeError):
+        LiveLine(scatter([1, 2], [1, 2], headless=True), max_window=10)
+
+
+def test_live_line_datetime_x() -> None:
+    """Test datetime64 x keeps its dtype and drives date limits."""
+    t = np.arange("2024-01-01T00:00:00", "2024-01-01T00:00:10", dtype="datetime64[s]")
+    result = line(t, np.arange(10.0), headless=True)
+    live = LiveLine(result, max_window=10)
+
+    meta = live.append(np.datetime64("2024-01-01T00:00:20"), [3.0])
+
+    assert result.handles[0].get_xdata().dtype == t.dtype
+    assert meta["x_range"] == (t[1], np.datetime64("2024-01-01T00:00:20"))
+    x_hi = result.ax.xaxis.convert_units(np.datetime64("2024-01-01T00:00:20"))
+    assert result.ax.get_xlim()[1] > x_hi
+
+
+def test_live_line_limits_shrink_after_eviction() -> None:
+    """Test limits are refitted once an outlier leaves the window."""
+    result = line(np.arange(4.0), [1000.0, 0.0, 1.0, 0.0], headless=True)
+    live = LiveLine(result, max_window=4, headroom=1.0)
+    assert result.ax.get_ylim()[1] > 1000
+
+    meta = live.append([4.0], [1.0])
+
+    assert meta["redrawn"] is True
+    assert result.ax.get_ylim()[1] < 2
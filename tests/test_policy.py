@@ -1,6 +1,16 @@
 """Tests for policy module."""
 
-from pureplot.policy import get_catppuccin_colors, get_color_cycle, get_default_style
+import pytest
+
+from pureplot.policy import (
+    FLAVORS,
+    StyleRegistry,
+    compile_style,
+    get_catppuccin_colors,
+    get_color_cycle,
+    get_default_style,
+    get_style,
+)
 
 
 def test_get_catppuccin_colors() -> None:
@@ -58,3 +68,48 @@ def test_color_cycle_consistency() -> None:
     cycle2 = get_color_cycle(5)
 
     assert cycle1 == cycle2
+
+
+def test_get_style_cached() -> None:
+    """Test that compiled styles are reused across calls."""
+    assert get_style() is get_style()
+    assert get_style("mocha") is get_style("mocha")
+
+
+def test_style_hashable_and_immutable() -> None:
+    """Test compiled styles are hashable read-only mappings."""
+    style = get_style()
+
+    assert hash(style) == hash(compile_style(style.flavor))
+    assert style["figure.facecolor"] == get_default_style()["figure.facecolor"]
+    with pytest.raises(TypeError):
+        style["font.size"] = 20  # type: ignore[index]
+
+
+def test_flavors_compile_distinct_palettes() -> None:
+    """Test each Catppuccin flavor has its own palette and cycle."""
+    bases = {get_catppuccin_colors(flavor)["base"] for flavor in FLAVORS}
+
+    assert len(bases) == len(FLAVORS)
+    assert get_style("mocha").color_cycle[0] == get_color_cycle(1, "mocha")[0]
+
+
+def test_unknown_flavor() -> None:
+    """Test that unknown flavors raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown Catppuccin flavor"):
+        get_catppuccin_colors("espresso")
+
+
+def test_registry_invalidated_on_option_change() -> None:
+    """Test registry only recompiles when options change."""
+    registry = StyleRegistry()
+    first = registry.get()
+
+    registry.set_options({})
+    assert registry.get() is first
+
+    registry.set_options({"font.size": 14, "flavor": "frappe"})
+    style = registry.get()
+    assert style is not first
+    assert style.flavor == "frappe"
+    assert style["font.size"] == 14
@@ -0,0 +1,56 @@
+"""Tests for headless rendering and figure lifecycle."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from pureplot import line, render, scatter
+
+
+def test_headless_figure_not_registered() -> None:
+    """Test headless figures never reach the pyplot figure manager."""
+    before = plt.get_fignums()
+
+    result = scatter([1, 2, 3], [1, 2, 3], headless=True)
+
+    assert plt.get_fignums() == before
+    assert result.fig.canvas.figure is result.fig
+
+
+def test_close_releases_pyplot_figure() -> None:
+    """Test close() removes the figure from pyplot."""
+    result = line([1, 2, 3], [3, 2, 1])
+    assert result.fig.number in plt.get_fignums()
+
+    result.close()
+
+    assert result.fig.number not in plt.get_fignums()
+
+
+def test_context_manager_closes() -> None:
+    """Test PlotResult releases its figure when used as a context manager."""
+    with line([1, 2, 3], [3, 2, 1]) as result:
+        number = result.fig.number
+        assert number in plt.get_fignums()
+
+    assert number not in plt.get_fignums()
+
+
+def test_to_bytes_png() -> None:
+    """Test encoding a result to PNG bytes."""
+    with scatter([1, 2, 3], [1, 4, 9], headless=True) as result:
+        data = result.to_bytes("png")
+
+    assert data.startswith(b"\x89PNG")
+
+
+def test_render_and_release() -> None:
+    """Test render() returns encoded bytes without leaking figures."""
+    before = plt.get_fignums()
+    x = np.linspace(0, 1, 50)
+
+    png = render(line, x, np.sin(x), title="Sine")
+    svg = render(scatter, x, np.cos(x), format="svg")
+
+    assert png.startswith(b"\x89PNG")
+    assert b"<svg" in svg
+    assert plt.get_fignums() == before
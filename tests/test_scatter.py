@@ -1,11 +1,14 @@
 """Tests for scatter primitive."""
 
+import sys
+
 import numpy as np
 import pytest
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
-from pureplot import PlotResult, scatter
+from pureplot import PlotResult, get_style, scatter
+from pureplot.primitives.density import density_grid, grid_shape_for, iter_chunks
 
 
 def test_scatter_basic() -> None:
@@ -111,3 +114,83 @@ def test_plot_result_immutable() -> None:
 
     with pytest.raises(AttributeError):
         result.metadata = {}  # type: ignore
+
+
+def test_scatter_density_mode() -> None:
+    """Test density mode draws one image with matching axis ranges."""
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=20_000)
+    y = rng.normal(size=20_000)
+
+    points = scatter(x, y, mode="points", headless=True)
+    density = scatter(x, y, mode="density", headless=True)
+
+    assert density.metadata["mode"] == "density"
+    assert len(density.ax.images) == 1
+    assert len(density.ax.collections) == 0
+    assert np.allclose(density.ax.get_xlim(), points.ax.get_xlim())
+    assert np.allclose(density.ax.get_ylim(), points.ax.get_ylim())
+
+
+def test_density_chunks_match_arrays() -> None:
+    """Test chunked input bins like arrays, on the laid-out axes' grid."""
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=5000)
+    y = rng.normal(size=5000)
+    extent = (-4.0, 4.0, -4.0, 4.0)
+
+    dense = scatter(x, y, mode="density", extent=extent, title="t", headless=True)
+    chunked = scatter(
+        chunks=iter_chunks(x, y, chunk_size=700),
+        extent=extent,
+        title="t",
+        headless=True,
+    )
+
+    shape = grid_shape_for(chunked.ax, get_style()["savefig.dpi"])
+    assert chunked.metadata["grid_shape"] == dense.metadata["grid_shape"] == shape
+    assert chunked.metadata["n_points"] == 5000
+    assert chunked.metadata["x_range"] == (-4.0, 4.0)
+    counts = chunked.handles[0].get_array()
+    np.testing.assert_array_equal(counts, dense.handles[0].get_array())
+    assert counts.sum() == np.sum((np.abs(x) <= 4) & (np.abs(y) <= 4))
+
+
+def test_density_marker_options() -> None:
+    """Test marker options are rejected in density mode, warned about in auto."""
+    x = np.arange(20.0)
+
+    with pytest.raises(ValueError, match="size cannot be used"):
+        scatter(x, x, mode="density", size=10, headless=True)
+    with pytest.raises(ValueError, match="extent is required"):
+        scatter(chunks=[(x, x)], headless=True)
+    with pytest.raises(ValueError, match="not both"):
+        scatter(x, x, chunks=[(x, x)], extent=(0, 1, 0, 1), headless=True)
+
+    with pytest.MonkeyPatch.context() as mp:
+        # The primitives package re-exports the function under the same name
+        mp.setattr(sys.modules["pureplot.primitives.scatter"], "DENSITY_THRESHOLD", 10)
+        with pytest.warns(UserWarning, match="ignores color, alpha"):
+            result = scatter(x, x, color="red", alpha=0.5, headless=True)
+    assert result.metadata["mode"] == "density"
+
+
+def test_density_grid_counts_all_points() -> None:
+    """Test chunked binning counts every finite point exactly once."""
+    rng = np.random.default_rng(2)
+    x = rng.uniform(0, 1, size=10_001)
+    y = rng.uniform(0, 1, size=10_001)
+    x[0], y[0] = 1.0, 1.0  # upper edge lands in the last bin
+    x[1] = np.nan
+
+    counts = density_grid(iter_chunks(x, y, chunk_size=1000), (0, 1, 0, 1), (8, 16))
+
+    assert counts.shape == (8, 16)
+    assert counts.sum() == 10_000
+    assert counts[-1, -1] >= 1
+
+
+def test_scatter_invalid_mode() -> None:
+    """Test unknown scatter modes raise ValueError."""
+    with pytest.raises(ValueError, match="mode must be one of"):
+        scatter([1, 2], [1, 2], mode="hexbin", headless=True)
@@ -0,0 +1,176 @@
+"""Tests for the render daemon and its client."""
+
+import json
+import socket
+import stat
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from pureplot.__main__ import main
+from pureplot.client import (
+    RenderClient,
+    encode_request,
+    payload_sizes,
+    read_header,
+    write_message,
+)
+from pureplot.server import RenderServer
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Daemon serving on a temporary socket in a background thread."""
+    with RenderServer(tmp_path / "pureplot.sock", workers=1) as daemon:
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        yield daemon
+        daemon.shutdown()
+        thread.join()
+    assert not (tmp_path / "pureplot.sock").exists()
+
+
+def test_encode_request_binary_payloads() -> None:
+    """Test numeric arrays travel as raw bytes and the rest inline."""
+    x = np.arange(4, dtype=np.float32)
+    header, payloads = encode_request(
+        "scatter", x, [1, 2, 3, 4], hue=["a", "b", "a", "b"], title="T"
+    )
+
+    assert [a["name"] for a in header["arrays"]] == ["x", "y"]
+    assert header["arrays"][0] == {
+        "name": "x",
+        "dtype": "<f4",
+        "shape": [4],
+        "nbytes": 16,
+    }
+    assert bytes(payloads[0]) == x.tobytes()
+    assert header["kwargs"] == {"hue": ["a", "b", "a", "b"], "title": "T"}
+
+
+def test_render_over_one_connection(server) -> None:
+    """Test several requests, including an error, share one connection."""
+    x = np.linspace(0, 1, 1000)
+
+    with RenderClient(server.path) as client:
+        first = client.render("line", x, np.sin(x), title="Sine")
+        with pytest.raises(RuntimeError, match="Unknown primitive"):
+            client.render("pie", x, x)
+        second = client.render(
+            "scatter", [1, 2, 3, 4], [4, 3, 2, 1], hue=["a", "b", "a", "b"]
+        )
+        svg = client.render("line", x, x, format="svg")
+        stats = client.stats()
+
+    assert first.data.startswith(PNG) and second.data.startswith(PNG)
+    assert b"<svg" in svg.data
+    assert 0 < first.render_time <= first.latency
+    assert stats["requests"] == 4 and stats["errors"] == 1
+    assert 0 < stats["p50_latency"] <= stats["max_latency"]
+
+
+def test_render_data_primitives(server) -> None:
+    """Test histogram and heatmap take their array as ``data``."""
+    rng = np.random.default_rng(0)
+
+    with RenderClient(server.path) as client:
+        hist = client.render("histogram", data=rng.normal(size=1000), bins=20)
+        heat = client.render("heatmap", data=rng.random((30, 40)), title="Grid")
+
+    assert hist.data.startswith(PNG) and heat.data.startswith(PNG)
+    assert server.stats().errors == 0
+
+
+@pytest.mark.parametrize(
+    ("meta", "message"),
+    [
+        ({"name": "x", "dtype": "<f8", "shape": [4]}, "needs a dtype"),
+        ({"name": "x", "dtype": "<f8", "shape": [4], "nbytes": 8}, "expected 32"),
+        ({"name": "x", "dtype": "|O", "shape": [4], "nbytes": 32}, "unsupported"),
+        ({"name": "x", "dtype": "<f8", "shape": [64], "nbytes": 512}, "limit"),
+    ],
+)
+def test_payload_sizes_validated(meta, message) -> None:
+    """Test array descriptions are checked before any payload is read."""
+    with pytest.raises(ValueError, match=message):
+        payload_sizes({"arrays": [meta]}, max_bytes=256)
+
+
+def test_malformed_request_closes_connection(server) -> None:
+    """Test a request whose payloads cannot be located ends the stream."""
+    header = {
+        "primitive": "line",
+        "arrays": [{"name": "x", "dtype": "<f8", "shape": [2]}],
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server.path))
+        # No payload: the daemon may close before it could be written
+        write_message(sock, header)
+        with sock.makefile("rb") as reader:
+            reply = read_header(reader)
+            assert read_header(reader) is None
+
+    assert reply["ok"] is False and "nbytes" in reply["error"]
+    assert server.stats().errors == 1
+
+
+def test_socket_is_owner_only(server) -> None:
+    """Test the socket is bound without group or other permissions."""
+    assert stat.S_IMODE(server.path.stat().st_mode) == 0o600
+
+
+def test_second_daemon_refused(server) -> None:
+    """Test a live socket is not taken over by another daemon."""
+    with pytest.raises(RuntimeError, match="already listening"):
+        RenderServer(server.path, workers=1)
+
+
+def test_cli_render(server, tmp_path, capsys, monkeypatch) -> None:
+    """Test the CLI renders NDJSON specs with .npy payloads."""
+    monkeypatch.chdir(tmp_path)
+    np.save(tmp_path / "y.npy", np.cos(np.linspace(0, 6, 500)))
+    specs = tmp_path / "charts.ndjson"
+    specs.write_text(
+        "\n".join(
+            json.dumps(spec)
+            for spec in [
+                {"primitive": "line", "x": list(range(500)), "y": {"npy": "y.npy"}},
+                {
+                    "primitive": "scatter",
+                    "x": [1, 2],
+                    "y": [2, 1],
+                    "format": "svg",
+                    "output": str(tmp_path / "points.svg"),
+                },
+            ]
+        )
+    )
+
+    assert main(["render", str(specs), "--socket", str(server.path)]) == 0
+
+    assert (tmp_path / "charts-0.png").read_bytes().startswith(PNG)
+    assert (tmp_path / "points.svg").read_bytes().startswith(b"<?xml")
+    err = capsys.readouterr().err
+    assert "round trip" in err and "points.svg" in err
+
+
+def test_client_skips_matplotlib() -> None:
+    """Test the thin client does not import matplotlib."""
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pureplot.__main__, pureplot.client; "
+            "print('matplotlib' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert out.strip() == "False"
@@ -0,0 +1,60 @@
+"""Tests for concurrent rendering with context-local policy."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pureplot import get_style, line, render, scatter
+from pureplot.context import PlotContext
+from pureplot.policy import FLAVORS, get_catppuccin_colors
+
+
+def _render(flavor: str, kind: str) -> bytes:
+    x = np.linspace(0, 10, 200)
+    primitive = line if kind == "line" else scatter
+    with PlotContext({"flavor": flavor}, rcparams=False):
+        return render(primitive, x, np.sin(x), title=flavor, xlabel="x", ylabel="y")
+
+
+def test_context_overrides_are_context_local() -> None:
+    """Test PlotContext changes the style only inside the block."""
+    outer = get_style()
+
+    with PlotContext({"flavor": "mocha", "font.size": 15}, rcparams=False):
+        inner = get_style()
+        result = scatter([1, 2], [1, 2], headless=True)
+
+    assert get_style() is outer
+    assert inner.flavor == "mocha"
+    assert inner["font.size"] == 15
+    assert result.fig.get_facecolor() != outer["figure.facecolor"]
+    assert result.metadata["color_used"] == inner.color_cycle[0]
+
+
+def test_threads_see_their_own_policy() -> None:
+    """Test a context in one thread does not leak into another."""
+
+    def flavor_in_thread() -> str:
+        return get_style().flavor
+
+    outer = get_style().flavor
+
+    with PlotContext({"flavor": "frappe"}, rcparams=False):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(flavor_in_thread).result() == outer
+            assert get_style().flavor == "frappe"
+
+
+def test_concurrent_themed_renders_are_deterministic() -> None:
+    """Test renders from many threads match serial renders byte for byte."""
+    jobs = [(flavor, kind) for flavor in FLAVORS for kind in ("line", "scatter")]
+    expected = {job: _render(*job) for job in jobs}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [(job, pool.submit(_render, *job)) for job in jobs * 3]
+        for job, future in futures:
+            assert future.result() == expected[job]
+
+    # Each flavor really rendered with its own palette
+    assert len({expected[(f, "line")] for f in FLAVORS}) == len(FLAVORS)
+    assert len({get_catppuccin_colors(f)["base"] for f in FLAVORS}) == len(FLAVORS)